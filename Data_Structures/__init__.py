@@ -0,0 +1,6 @@
+"""
+Data Structures
+
+Each data structure lives in its own module (e.g. ``Data_Structures.stack``). Nothing is imported here so that
+importing one module never pulls in the others; use the ``dsa`` package for lazy top-level access.
+"""
@@ -0,0 +1,398 @@
+"""
+Async Queue and Deque (asyncio-native)
+
+This module implements awaitable versions of `Queue` and `Deque` from `Data_Structures.queues` for asyncio programs. Coroutines
+await `put()`/`get()` directly instead of wrapping the synchronous classes in executor calls, so moving an item costs no thread
+hop or context switch.
+
+Storage is the ring-buffer `Queue` (for `AsyncQueue`) or the `collections.deque`-backed `Deque` (for `AsyncDeque`). Waiting is
+done with one future per blocked coroutine, kept in FIFO waiter lists:
+- A coroutine that finds the buffer full (or empty) parks on its own future.
+- Each put wakes exactly one waiting getter and each get wakes exactly one waiting putter, so there is no thundering herd.
+- A waiter that is cancelled or times out passes its wake-up on to the next waiter, so no item or slot is ever stranded.
+
+A `maxsize` of 0 means unbounded. Calling `close()` stops further puts, lets consumers drain what is left, and then ends every
+`async for` loop over the queue.
+
+Errors follow the asyncio conventions: `put_nowait` raises `asyncio.QueueFull`, `get_nowait` raises `asyncio.QueueEmpty`, and
+`put`/`put_nowait` on a closed queue raise `RuntimeError`.
+
+Time Complexity:
+- `put` / `get` / `put_nowait` / `get_nowait`: O(1) amortized (excluding waiting)
+- `get_batch`: O(k), where k is the number of items returned
+- `size` / `is_empty` / `is_full`: O(1)
+
+Applications:
+asyncio ingestion services, fan-in of many producer coroutines into a few batching consumers, and rate matching between
+network readers and slower writers.
+"""
+
+import asyncio
+from collections import deque
+
+from Data_Structures.queues import Deque, Queue
+
+
+class _AsyncBuffer:
+    """
+    Waiter bookkeeping shared by AsyncQueue and AsyncDeque.
+
+    Subclasses provide `_buffer` (an object with `size()`), `_push(item)`, `_pop()` and `_pop_many(n)`.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        """
+        Initializes the waiter lists.
+
+        Args:
+            maxsize (int): The maximum number of items, or 0 for no limit.
+        """
+        self.maxsize = maxsize
+        self.closed = False
+        self._getters = deque()
+        self._putters = deque()
+
+    @staticmethod
+    def _wakeup_next(waiters: deque) -> None:
+        """
+        Wakes the first waiter that is still waiting.
+
+        Args:
+            waiters (deque): The futures of parked coroutines.
+
+        Returns:
+            None
+        """
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _park(self, waiters: deque, still_blocked) -> None:
+        """
+        Parks the current coroutine on a new future in `waiters` until it is woken.
+
+        If the wait is cancelled (including by a timeout) after a wake-up was already handed to this coroutine,
+        the wake-up is passed on to the next waiter.
+
+        Args:
+            waiters (deque): The waiter list to join.
+            still_blocked (callable): Returns True while the condition this coroutine waits for is unmet.
+
+        Returns:
+            None
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            if not still_blocked() and not waiter.cancelled():
+                self._wakeup_next(waiters)
+            raise
+
+    def size(self) -> int:
+        """
+        Returns the number of items in the queue.
+
+        Returns:
+            int: The number of items in the queue.
+        """
+        return self._buffer.size()
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the queue is empty.
+
+        Returns:
+            bool: True if the queue is empty, False otherwise.
+        """
+        return self._buffer.size() == 0
+
+    def is_full(self) -> bool:
+        """
+        Checks if the queue is full.
+
+        Returns:
+            bool: True if the queue is bounded and holds `maxsize` items, False otherwise.
+        """
+        return 0 < self.maxsize <= self._buffer.size()
+
+    def put_nowait(self, item: any) -> None:
+        """
+        Adds an item without waiting.
+
+        Args:
+            item (any): The item to be added.
+
+        Returns:
+            None
+
+        Raises:
+            asyncio.QueueFull: If the queue is full.
+            RuntimeError: If the queue is closed.
+        """
+        if self.closed:
+            raise RuntimeError("put on a closed queue")
+        if self.maxsize and self._buffer.size() >= self.maxsize:
+            raise asyncio.QueueFull
+        self._push(item)
+        if self._getters:
+            self._wakeup_next(self._getters)
+
+    async def put(self, item: any) -> None:
+        """
+        Adds an item, waiting for a free slot while the queue is full.
+
+        Args:
+            item (any): The item to be added.
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If the queue is closed.
+        """
+        while self.is_full() and not self.closed:
+            await self._park(self._putters, self.is_full)
+        self.put_nowait(item)
+
+    def get_nowait(self) -> any:
+        """
+        Removes an item without waiting.
+
+        Returns:
+            any: The removed item.
+
+        Raises:
+            asyncio.QueueEmpty: If the queue is empty.
+        """
+        if self._buffer.size() == 0:
+            raise asyncio.QueueEmpty
+        item = self._pop()
+        if self._putters:
+            self._wakeup_next(self._putters)
+        return item
+
+    async def get(self) -> any:
+        """
+        Removes an item, waiting while the queue is empty.
+
+        Returns:
+            any: The removed item.
+
+        Raises:
+            asyncio.QueueEmpty: If the queue is closed and empty.
+        """
+        while self.is_empty() and not self.closed:
+            await self._park(self._getters, self.is_empty)
+        return self.get_nowait()
+
+    async def get_batch(self, n: int, timeout: float = None) -> list:
+        """
+        Removes up to `n` items, waiting (up to `timeout`) only for the first one.
+
+        Args:
+            n (int): The maximum number of items to return.
+            timeout (float or None): Maximum seconds to wait for the first item, or None to wait forever.
+
+        Returns:
+            list: The removed items. Empty if the wait timed out or the queue is closed and empty.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while self.is_empty() and not self.closed:
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return []
+            try:
+                await asyncio.wait_for(self._park(self._getters, self.is_empty), remaining)
+            except asyncio.TimeoutError:
+                return []
+        items = self._pop_many(n)
+        for _ in range(min(len(items), len(self._putters))):
+            self._wakeup_next(self._putters)
+        if not self.is_empty():
+            self._wakeup_next(self._getters)  # leftovers: let the next consumer take them
+        return items
+
+    def close(self) -> None:
+        """
+        Closes the queue: further puts fail, and consumers stop once the remaining items are drained.
+
+        Returns:
+            None
+        """
+        self.closed = True
+        for waiters in (self._getters, self._putters):
+            while waiters:
+                self._wakeup_next(waiters)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> any:
+        """
+        Returns the next item, ending the iteration once the queue is closed and drained.
+
+        Returns:
+            any: The next item.
+        """
+        try:
+            return await self.get()
+        except asyncio.QueueEmpty:
+            raise StopAsyncIteration from None
+
+
+class AsyncQueue(_AsyncBuffer):
+    def __init__(self, maxsize: int = 0):
+        """
+        Initializes an empty FIFO queue backed by the ring-buffer `Queue`.
+
+        Args:
+            maxsize (int): The maximum number of items, or 0 for no limit.
+        """
+        super().__init__(maxsize)
+        self._buffer = Queue()
+        self._push = self._buffer.enqueue
+        self._pop = self._buffer.dequeue
+        self._pop_many = self._buffer.dequeue_many
+
+    def display(self) -> None:
+        """
+        Displays the items in the queue.
+
+        Returns:
+            None
+        """
+        self._buffer.display()
+
+
+class AsyncDeque(_AsyncBuffer):
+    def __init__(self, maxsize: int = 0):
+        """
+        Initializes an empty double-ended queue backed by `Deque`.
+
+        `put`/`get` use the right and left ends respectively (FIFO); `append_left`/`pop_right` reach the other ends.
+
+        Args:
+            maxsize (int): The maximum number of items, or 0 for no limit.
+        """
+        super().__init__(maxsize)
+        self._buffer = Deque()
+        self._push = self._buffer.append_right
+        self._pop = self._buffer.pop_left
+
+    def _pop_many(self, n: int) -> list:
+        """
+        Removes up to `n` items from the front of the deque.
+
+        Args:
+            n (int): The maximum number of items to remove.
+
+        Returns:
+            list: The removed items in FIFO order.
+        """
+        popleft = self._buffer.queue.popleft
+        return [popleft() for _ in range(min(n, self._buffer.size()))]
+
+    async def append_right(self, item: any) -> None:
+        """
+        Adds an item to the end of the deque, waiting while it is full.
+
+        Args:
+            item (any): The item to be added.
+
+        Returns:
+            None
+        """
+        await self.put(item)
+
+    async def append_left(self, item: any) -> None:
+        """
+        Adds an item to the front of the deque, waiting while it is full.
+
+        Args:
+            item (any): The item to be added.
+
+        Returns:
+            None
+        """
+        while self.is_full() and not self.closed:
+            await self._park(self._putters, self.is_full)
+        if self.closed:
+            raise RuntimeError("put on a closed queue")
+        if self.is_full():
+            raise asyncio.QueueFull
+        self._buffer.append_left(item)
+        self._wakeup_next(self._getters)
+
+    async def pop_left(self) -> any:
+        """
+        Removes the item from the front of the deque, waiting while it is empty.
+
+        Returns:
+            any: The removed item.
+        """
+        return await self.get()
+
+    async def pop_right(self) -> any:
+        """
+        Removes the item from the end of the deque, waiting while it is empty.
+
+        Returns:
+            any: The removed item.
+
+        Raises:
+            asyncio.QueueEmpty: If the deque is closed and empty.
+        """
+        while self.is_empty() and not self.closed:
+            await self._park(self._getters, self.is_empty)
+        if self.is_empty():
+            raise asyncio.QueueEmpty
+        item = self._buffer.pop_right()
+        self._wakeup_next(self._putters)
+        return item
+
+    def display(self) -> None:
+        """
+        Displays the items in the deque.
+
+        Returns:
+            None
+        """
+        self._buffer.display()
+
+
+if __name__ == "__main__":
+    async def demo():
+        q = AsyncQueue(maxsize=2)
+        print("AsyncQueue operations:")
+        await q.put(1)
+        await q.put(2)
+        producer = asyncio.create_task(q.put(3))  # waits: the queue is full
+        await asyncio.sleep(0)
+        print(q.size())  # Expected output: 2
+        print(await q.get())  # Expected output: 1
+        await producer
+        print(await q.get_batch(10, timeout=0.1))  # Expected output: [2, 3]
+        print(await q.get_batch(10, timeout=0.01))  # Expected output: []
+        await q.put(4)
+        q.close()
+        print([item async for item in q])  # Expected output: [4]
+
+        dq = AsyncDeque()
+        print("\nAsyncDeque operations:")
+        await dq.append_right(2)
+        await dq.append_left(1)
+        await dq.append_right(3)
+        print(await dq.pop_right())  # Expected output: 3
+        print(await dq.pop_left())  # Expected output: 1
+
+    asyncio.run(demo())
@@ -0,0 +1,1022 @@
+"""
+Adelson-Velsky and Landis Tree (AVL Tree) Implementation
+
+An AVL Tree (Adelson-Velsky and Landis Tree) is a self-balancing binary search tree.
+In an AVL Tree, the heights of the two child subtrees of any node differ by at most one,
+and this balance condition must be preserved after every insertion and deletion operation.
+
+AVL Tree Operations:
+1. **Insert**: Inserts a key into the AVL Tree while maintaining the AVL balance property.
+2. **Search**: Searches for a key in the AVL Tree and returns True if the key is found, otherwise False.
+3. **Delete**: Deletes a key from the AVL Tree and maintains the AVL balance property.
+4. **Inorder Traversal**: Returns a list of elements in the AVL Tree in ascending order.
+5. **Preorder Traversal**: Returns a list of elements in the AVL Tree following a preorder traversal (root, left, right).
+6. **Postorder Traversal**: Returns a list of elements in the AVL Tree following a postorder traversal (left, right, root).
+7. **Order Statistics**: Every node also stores the size of its subtree, kept up to date by `_insert`, `_delete` and
+   both rotations. A single root-to-leaf walk then answers:
+       - `rank(key)`: the number of keys smaller than `key`.
+       - `select(k)`: the key at 0-based position k; `kth_smallest(k)` is the same with k counted from 1.
+       - `count_range(lo, hi)`: the number of keys in [lo, hi].
+       - `len(tree)`: the number of keys, in O(1).
+8. **Ordered Map**: Each node also carries `data`, so the tree maps keys to values; inserting an existing key replaces
+   its data. The map API (`tree[key]`, lazy `range(lo, hi, reverse)`, `floor` / `ceiling` / `predecessor` /
+   `successor`, `pop_min` / `pop_max`) comes from `OrderedMapMixin` in `Data_Structures.ordered_map`.
+9. **Split / Join / Bulk Set Operations**: join-based algorithms that move whole subtrees instead of single keys.
+       - `split(key)`: cut the tree into the keys below and above `key`.
+       - `AVLTree.join(left, pivot, right)`: the inverse, for trees with left < pivot < right.
+       - `union` / `intersection` / `difference`: in-place set operations that consume the other tree. With an
+         `executor`, the two trees are cut into key ranges that are combined in parallel.
+       - `AVLTree.from_sorted(keys, values)`: bulk load a balanced tree from sorted keys.
+
+Time Complexity:
+    - **Insertion**: O(log n), where n is the number of nodes in the tree.
+    - **Deletion**: O(log n), where n is the number of nodes in the tree.
+    - **Search**: O(log n), where n is the number of nodes in the tree.
+    - **Traversal**: O(n), where n is the number of nodes in the tree.
+    - **rank / select / kth_smallest / count_range**: O(log n).
+    - **Ordered map**: see `Data_Structures.ordered_map` (O(log n), and O(log n + k) for a range of k entries).
+    - **split / join**: O(log n).
+    - **union / intersection / difference**: O(m log(n / m + 1)) for trees of sizes m <= n, against
+      O(m log(n + m)) for inserting or deleting the keys one by one.
+    - **from_sorted**: O(n).
+
+Applications:
+    - AVL Trees are used in situations where frequent insertions and deletions are performed
+        and quick search, insertion, and deletion operations are needed.
+    - They are useful in implementing associative arrays, priority queues, and other data structures
+        where balanced search performance is required.
+
+"""
+import os
+from operator import attrgetter
+
+from Data_Structures.ordered_map import OrderedMapMixin
+
+
+class TreeNode:
+    """
+    A node in the AVL Tree.
+
+    Attributes:
+        value (int): The value of the node.
+        left (TreeNode): The left child of the node.
+        right (TreeNode): The right child of the node.
+        height (int): The height of the node.
+        size (int): The number of nodes in the subtree rooted at this node.
+        data (any): The value mapped to the key.
+    """
+
+    __slots__ = ("left", "right", "value", "height", "size", "data")
+
+    def __init__(self, key: int, data: any = None) -> None:
+        """
+        Initialize a new TreeNode with the given key.
+
+        Args:
+            key (int): The value to be stored in the node.
+            data (any): The value mapped to the key.
+        """
+        self.left = None
+        self.right = None
+        self.value = key
+        self.data = data
+        self.height = 1  # New nodes are initially at height 1
+        self.size = 1
+
+class AVLTree(OrderedMapMixin):
+    """
+    Adelson-Velsky and Landis Tree (AVL Tree) Implementation
+
+    The ordered-map methods (`tree[key]`, `range`, `floor`, `pop_min`, ...) come from `OrderedMapMixin`.
+
+    Attributes:
+        root (TreeNode): The root node of the BST.
+    """
+
+    _key = attrgetter("value")  # OrderedMapMixin: the key of a node
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty AVL Tree.
+        """
+        self.root = None
+
+    @classmethod
+    def from_sorted(cls, keys, values=None) -> "AVLTree":
+        """
+        Build a perfectly balanced AVL Tree from keys in strictly ascending order, in O(n) and without recursion.
+
+        Every subtree takes the middle key of its range as its root, so a range of c keys has height c.bit_length()
+        and its two halves differ in height by at most one.
+
+        Args:
+            keys (iterable): The keys, in strictly ascending order.
+            values (iterable): The data mapped to each key, in the same order, or None to map every key to None.
+
+        Returns:
+            AVLTree: The new tree.
+
+        Raises:
+            ValueError: If the keys are not strictly ascending, or there are not as many values as keys.
+        """
+        keys = list(keys)
+        values = [None] * len(keys) if values is None else list(values)
+        if len(values) != len(keys):
+            raise ValueError("keys and values must have the same length")
+        for i in range(1, len(keys)):
+            if not keys[i - 1] < keys[i]:
+                raise ValueError("keys must be in strictly ascending order")
+        tree = cls()
+        tree.root = cls._build_sorted(keys, values)
+        return tree
+
+    @staticmethod
+    def _build_sorted(keys: list, values: list) -> TreeNode:
+        """
+        Build a balanced subtree from parallel sorted lists of keys and values.
+
+        Args:
+            keys (list): The keys, in strictly ascending order.
+            values (list): The data mapped to each key.
+
+        Returns:
+            TreeNode: The root of the subtree, or None if there are no keys.
+        """
+        root = None
+        # (first index, last index, parent, is_left) of every range still to be built
+        stack = [(0, len(keys) - 1, None, True)]
+        while stack:
+            lo, hi, parent, is_left = stack.pop()
+            if lo > hi:
+                continue
+            mid = (lo + hi) // 2
+            node = TreeNode(keys[mid], values[mid])
+            node.size = hi - lo + 1
+            node.height = node.size.bit_length()
+            if parent is None:
+                root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            stack.append((lo, mid - 1, node, True))
+            stack.append((mid + 1, hi, node, False))
+        return root
+
+    def insert(self, key: int, data: any = None) -> None:
+        """
+        Insert a key into the AVL Tree, or replace the data of an existing key.
+
+        Args:
+            key (int): The value to be inserted into the AVL Tree.
+            data (any): The value mapped to the key.
+
+        Returns:
+            None
+        """
+        self.root = self._insert(self.root, key, data)
+
+    def _insert(self, node: TreeNode, key: int, data: any = None) -> TreeNode:
+        """
+        Helper method to insert a key into the AVL Tree starting from the given node.
+
+        Args:
+            node (TreeNode): The root node of the subtree.
+            key (int): The value to be inserted into the subtree.
+            data (any): The value mapped to the key.
+
+        Returns:
+            TreeNode: The updated node.
+        """
+        if not node:
+            return TreeNode(key, data)
+        
+        if key < node.value:
+            node.left = self._insert(node.left, key, data)
+        elif key > node.value:
+            node.right = self._insert(node.right, key, data)
+        else:
+            node.data = data
+            return node
+        
+        node.height = 1 + max(self._get_height(node.left), self._get_height(node.right))
+        node.size = 1 + self._get_size(node.left) + self._get_size(node.right)
+        
+        balance = self._get_balance(node)
+        
+        if balance > 1:
+            if key < node.left.value:
+                return self._right_rotate(node)
+            else:
+                node.left = self._left_rotate(node.left)
+                return self._right_rotate(node)
+        
+        if balance < -1:
+            if key > node.right.value:
+                return self._left_rotate(node)
+            else:
+                node.right = self._right_rotate(node.right)
+                return self._left_rotate(node)
+        
+        return node
+
+    def _left_rotate(self, z: TreeNode) -> TreeNode:
+        """
+        Perform a left rotation.
+
+        Args:
+            z (TreeNode): The node to rotate.
+
+        Returns:
+            TreeNode: The new root of the rotated subtree.
+        """
+        y = z.right
+        T2 = y.left
+        
+        y.left = z
+        z.right = T2
+        
+        z.height = 1 + max(self._get_height(z.left), self._get_height(z.right))
+        y.height = 1 + max(self._get_height(y.left), self._get_height(y.right))
+        z.size = 1 + self._get_size(z.left) + self._get_size(z.right)
+        y.size = 1 + self._get_size(y.left) + self._get_size(y.right)
+        
+        return y
+
+    def _right_rotate(self, z: TreeNode) -> TreeNode:
+        """
+        Perform a right rotation.
+
+        Args:
+            z (TreeNode): The node to rotate.
+
+        Returns:
+            TreeNode: The new root of the rotated subtree.
+        """
+        y = z.left
+        T3 = y.right
+        
+        y.right = z
+        z.left = T3
+        
+        z.height = 1 + max(self._get_height(z.left), self._get_height(z.right))
+        y.height = 1 + max(self._get_height(y.left), self._get_height(y.right))
+        z.size = 1 + self._get_size(z.left) + self._get_size(z.right)
+        y.size = 1 + self._get_size(y.left) + self._get_size(y.right)
+        
+        return y
+
+    def _get_height(self, node: TreeNode) -> int:
+        """
+        Get the height of a node.
+
+        Args:
+            node (TreeNode): The node to check.
+
+        Returns:
+            int: The height of the node.
+        """
+        if not node:
+            return 0
+        return node.height
+
+    def _get_size(self, node: TreeNode) -> int:
+        """
+        Get the number of nodes in the subtree of a node.
+
+        Args:
+            node (TreeNode): The node to check.
+
+        Returns:
+            int: The size of the subtree (0 for None).
+        """
+        if not node:
+            return 0
+        return node.size
+
+    def _get_balance(self, node: TreeNode) -> int:
+        """
+        Get the balance factor of a node.
+
+        Args:
+            node (TreeNode): The node to check.
+
+        Returns:
+            int: The balance factor of the node.
+        """
+        if not node:
+            return 0
+        return self._get_height(node.left) - self._get_height(node.right)
+
+    def _update(self, node: TreeNode) -> None:
+        """
+        Recompute the height and size of a node from its children.
+
+        Args:
+            node (TreeNode): The node to update.
+        """
+        node.height = 1 + max(self._get_height(node.left), self._get_height(node.right))
+        node.size = 1 + self._get_size(node.left) + self._get_size(node.right)
+
+    def _rebalance(self, node: TreeNode) -> TreeNode:
+        """
+        Update a node whose children heights differ by at most two, and rotate it back into balance.
+
+        Args:
+            node (TreeNode): The node to rebalance.
+
+        Returns:
+            TreeNode: The new root of the subtree.
+        """
+        self._update(node)
+        balance = self._get_balance(node)
+        if balance > 1:
+            if self._get_balance(node.left) < 0:
+                node.left = self._left_rotate(node.left)
+            return self._right_rotate(node)
+        if balance < -1:
+            if self._get_balance(node.right) > 0:
+                node.right = self._right_rotate(node.right)
+            return self._left_rotate(node)
+        return node
+
+    def _join(self, left: TreeNode, pivot: TreeNode, right: TreeNode) -> TreeNode:
+        """
+        Join two subtrees and a pivot node, where every key in `left` < pivot key < every key in `right`.
+
+        Walks down the spine of the taller tree to a subtree whose height is within one of the shorter tree, hangs
+        both there under the pivot, and rebalances on the way back up: O(|h(left) - h(right)| + 1).
+
+        Args:
+            left (TreeNode): The subtree of smaller keys.
+            pivot (TreeNode): The node joining them; its children are overwritten.
+            right (TreeNode): The subtree of larger keys.
+
+        Returns:
+            TreeNode: The root of the joined subtree.
+        """
+        left_height, right_height = self._get_height(left), self._get_height(right)
+        if left_height > right_height + 1:
+            left.right = self._join(left.right, pivot, right)
+            return self._rebalance(left)
+        if right_height > left_height + 1:
+            right.left = self._join(left, pivot, right.left)
+            return self._rebalance(right)
+        pivot.left, pivot.right = left, right
+        self._update(pivot)
+        return pivot
+
+    def _split_last(self, node: TreeNode) -> tuple:
+        """
+        Detach the node with the largest key from a subtree.
+
+        Args:
+            node (TreeNode): The root of a non-empty subtree.
+
+        Returns:
+            tuple: (the remaining subtree, the detached node).
+        """
+        if not node.right:
+            return node.left, node
+        rest, last = self._split_last(node.right)
+        return self._join(node.left, node, rest), last
+
+    def _join2(self, left: TreeNode, right: TreeNode) -> TreeNode:
+        """
+        Join two subtrees without a pivot, where every key in `left` < every key in `right`.
+
+        Args:
+            left (TreeNode): The subtree of smaller keys.
+            right (TreeNode): The subtree of larger keys.
+
+        Returns:
+            TreeNode: The root of the joined subtree.
+        """
+        if not left:
+            return right
+        rest, last = self._split_last(left)
+        return self._join(rest, last, right)
+
+    def _split(self, node: TreeNode, key: int) -> tuple:
+        """
+        Split a subtree by `key` in O(log n), reusing its nodes.
+
+        Args:
+            node (TreeNode): The root of the subtree.
+            key (int): The key to split at.
+
+        Returns:
+            tuple: (the subtree of keys < key, the node holding `key` or None, the subtree of keys > key). The
+            children of the returned node are stale.
+        """
+        if not node:
+            return None, None, None
+        if key < node.value:
+            left, found, right = self._split(node.left, key)
+            return left, found, self._join(right, node, node.right)
+        if node.value < key:
+            left, found, right = self._split(node.right, key)
+            return self._join(node.left, node, left), found, right
+        return node.left, node, node.right
+
+    def _union(self, a: TreeNode, b: TreeNode) -> TreeNode:
+        """
+        Union of two subtrees; the data from `b` wins for keys in both.
+
+        Args:
+            a (TreeNode): The first subtree.
+            b (TreeNode): The second subtree.
+
+        Returns:
+            TreeNode: The root of the union.
+        """
+        if not a:
+            return b
+        if not b:
+            return a
+        left, _, right = self._split(a, b.value)
+        b_left, b_right = b.left, b.right
+        return self._join(self._union(left, b_left), b, self._union(right, b_right))
+
+    def _intersection(self, a: TreeNode, b: TreeNode) -> TreeNode:
+        """
+        Intersection of two subtrees, keeping the data from `a`.
+
+        Args:
+            a (TreeNode): The first subtree.
+            b (TreeNode): The second subtree.
+
+        Returns:
+            TreeNode: The root of the intersection.
+        """
+        if not a or not b:
+            return None
+        if a.size > b.size:
+            # walk the smaller tree, splitting the larger one around its keys
+            left, found, right = self._split(a, b.value)
+            b_left, b_right = b.left, b.right
+            left = self._intersection(left, b_left)
+            right = self._intersection(right, b_right)
+        else:
+            left, found, right = self._split(b, a.value)
+            a_left, a_right = a.left, a.right
+            left = self._intersection(a_left, left)
+            right = self._intersection(a_right, right)
+            found = found and a
+        if found:
+            return self._join(left, found, right)
+        return self._join2(left, right)
+
+    def _difference(self, a: TreeNode, b: TreeNode) -> TreeNode:
+        """
+        The keys of `a` that are not in `b`.
+
+        Args:
+            a (TreeNode): The first subtree.
+            b (TreeNode): The subtree of keys to remove.
+
+        Returns:
+            TreeNode: The root of the difference.
+        """
+        if not a:
+            return None
+        if not b:
+            return a
+        left, _, right = self._split(a, b.value)
+        return self._join2(self._difference(left, b.left), self._difference(right, b.right))
+
+    def search(self, key: int) -> bool:
+        """
+        Search for a key in the AVL Tree.
+
+        Args:
+            key (int): The value to search for.
+
+        Returns:
+            bool: True if the key is found, otherwise False.
+        """
+        return self._search(self.root, key)
+
+    def _search(self, node: TreeNode, key: int) -> bool:
+        """
+        Helper method to search for a key in the AVL Tree starting from the given node.
+
+        Args:
+            node (TreeNode): The root node of the subtree.
+            key (int): The value to search for in the subtree.
+
+        Returns:
+            bool: True if the key is found, otherwise False.
+        """
+        if not node:
+            return False
+        if key < node.value:
+            return self._search(node.left, key)
+        elif key > node.value:
+            return self._search(node.right, key)
+        else:
+            return True
+
+    def delete(self, key: int) -> None:
+        """
+        Delete a key from the AVL Tree.
+
+        Args:
+            key (int): The value to be deleted from the AVL Tree.
+
+        Returns:
+            None
+        """
+        self.root = self._delete(self.root, key)
+
+    _delete_key = delete  # OrderedMapMixin: how to remove a key
+
+    def _delete(self, node: TreeNode, key: int) -> TreeNode:
+        """
+        Helper method to delete a key from the AVL Tree starting from the given node.
+
+        Args:
+            node (TreeNode): The root node of the subtree.
+            key (int): The value to be deleted from the subtree.
+
+        Returns:
+            TreeNode: The updated node.
+        """
+        if not node:
+            return node
+        
+        if key < node.value:
+            node.left = self._delete(node.left, key)
+        elif key > node.value:
+            node.right = self._delete(node.right, key)
+        else:
+            if not node.left:
+                return node.right
+            elif not node.right:
+                return node.left
+            
+            temp = self._get_min_value_node(node.right)
+            node.value = temp.value
+            node.data = temp.data
+            node.right = self._delete(node.right, temp.value)
+        
+        if not node:
+            return node
+        
+        node.height = 1 + max(self._get_height(node.left), self._get_height(node.right))
+        node.size = 1 + self._get_size(node.left) + self._get_size(node.right)
+        
+        balance = self._get_balance(node)
+        
+        if balance > 1:
+            if self._get_balance(node.left) >= 0:
+                return self._right_rotate(node)
+            else:
+                node.left = self._left_rotate(node.left)
+                return self._right_rotate(node)
+        
+        if balance < -1:
+            if self._get_balance(node.right) <= 0:
+                return self._left_rotate(node)
+            else:
+                node.right = self._right_rotate(node.right)
+                return self._left_rotate(node)
+        
+        return node
+
+    def _get_min_value_node(self, node: TreeNode) -> TreeNode:
+        """
+        Get the node with the minimum value greater than the given node.
+
+        Args:
+            node (TreeNode): The node to start from.
+
+        Returns:
+            TreeNode: The node with the minimum value.
+        """
+        current = node
+        while current.left:
+            current = current.left
+        return current
+
+    def _get_max_node(self, node: TreeNode) -> TreeNode:
+        """
+        Get the node with the largest key in a non-empty subtree.
+        """
+        while node.right:
+            node = node.right
+        return node
+
+    def __len__(self) -> int:
+        """
+        Return the number of keys in the AVL Tree.
+
+        Returns:
+            int: The number of keys.
+        """
+        return self._get_size(self.root)
+
+    def _rank(self, key: int, inclusive: bool) -> int:
+        """
+        Count the keys smaller than `key` (or not larger, if `inclusive`) by walking one root-to-leaf path.
+
+        Args:
+            key (int): The key to compare with.
+            inclusive (bool): True to also count a key equal to `key`.
+
+        Returns:
+            int: The number of keys.
+        """
+        count = 0
+        node = self.root
+        while node:
+            if key < node.value or (key == node.value and not inclusive):
+                node = node.left
+            else:
+                count += 1 + self._get_size(node.left)
+                node = node.right
+        return count
+
+    def rank(self, key: int) -> int:
+        """
+        Return the number of keys smaller than `key`, which is the 0-based position `key` has (or would have) in
+        ascending order.
+
+        Args:
+            key (int): The key. It does not have to be in the tree.
+
+        Returns:
+            int: The rank of the key.
+        """
+        return self._rank(key, False)
+
+    def select(self, k: int) -> int:
+        """
+        Return the key at 0-based position `k` in ascending order.
+
+        Args:
+            k (int): The position; negative values count from the end.
+
+        Returns:
+            int: The key.
+
+        Raises:
+            IndexError: If `k` is out of range.
+        """
+        n = self._get_size(self.root)
+        if k < 0:
+            k += n
+        if not 0 <= k < n:
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            left = self._get_size(node.left)
+            if k < left:
+                node = node.left
+            elif k == left:
+                return node.value
+            else:
+                k -= left + 1
+                node = node.right
+
+    def kth_smallest(self, k: int) -> int:
+        """
+        Return the k-th smallest key, counting from 1.
+
+        Args:
+            k (int): The position, from 1 to the number of keys.
+
+        Returns:
+            int: The key.
+
+        Raises:
+            IndexError: If `k` is out of range.
+        """
+        if k < 1:
+            raise IndexError("kth_smallest index out of range")
+        return self.select(k - 1)
+
+    def count_range(self, lo: int, hi: int) -> int:
+        """
+        Count the keys `x` with `lo <= x <= hi`.
+
+        Args:
+            lo (int): The lower bound (inclusive).
+            hi (int): The upper bound (inclusive).
+
+        Returns:
+            int: The number of keys in the range (0 if `lo > hi`).
+        """
+        if hi < lo:
+            return 0
+        return self._rank(hi, True) - self._rank(lo, False)
+
+    def _wrap(self, node: TreeNode) -> "AVLTree":
+        """
+        Make a new tree of the same type around an existing subtree.
+        """
+        tree = type(self)()
+        tree.root = node
+        return tree
+
+    def split(self, key: int) -> tuple:
+        """
+        Split the tree by `key` in O(log n). The nodes move to the two new trees, leaving this tree empty.
+
+        Args:
+            key (int): The key to split at.
+
+        Returns:
+            tuple: (a tree of the keys < key, the (key, data) pair of `key` or None if absent, a tree of the
+            keys > key).
+        """
+        left, found, right = self._split(self.root, key)
+        self.root = None
+        return self._wrap(left), (found.value, found.data) if found else None, self._wrap(right)
+
+    @classmethod
+    def join(cls, left: "AVLTree", pivot: int, right: "AVLTree", data: any = None) -> "AVLTree":
+        """
+        Join two trees and a pivot key in O(|h(left) - h(right)| + 1) = O(log n). The nodes move to the new tree,
+        leaving `left` and `right` empty.
+
+        Args:
+            left (AVLTree): A tree whose keys are all smaller than `pivot`.
+            pivot (int): The key between the two trees.
+            right (AVLTree): A tree whose keys are all larger than `pivot`.
+            data (any): The value mapped to `pivot`.
+
+        Returns:
+            AVLTree: The joined tree.
+
+        Raises:
+            ValueError: If the keys are not ordered as left < pivot < right.
+        """
+        if left.root and not left._get_max_node(left.root).value < pivot:
+            raise ValueError("every key of left must be smaller than the pivot")
+        if right.root and not pivot < right._get_min_value_node(right.root).value:
+            raise ValueError("every key of right must be larger than the pivot")
+        tree = cls()
+        tree.root = tree._join(left.root, TreeNode(pivot, data), right.root)
+        left.root = right.root = None
+        return tree
+
+    def union(self, other: "AVLTree", executor=None, parts: int = None) -> None:
+        """
+        Add every entry of `other` to this tree, in place. For keys in both trees the data from `other` wins.
+
+        Join-based: `other` is split around this tree's keys rather than inserted key by key, which costs
+        O(m log(n / m + 1)) for trees of sizes m <= n, instead of O(m log(n + m)). The nodes of `other` are moved,
+        leaving it empty.
+
+        Args:
+            other (AVLTree): The tree to merge in.
+            executor (concurrent.futures.Executor): If given, both trees are split into `parts` key ranges
+                that are combined in parallel on the executor (eg. a `ProcessPoolExecutor`).
+            parts (int): The number of key ranges for the executor. Default is the number of CPUs.
+        """
+        self._set_operation("union", other, executor, parts)
+
+    def intersection(self, other: "AVLTree", executor=None, parts: int = None) -> None:
+        """
+        Keep only the keys that are also in `other`, in place, with their data from this tree. O(m log(n / m + 1)).
+        `other` is left empty.
+
+        Args:
+            other (AVLTree): The tree to intersect with.
+            executor (concurrent.futures.Executor): See `union`.
+            parts (int): See `union`.
+        """
+        self._set_operation("intersection", other, executor, parts)
+
+    def difference(self, other: "AVLTree", executor=None, parts: int = None) -> None:
+        """
+        Remove every key of `other` from this tree, in place. O(m log(n / m + 1)). `other` is left empty.
+
+        Args:
+            other (AVLTree): The tree of keys to remove.
+            executor (concurrent.futures.Executor): See `union`.
+            parts (int): See `union`.
+        """
+        self._set_operation("difference", other, executor, parts)
+
+    def _set_operation(self, operation: str, other: "AVLTree", executor=None, parts: int = None) -> None:
+        """
+        Run `_union`, `_intersection` or `_difference` on the two roots, sequentially or split across an executor.
+
+        For the executor, the key space is cut at `parts - 1` evenly spaced keys of this tree (O(parts log n)).
+        The entries of each range are read from both trees with `range`, without changing them, and sent to the
+        executor as sorted (key, data) lists. Only once every piece has come back are the results rebuilt with
+        `from_sorted` and joined around the cut keys, so if a piece raises, both trees are left as they were.
+        Sending the pieces costs O(n + m), so this only pays off when both trees are large and the executor has
+        several CPUs.
+
+        Args:
+            operation (str): "union", "intersection" or "difference".
+            other (AVLTree): The second tree; it is left empty.
+            executor (concurrent.futures.Executor): Where to run the pieces, or None to run sequentially.
+            parts (int): The number of pieces. Default is the number of CPUs.
+        """
+        if executor is None:
+            a, b = self.root, other.root
+            other.root = None
+            self.root = getattr(self, "_" + operation)(a, b)
+            return
+        if parts is None:
+            parts = os.cpu_count() or 1
+        n = len(self)
+        pivots = sorted({self.select(i * n // parts) for i in range(1, parts)}) if n else []
+        bounds = [None] + pivots + [None]
+        futures = [executor.submit(_set_operation_worker, operation, self._entries_between(lo, hi),
+                                   other._entries_between(lo, hi)) for lo, hi in zip(bounds, bounds[1:])]
+        results = [future.result() for future in futures]
+        pivot_entries = []
+        for pivot in pivots:
+            a_node, b_node = self._lookup(pivot), other._lookup(pivot)
+            if operation == "union":
+                pivot_entries.append((pivot, b_node.data if b_node else a_node.data))
+            elif operation == "intersection":
+                pivot_entries.append((pivot, a_node.data) if b_node else None)
+            else:
+                pivot_entries.append(None if b_node else (pivot, a_node.data))
+        root = None
+        for i, entries in enumerate(results):
+            piece = self._build_sorted([key for key, _ in entries], [data for _, data in entries])
+            if i == 0:
+                root = piece
+            elif pivot_entries[i - 1]:
+                root = self._join(root, TreeNode(*pivot_entries[i - 1]), piece)
+            else:
+                root = self._join2(root, piece)
+        self.root = root
+        other.root = None
+
+    def _entries_between(self, lo: int, hi: int) -> list:
+        """
+        Return the (key, data) pairs with lo < key < hi, where None is an open bound.
+        """
+        return [(key, data) for key, data in self.range(lo, hi) if key != lo and key != hi]
+
+    def inorder_traversal(self) -> list[int]:
+        """
+        Perform an inorder traversal of the AVL Tree.
+
+        Returns:
+            list[int]: A list of values in the AVL Tree in ascending order.
+        """
+        result = []
+        self._inorder_traversal(self.root, result)
+        return result
+
+    def _inorder_traversal(self, node: TreeNode, result: list[int]) -> None:
+        """
+        Helper method for inorder traversal of the AVL Tree.
+
+        Args:
+            node (TreeNode): The root node of the subtree.
+            result (list[int]): The list to store the traversal result.
+
+        Returns:
+            None
+        """
+        if node:
+            self._inorder_traversal(node.left, result)
+            result.append(node.value)
+            self._inorder_traversal(node.right, result)
+
+    def preorder_traversal(self) -> list[int]:
+        """
+        Perform a preorder traversal of the AVL Tree.
+
+        Returns:
+            list[int]: A list of values in the AVL Tree following preorder traversal.
+        """
+        result = []
+        self._preorder_traversal(self.root, result)
+        return result
+
+    def _preorder_traversal(self, node: TreeNode, result: list[int]) -> None:
+        """
+        Helper method for preorder traversal of the AVL Tree.
+
+        Args:
+            node (TreeNode): The root node of the subtree.
+            result (list[int]): The list to store the traversal result.
+
+        Returns:
+            None
+        """
+        if node:
+            result.append(node.value)
+            self._preorder_traversal(node.left, result)
+            self._preorder_traversal(node.right, result)
+
+    def postorder_traversal(self) -> list[int]:
+        """
+        Perform a postorder traversal of the AVL Tree.
+
+        Returns:
+            list[int]: A list of values in the AVL Tree following postorder traversal.
+        """
+        result = []
+        self._postorder_traversal(self.root, result)
+        return result
+
+    def _postorder_traversal(self, node: TreeNode, result: list[int]) -> None:
+        """
+        Helper method for postorder traversal of the AVL Tree.
+
+        Args:
+            node (TreeNode): The root node of the subtree.
+            result (list[int]): The list to store the traversal result.
+
+        Returns:
+            None
+        """
+        if node:
+            self._postorder_traversal(node.left, result)
+            self._postorder_traversal(node.right, result)
+            result.append(node.value)
+
+def _set_operation_worker(operation: str, left: list, right: list) -> list:
+    """
+    Combine two sorted lists of (key, data) pairs with an AVLTree set operation; the executor side of
+    `AVLTree._set_operation`, kept at module level so that process pools can pickle it.
+
+    Returns:
+        list: The sorted (key, data) pairs of the result.
+    """
+    tree = AVLTree.from_sorted([key for key, _ in left], [data for _, data in left])
+    other = AVLTree.from_sorted([key for key, _ in right], [data for _, data in right])
+    tree._set_operation(operation, other)
+    return list(tree.items())
+
+if __name__ == "__main__":
+    # Create an AVL Tree instance
+    avl = AVLTree()
+    
+    # Insert elements
+    print("Inserting elements:")
+    elements = [10, 20, 30, 40, 50, 25]
+    for elem in elements:
+        avl.insert(elem)
+        print(f"Inserted {elem}")
+    
+    # Print traversals
+    print("\nInorder Traversal:")
+    print(avl.inorder_traversal())  # Expected: [10, 20, 25, 30, 40, 50]
+
+    print("\nPreorder Traversal:")
+    print(avl.preorder_traversal())
+
+    print("\nPostorder Traversal:")
+    print(avl.postorder_traversal())
+
+    # Search for elements
+    print("\nSearching for elements:")
+    search_keys = [25, 15]
+    for key in search_keys:
+        found = avl.search(key)
+        print(f"Search for {key}: {'Found' if found else 'Not Found'}")
+
+    # Delete elements
+    print("\nDeleting elements:")
+    delete_keys = [40, 50, 25]
+    for key in delete_keys:
+        avl.delete(key)
+        print(f"Deleted {key}")
+
+    # Print traversals after deletions
+    print("\nInorder Traversal after deletions:")
+    print(avl.inorder_traversal())  # Expected: [10, 20, 30]
+
+    # Order statistics
+    scores = AVLTree()
+    for score in [50, 80, 20, 90, 70, 40]:
+        scores.insert(score)
+    print("\nOrder statistics:")
+    print(len(scores), scores.rank(70), scores.select(0), scores.kth_smallest(6), scores.count_range(40, 80))
+    # Expected: 6 3 20 90 4
+
+    # Ordered map
+    prices = AVLTree()
+    for day, price in [(3, 9.5), (1, 10.0), (7, 8.25), (5, 9.0)]:
+        prices[day] = price
+    print("\nOrdered map:")
+    print(list(prices.range(2, 6)), list(prices.range(reverse=True))[0])  # Expected: [(3, 9.5), (5, 9.0)] (7, 8.25)
+    print(prices.floor(4), prices.ceiling(4), prices.successor(7), prices.predecessor(1))
+    # Expected: (3, 9.5) (5, 9.0) None None
+    print(prices.pop_min(), prices.pop_max(), list(prices))  # Expected: (1, 10.0) (7, 8.25) [3, 5]
+
+    # Split, join and bulk set operations
+    evens = AVLTree.from_sorted(range(0, 20, 2))
+    odds = AVLTree.from_sorted(range(1, 20, 2))
+    low, entry, high = evens.split(10)
+    print("\nSplit / join / set operations:")
+    print(list(low), entry, list(high))  # Expected: [0, 2, 4, 6, 8] (10, None) [12, 14, 16, 18]
+    evens = AVLTree.join(low, 10, high)
+    evens.union(odds)
+    print(len(evens), list(evens.range(9, 11)))  # Expected: 20 [(9, None), (10, None), (11, None)]
+    evens.difference(AVLTree.from_sorted(range(0, 20, 3)))
+    evens.intersection(AVLTree.from_sorted(range(10)))
+    print(list(evens))  # Expected: [1, 2, 4, 5, 7, 8]
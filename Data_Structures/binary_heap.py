@@ -0,0 +1,1014 @@
+"""
+Heap Implementation using Python's `heapq` and manual heap implementations.
+
+Heap Overview:
+- A heap is a specialized tree-based data structure that satisfies the heap property.
+- In a max-heap, the parent node is always greater than or equal to its children, while in a min-heap, the parent node is always less than or equal to its children.
+- Operations are performed to maintain the heap property during insertions and deletions.
+
+Heap Operations:
+1. **Push**: Inserts an item into the heap while maintaining the heap property.
+2. **Pop** : Removes and returns the root element of the heap (i.e., the maximum element in a max-heap or the minimum element in a min-heap).
+3. **Peek**: Returns the root element of the heap without removing it.
+4. **Heapify**: Converts an iterable into a heap, rearranging the elements to satisfy the heap property.
+5. **Heap Variants** (`Heap`):
+       - **d-ary**: `arity=d` (2 to 16) gives every node d children. A shallower tree makes pushes cheaper (fewer
+         levels to sift up) and pops dearer (d children compared per level), so push-heavy workloads favour larger d.
+       - **Max-Heap / key / comparator**: The order comes from a comparator on `key(item)` instead of negating items,
+         so max-heaps work for strings, tuples and other non-numeric items.
+       - **Min-Heap**: A binary min-heap with no key uses Python’s built-in `heapq` directly.
+       - **Radix Heap** (`RadixHeap`): For monotone non-negative integer keys (as in Dijkstra's algorithm), buckets
+         keyed by the highest bit that differs from the last popped key give amortized O(log C) push and pop.
+6. **Streaming** (`Heap.top_k`, `Heap.merge_sorted`):
+       - `top_k(iterable, k, key)` keeps a heap of only k items while streaming any iterable, in O(n log k) worst case
+         and close to O(n) for random input, since most items lose to the cached k-th best key.
+       - `merge_sorted(*iterables, key)` lazily merges N sorted iterables in O(n log N), reading each source in
+         batches and yielding runs from one source without heap operations.
+7. **Underlying Heap Implementations**:
+       - **MaxHeap**: Implements a max-heap manually with basic operations like insertion, deletion, and heapify.
+       - **MinHeap**: Implements a min-heap manually with basic operations like insertion, deletion, and heapify.
+       - Both keep the heap in a flat list and restore the heap property with iterative sift-up (after an insert) and
+         sift-down (after a removal), touching one root-to-leaf path instead of re-heapifying the whole array.
+       - `build(iterable)` arranges n items bottom-up in O(n); `pop`, `pushpop` and `replace` mirror `heapq`.
+       - An optional `key` function orders items by `key(item)`; keys are computed once per item and cached.
+8. **Indexed Heap** (`IndexedHeap`):
+       - Orders external item IDs by priority and keeps a position map (ID -> index in the heap array).
+       - `push(id, prio)`, `update(id, prio)` (raise or lower), `remove(id)`, `contains(id)` and `pop()` are all
+         O(log n) or better, and an ID is in the heap at most once, so there are no stale entries to skip.
+       - Suited to Dijkstra's and Prim's algorithms and to schedulers whose task priorities change.
+
+Heap Time Complexity:
+    - **Insertion**: O(log n)
+    - **Deletion** O(log n)
+    - **Peek**: O(1)
+    - **Heapify / build**: O(n), where n is the number of elements
+    - **deleteNode** (by value): O(n) to find the item, then O(log n)
+
+Applications:
+    - Heaps are used in priority queues, heap sort, and algorithms like Dijkstra's shortest path and Prim's minimum spanning tree.
+
+"""
+
+import heapq
+import operator
+from itertools import islice
+
+
+class _Reversed:
+    """
+    Wraps a key so that `heapq`'s min-heap orders it from largest to smallest.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+class Heap:
+    """
+    A d-ary array heap (d = 2..16) with an optional key function and comparator.
+
+    Items are stored as they are, so max-heaps work for any comparable items, not only numbers. The plain binary
+    min-heap with no key uses Python's `heapq` module directly.
+    """
+
+    def __init__(self, max_heap=False, arity=2, key=None, comparator=None):
+        """
+        Initialize the heap.
+
+        Args:
+            max_heap (bool): If True, use max-heap; otherwise, use min-heap.
+            arity (int): The number of children per node, from 2 to 16. Larger values make the tree shallower, so
+                pushes are cheaper and pops compare more children per level.
+            key (callable): Optional function computing the value each item is ordered by. Computed once per item.
+            comparator (callable): Optional `comparator(a, b)` on keys returning True if `a` must leave the heap
+                before `b`. Overrides `max_heap`.
+
+        Raises:
+            ValueError: If `arity` is not between 2 and 16.
+        """
+        if not 2 <= arity <= 16:
+            raise ValueError("arity must be between 2 and 16")
+        self.heap = []
+        self.max_heap = max_heap
+        self.arity = arity
+        self.key = key
+        self._keys = self.heap if key is None else []
+        self._higher = comparator or (operator.gt if max_heap else operator.lt)
+        self._native = arity == 2 and key is None and comparator is None and not max_heap
+
+    def _sift_up(self, pos):
+        """
+        Move the item at `pos` towards the root.
+
+        Args:
+            pos (int): The index of the item.
+
+        Returns:
+            None
+        """
+        heap, keys, higher, d = self.heap, self._keys, self._higher, self.arity
+        item, k = heap[pos], keys[pos]
+        while pos > 0:
+            parent = (pos - 1) // d
+            if not higher(k, keys[parent]):
+                break
+            heap[pos] = heap[parent]
+            keys[pos] = keys[parent]
+            pos = parent
+        heap[pos] = item
+        keys[pos] = k
+
+    def _sift_down(self, pos):
+        """
+        Move the item at `pos` towards the leaves, swapping with its highest-priority child.
+
+        Args:
+            pos (int): The index of the item.
+
+        Returns:
+            None
+        """
+        heap, keys, higher, d = self.heap, self._keys, self._higher, self.arity
+        n = len(heap)
+        item, k = heap[pos], keys[pos]
+        first = d * pos + 1
+        while first < n:
+            best, best_key = first, keys[first]
+            for child in range(first + 1, min(first + d, n)):
+                if higher(keys[child], best_key):
+                    best, best_key = child, keys[child]
+            if not higher(best_key, k):
+                break
+            heap[pos] = heap[best]
+            keys[pos] = best_key
+            pos = best
+            first = d * pos + 1
+        heap[pos] = item
+        keys[pos] = k
+
+    def push(self, item):
+        """
+        Insert an item into the heap.
+
+        Args:
+            item (any): The item to be inserted.
+
+        Returns:
+            None
+        """
+        if self._native:
+            heapq.heappush(self.heap, item)
+            return
+        self.heap.append(item)
+        if self._keys is not self.heap:
+            self._keys.append(self.key(item))
+        self._sift_up(len(self.heap) - 1)
+
+    def pop(self):
+        """
+        Remove and return the root element of the heap.
+
+        Returns:
+            any: The root element of the heap.
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if not self.heap:
+            raise IndexError("pop from an empty heap")
+        if self._native:
+            return heapq.heappop(self.heap)
+        heap, keys = self.heap, self._keys
+        last = heap.pop()
+        last_key = keys.pop() if keys is not heap else last
+        if not heap:
+            return last
+        root = heap[0]
+        heap[0] = last
+        keys[0] = last_key
+        self._sift_down(0)
+        return root
+
+    def peek(self):
+        """
+        Return the root element of the heap without removing it.
+
+        Returns:
+            any: The root element of the heap.
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if not self.heap:
+            raise IndexError("peek from an empty heap")
+        return self.heap[0]
+
+    def heapify(self, iterable):
+        """
+        Convert an iterable into a heap, bottom-up in O(n).
+
+        Args:
+            iterable (iterable): An iterable containing elements to be heapified.
+
+        Returns:
+            None
+        """
+        self.heap = list(iterable)
+        if self._native:
+            self._keys = self.heap
+            heapq.heapify(self.heap)
+            return
+        self._keys = self.heap if self.key is None else [self.key(item) for item in self.heap]
+        for i in range((len(self.heap) - 2) // self.arity, -1, -1):
+            self._sift_down(i)
+
+    @staticmethod
+    def top_k(iterable, k, key=None, largest=True):
+        """
+        Return the k largest (or smallest) items of an iterable, best first, in one streaming pass.
+
+        Only a heap of k items is kept. The current k-th best key is cached in a local variable, so an item that does
+        not beat it costs one comparison, and one that does replaces the heap root in a single `heapreplace` (the
+        `heappushpop` fast path). Equal items keep their input order, as with `sorted`.
+
+        Args:
+            iterable (iterable): The items, e.g. a generator over a file. It is consumed once.
+            k (int): The number of items to return.
+            key (callable): Optional function computing the value items are compared by.
+            largest (bool): True for the k largest items, False for the k smallest.
+
+        Returns:
+            list: Up to k items, largest (or smallest) first.
+        """
+        if k <= 0:
+            return []
+        it = iter(iterable)
+        wrap = (lambda value: value) if largest else _Reversed
+        heap = []
+        order = 0
+        for item in islice(it, k):
+            heap.append((wrap(item if key is None else key(item)), order, item))
+            order -= 1
+        heapq.heapify(heap)
+        if len(heap) == k:
+            replace = heapq.heapreplace
+            if largest:
+                top = heap[0][0]
+                for item in it:
+                    value = item if key is None else key(item)
+                    if top < value:
+                        replace(heap, (value, order, item))
+                        top = heap[0][0]
+                        order -= 1
+            else:
+                top = heap[0][0].value
+                for item in it:
+                    value = item if key is None else key(item)
+                    if value < top:
+                        replace(heap, (_Reversed(value), order, item))
+                        top = heap[0][0].value
+                        order -= 1
+        heap.sort(reverse=True)
+        return [item for _, _, item in heap]
+
+    @staticmethod
+    def merge_sorted(*iterables, key=None, reverse=False, batch=256):
+        """
+        Lazily merge sorted iterables into one sorted stream, like `heapq.merge`.
+
+        Each source is read in batches of `batch` items. The heap holds one entry per source; after yielding from a
+        source, its following items are yielded directly for as long as they still come before the head of every
+        other source, so runs of items from one source skip the heap entirely. Equal items come out in source order.
+        This pays off when consecutive items tend to come from the same source; when the sources alternate on almost
+        every item, `heapq.merge` is faster.
+
+        Args:
+            *iterables (iterable): Sorted iterables, e.g. generators over `mmap`-backed run files.
+            key (callable): Optional function computing the value items are compared by.
+            reverse (bool): True if the inputs are sorted in descending order.
+            batch (int): The number of items read from a source at a time.
+
+        Yields:
+            any: The merged items.
+        """
+        heap = []
+        for source, iterable in enumerate(iterables):
+            it = iter(iterable)
+            buffer = list(islice(it, batch))
+            if buffer:
+                first = buffer[0] if key is None else key(buffer[0])
+                heap.append([_Reversed(first) if reverse else first, source, buffer, 0, it])
+        heapq.heapify(heap)
+        replace = heapq.heapreplace
+        while len(heap) > 1:
+            entry = heap[0]
+            _, source, buffer, pos, it = entry
+            rival = heap[1] if len(heap) == 2 or not heap[2] < heap[1] else heap[2]
+            rival_key = rival[0]
+            wins_ties = source < rival[1]
+            size = len(buffer)
+            while True:
+                yield buffer[pos]
+                pos += 1
+                if pos == size:
+                    buffer = list(islice(it, batch))
+                    if not buffer:
+                        heapq.heappop(heap)
+                        break
+                    pos, size = 0, len(buffer)
+                value = buffer[pos] if key is None else key(buffer[pos])
+                if reverse:
+                    value = _Reversed(value)
+                if value < rival_key or (wins_ties and not rival_key < value):
+                    continue
+                entry[0], entry[2], entry[3] = value, buffer, pos
+                replace(heap, entry)
+                break
+        if heap:
+            _, _, buffer, pos, it = heap[0]
+            yield from islice(buffer, pos, None)
+            yield from it
+
+    def __len__(self):
+        """
+        Return the number of elements in the heap.
+
+        Returns:
+            int: The number of elements in the heap.
+        """
+        return len(self.heap)
+
+    def __str__(self):
+        """
+        Return a string representation of the heap.
+
+        Returns:
+            str: The string representation of the heap.
+        """
+        return str(self.heap)
+
+
+class RadixHeap:
+    """
+    A monotone min-heap of non-negative integer keys, for workloads such as Dijkstra's algorithm where no pushed key
+    is smaller than the last popped one.
+
+    Items sit in buckets by the highest bit in which their key differs from the last popped key. A pop that finds
+    bucket 0 empty takes the first non-empty bucket, makes its minimum the new last key, and redistributes that bucket
+    into lower ones. Every item only moves to lower buckets, so push and pop are amortized O(log C), where C is the
+    largest key. Keys are compared as integers only; there are no comparisons between values.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty radix heap.
+        """
+        self._buckets = [[]]
+        self._last = 0
+        self._size = 0
+
+    def push(self, key, value=None):
+        """
+        Insert a value with an integer key.
+
+        Args:
+            key (int): The key, at least the last popped key.
+            value (any): The value stored with the key.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the key is smaller than the last popped key (or negative).
+        """
+        if key < self._last:
+            raise ValueError(f"key {key} is smaller than the last popped key {self._last}")
+        i = (key ^ self._last).bit_length()
+        buckets = self._buckets
+        while len(buckets) <= i:
+            buckets.append([])
+        buckets[i].append((key, value))
+        self._size += 1
+
+    def pop(self):
+        """
+        Remove and return the entry with the smallest key.
+
+        Returns:
+            tuple: The (key, value) pair.
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if not self._size:
+            raise IndexError("pop from an empty heap")
+        buckets = self._buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            moving = buckets[i]
+            buckets[i] = []
+            last = self._last = min(key for key, _ in moving)
+            for entry in moving:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+        self._size -= 1
+        return buckets[0].pop()
+
+    def peek(self):
+        """
+        Return the entry `pop` would return, without removing it.
+
+        Returns:
+            tuple: The (key, value) pair.
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if not self._size:
+            raise IndexError("peek from an empty heap")
+        for bucket in self._buckets:
+            if bucket:
+                return min(bucket, key=lambda entry: entry[0])
+
+    def __len__(self):
+        """
+        Return the number of entries in the heap.
+
+        Returns:
+            int: The number of entries.
+        """
+        return self._size
+
+
+class IndexedHeap:
+    """
+    A binary heap of item IDs ordered by priority, with a position map from each ID to its index in the heap.
+
+    The map lets `update` and `remove` find an item in O(1) and restore the heap in O(log n), so a changed priority
+    is updated in place instead of pushing a duplicate entry. The heap never holds stale entries.
+    """
+
+    def __init__(self, max_heap=False):
+        """
+        Initialize an empty heap.
+
+        Args:
+            max_heap (bool): If True, `pop` returns the highest priority; otherwise, the lowest.
+        """
+        self._ids = []
+        self._prios = []
+        self._pos = {}
+        self._higher = operator.gt if max_heap else operator.lt
+
+    def _sift_up(self, pos):
+        """
+        Move the item at `pos` towards the root, updating the position map.
+
+        Args:
+            pos (int): The index of the item.
+
+        Returns:
+            None
+        """
+        ids, prios, index, higher = self._ids, self._prios, self._pos, self._higher
+        item, prio = ids[pos], prios[pos]
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            if not higher(prio, prios[parent]):
+                break
+            ids[pos] = ids[parent]
+            prios[pos] = prios[parent]
+            index[ids[pos]] = pos
+            pos = parent
+        ids[pos] = item
+        prios[pos] = prio
+        index[item] = pos
+
+    def _sift_down(self, pos):
+        """
+        Move the item at `pos` towards the leaves, updating the position map.
+
+        Args:
+            pos (int): The index of the item.
+
+        Returns:
+            None
+        """
+        ids, prios, index, higher = self._ids, self._prios, self._pos, self._higher
+        n = len(ids)
+        item, prio = ids[pos], prios[pos]
+        child = 2 * pos + 1
+        while child < n:
+            right = child + 1
+            if right < n and higher(prios[right], prios[child]):
+                child = right
+            if not higher(prios[child], prio):
+                break
+            ids[pos] = ids[child]
+            prios[pos] = prios[child]
+            index[ids[pos]] = pos
+            pos = child
+            child = 2 * pos + 1
+        ids[pos] = item
+        prios[pos] = prio
+        index[item] = pos
+
+    def _remove_at(self, i):
+        """
+        Remove the item at index `i` and return its (id, priority) pair.
+
+        Args:
+            i (int): The index of the item.
+
+        Returns:
+            tuple: The removed (id, priority) pair.
+        """
+        ids, prios = self._ids, self._prios
+        item, prio = ids[i], prios[i]
+        del self._pos[item]
+        last, last_prio = ids.pop(), prios.pop()
+        if i < len(ids):
+            ids[i] = last
+            prios[i] = last_prio
+            if i > 0 and self._higher(last_prio, prios[(i - 1) >> 1]):
+                self._sift_up(i)
+            else:
+                self._sift_down(i)
+        return item, prio
+
+    def push(self, id, prio):
+        """
+        Insert an item with the given priority.
+
+        Args:
+            id (hashable): The item's ID.
+            prio (any): Its priority.
+
+        Returns:
+            None
+
+        Raises:
+            KeyError: If the ID is already in the heap (use `update`).
+        """
+        if id in self._pos:
+            raise KeyError(f"{id!r} is already in the heap")
+        self._ids.append(id)
+        self._prios.append(prio)
+        self._sift_up(len(self._ids) - 1)
+
+    def update(self, id, prio):
+        """
+        Change the priority of an item, in either direction.
+
+        Args:
+            id (hashable): The item's ID.
+            prio (any): Its new priority.
+
+        Returns:
+            None
+
+        Raises:
+            KeyError: If the ID is not in the heap.
+        """
+        i = self._pos[id]
+        old = self._prios[i]
+        self._prios[i] = prio
+        if self._higher(prio, old):
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def remove(self, id):
+        """
+        Remove an item.
+
+        Args:
+            id (hashable): The item's ID.
+
+        Returns:
+            any: The item's priority.
+
+        Raises:
+            KeyError: If the ID is not in the heap.
+        """
+        return self._remove_at(self._pos[id])[1]
+
+    def contains(self, id):
+        """
+        Check if an item is in the heap.
+
+        Args:
+            id (hashable): The item's ID.
+
+        Returns:
+            bool: True if the item is in the heap, False otherwise.
+        """
+        return id in self._pos
+
+    __contains__ = contains
+
+    def priority(self, id):
+        """
+        Return the priority of an item.
+
+        Args:
+            id (hashable): The item's ID.
+
+        Returns:
+            any: Its priority.
+
+        Raises:
+            KeyError: If the ID is not in the heap.
+        """
+        return self._prios[self._pos[id]]
+
+    def pop(self):
+        """
+        Remove and return the item with the lowest (or, for a max-heap, highest) priority.
+
+        Returns:
+            tuple: The (id, priority) pair.
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if not self._ids:
+            raise IndexError("pop from an empty heap")
+        return self._remove_at(0)
+
+    def peek(self):
+        """
+        Return the item `pop` would return, without removing it.
+
+        Returns:
+            tuple: The (id, priority) pair.
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if not self._ids:
+            raise IndexError("peek from an empty heap")
+        return self._ids[0], self._prios[0]
+
+    def __len__(self):
+        """
+        Return the number of items in the heap.
+
+        Returns:
+            int: The number of items.
+        """
+        return len(self._ids)
+
+
+class _SiftHeap:
+    """
+    Array-backed binary heap shared by `MaxHeap` and `MinHeap`.
+
+    The heap lives in `arr`. With a key function, the keys are cached in a parallel list so `key` runs once per item;
+    without one, that list is `arr` itself. Items are moved with a "hole" (the moving item is written once, at its
+    final position) instead of pairwise swaps.
+    """
+
+    _higher = None  # operator.gt for a max-heap, operator.lt for a min-heap
+
+    def __init__(self, iterable=None, key=None):
+        """
+        Initialize the heap.
+
+        Args:
+            iterable (iterable): Optional initial items, arranged in O(n) by `build`.
+            key (callable): Optional function computing the value each item is ordered by.
+        """
+        self.key = key
+        self.arr = []
+        self._keys = self.arr if key is None else []
+        if iterable is not None:
+            self.build(iterable)
+
+    def _sift_up(self, pos):
+        """
+        Move the item at `pos` towards the root until its parent has a higher priority.
+
+        Args:
+            pos (int): The index of the item.
+
+        Returns:
+            None
+        """
+        arr, keys, higher = self.arr, self._keys, self._higher
+        item, k = arr[pos], keys[pos]
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            if not higher(k, keys[parent]):
+                break
+            arr[pos] = arr[parent]
+            keys[pos] = keys[parent]
+            pos = parent
+        arr[pos] = item
+        keys[pos] = k
+
+    def _sift_down(self, pos):
+        """
+        Move the item at `pos` towards the leaves until no child has a higher priority.
+
+        Args:
+            pos (int): The index of the item.
+
+        Returns:
+            None
+        """
+        arr, keys, higher = self.arr, self._keys, self._higher
+        n = len(arr)
+        item, k = arr[pos], keys[pos]
+        child = 2 * pos + 1
+        while child < n:
+            right = child + 1
+            if right < n and higher(keys[right], keys[child]):
+                child = right
+            if not higher(keys[child], k):
+                break
+            arr[pos] = arr[child]
+            keys[pos] = keys[child]
+            pos = child
+            child = 2 * pos + 1
+        arr[pos] = item
+        keys[pos] = k
+
+    def heapify(self, arr, n, i):
+        """
+        Rearrange the elements below index `i` to maintain the heap property (iterative sift-down).
+
+        Args:
+            arr (list): The list of elements to heapify.
+            n (int): The size of the heap.
+            i (int): The index to be heapified.
+
+        Returns:
+            None
+        """
+        key = self.key or (lambda x: x)
+        higher = self._higher
+        item = arr[i]
+        k = key(item)
+        child = 2 * i + 1
+        while child < n:
+            if child + 1 < n and higher(key(arr[child + 1]), key(arr[child])):
+                child += 1
+            if not higher(key(arr[child]), k):
+                break
+            arr[i] = arr[child]
+            i = child
+            child = 2 * i + 1
+        arr[i] = item
+
+    def build(self, iterable):
+        """
+        Replace the contents with the items of `iterable`, arranged bottom-up in O(n).
+
+        Args:
+            iterable (iterable): The items.
+
+        Returns:
+            None
+        """
+        self.arr = list(iterable)
+        self._keys = self.arr if self.key is None else [self.key(item) for item in self.arr]
+        for i in range(len(self.arr) // 2 - 1, -1, -1):
+            self._sift_down(i)
+
+    def insert(self, newNum):
+        """
+        Insert a new item into the heap.
+
+        Args:
+            newNum (any): The item to be inserted.
+
+        Returns:
+            None
+        """
+        self.arr.append(newNum)
+        if self._keys is not self.arr:
+            self._keys.append(self.key(newNum))
+        self._sift_up(len(self.arr) - 1)
+
+    push = insert
+
+    def _remove_at(self, i):
+        """
+        Remove and return the item at index `i`, filling the gap with the last item.
+
+        Args:
+            i (int): The index of the item.
+
+        Returns:
+            any: The removed item.
+        """
+        arr, keys = self.arr, self._keys
+        last = arr.pop()
+        last_key = keys.pop() if keys is not arr else last
+        if i == len(arr):
+            return last
+        item = arr[i]
+        arr[i] = last
+        keys[i] = last_key
+        if i > 0 and self._higher(last_key, keys[(i - 1) >> 1]):
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+        return item
+
+    def deleteNode(self, num):
+        """
+        Delete an item from the heap. Finding it is a linear scan; restoring the heap is O(log n).
+
+        Args:
+            num (any): The item to be deleted. Nothing happens if it is not in the heap.
+
+        Returns:
+            None
+        """
+        try:
+            i = self.arr.index(num)
+        except ValueError:
+            return
+        self._remove_at(i)
+
+    def pop(self):
+        """
+        Remove and return the root item.
+
+        Returns:
+            any: The root item.
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if not self.arr:
+            raise IndexError("pop from an empty heap")
+        return self._remove_at(0)
+
+    def pushpop(self, item):
+        """
+        Push `item`, then pop and return the root, faster than `insert` followed by `pop`.
+
+        Args:
+            item (any): The item to push.
+
+        Returns:
+            any: The root after the push (`item` itself if it would become the root).
+        """
+        if not self.arr:
+            return item
+        k = item if self.key is None else self.key(item)
+        if not self._higher(self._keys[0], k):
+            return item
+        root = self.arr[0]
+        self.arr[0] = item
+        self._keys[0] = k
+        self._sift_down(0)
+        return root
+
+    def replace(self, item):
+        """
+        Pop and return the root, then push `item`, faster than `pop` followed by `insert`.
+
+        Args:
+            item (any): The item to push.
+
+        Returns:
+            any: The root before the push.
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if not self.arr:
+            raise IndexError("replace on an empty heap")
+        root = self.arr[0]
+        self.arr[0] = item
+        self._keys[0] = item if self.key is None else self.key(item)
+        self._sift_down(0)
+        return root
+
+    def __len__(self):
+        """
+        Return the number of items in the heap.
+
+        Returns:
+            int: The number of items.
+        """
+        return len(self.arr)
+
+    def printHeap(self):
+        """
+        Print the items of the heap in array order.
+
+        Returns:
+            None
+        """
+        print(self.arr)
+
+
+class MaxHeap(_SiftHeap):
+    """
+    A manual implementation of a max-heap.
+    """
+
+    _higher = staticmethod(operator.gt)
+
+    def getMax(self):
+        """
+        Return the maximum element from the max-heap.
+
+        Returns:
+            any: The maximum element.
+
+        Notes:
+            Returns None if the heap is empty.
+        """
+        return self.arr[0] if self.arr else None
+
+
+class MinHeap(_SiftHeap):
+    """
+    A manual implementation of a min-heap.
+    """
+
+    _higher = staticmethod(operator.lt)
+
+    def getMin(self):
+        """
+        Return the minimum element from the min-heap.
+
+        Returns:
+            any: The minimum element.
+
+        Notes:
+            Returns None if the heap is empty.
+        """
+        return self.arr[0] if self.arr else None
+
+
+# Example usage
+if __name__ == "__main__":
+    print("Testing Python Heap:")
+    py_heap = Heap(max_heap=True)
+    py_heap.push(3)
+    py_heap.push(1)
+    py_heap.push(5)
+    print(f"Heap after pushes: {py_heap}")
+    print(f"Peek: {py_heap.peek()}")
+    print(f"Pop: {py_heap.pop()}")
+    print(f"Heap after pop: {py_heap}")
+    words = Heap(max_heap=True, arity=4)
+    words.heapify(["pear", "apple", "fig", "plum"])
+    print(f"4-ary max-heap of strings: {[words.pop() for _ in range(len(words))]}")
+    # Expected output: 4-ary max-heap of strings: ['plum', 'pear', 'fig', 'apple']
+    print(Heap.top_k(iter([5, 1, 9, 3, 7]), 3), Heap.top_k(["bb", "a", "ccc"], 2, key=len, largest=False))
+    # Expected output: [9, 7, 5] ['a', 'bb']
+    print(list(Heap.merge_sorted([1, 4, 7], iter([2, 5]), [3, 6, 8, 9])))  # Expected output: [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    radix = RadixHeap()
+    for key in (7, 3, 12, 3):
+        radix.push(key, f"v{key}")
+    print(f"RadixHeap: {[radix.pop()[0] for _ in range(len(radix))]}")  # Expected output: RadixHeap: [3, 3, 7, 12]
+
+    print("\nTesting MaxHeap:")
+    max_heap = MaxHeap()
+    max_heap.insert(3)
+    max_heap.insert(1)
+    max_heap.insert(5)
+    max_heap.printHeap()
+    print(f"Max: {max_heap.getMax()}")
+    max_heap.deleteNode(5)
+    max_heap.printHeap()
+
+    print("\nTesting MinHeap:")
+    min_heap = MinHeap()
+    min_heap.insert(3)
+    min_heap.insert(1)
+    min_heap.insert(5)
+    min_heap.printHeap()
+    print(f"Min: {min_heap.getMin()}")
+    min_heap.deleteNode(1)
+    min_heap.printHeap()
+
+    print("\nTesting build, pushpop, replace and key:")
+    heap = MinHeap([5, 3, 8, 1, 9, 2])
+    print(heap.pop(), heap.pushpop(0), heap.replace(7), len(heap))  # Expected output: 1 0 2 5
+    tasks = MaxHeap([("write", 2), ("test", 5), ("ship", 1)], key=lambda task: task[1])
+    print([tasks.pop()[0] for _ in range(len(tasks))])  # Expected output: ['test', 'write', 'ship']
+
+    print("\nTesting IndexedHeap:")
+    queue = IndexedHeap()
+    for task, prio in (("a", 5), ("b", 3), ("c", 8)):
+        queue.push(task, prio)
+    queue.update("c", 1)
+    print(queue.remove("b"), "b" in queue, queue.pop(), len(queue))  # Expected output: 3 False ('c', 1) 1
@@ -0,0 +1,351 @@
+"""
+Binary Search Tree (BST) Implementation
+
+The Binary Search Tree (BST) is a data structure that stores elements in a sorted manner, allowing for efficient searching, insertion, and deletion operations.
+Each node in the BST has at most two children, with the left child having a smaller value and the right child having a larger value.
+
+BST Operations:
+1. **Insert**: Inserts a key into the BST while maintaining the BST property.
+2. **Search**: Searches for a key in the BST and returns True if the key is found, otherwise False.
+3. **Delete**: Deletes a key from the BST and maintains the BST property.
+4. **Inorder Traversal**: Returns a list of elements in the BST in ascending order.
+5. **Preorder Traversal**: Returns a list of elements in the BST following a preorder traversal (root, left, right).
+6. **Postorder Traversal**: Returns a list of elements in the BST following a postorder traversal (left, right, root).
+7. **Lazy Traversals**: `inorder()`, `preorder()` and `postorder()` are generators that yield one value at a time
+   without building a result list; iterating over the tree is an inorder traversal.
+8. **Bulk Build**: `BinarySearchTree.from_sorted(keys)` builds a perfectly balanced tree from sorted keys in O(n).
+
+Implementation Notes:
+    - Every operation is iterative (loops and explicit stacks, no recursion), so a degenerate tree, such as the one
+      built by inserting sorted keys, cannot raise `RecursionError`, however deep it is.
+    - `TreeNode` uses `__slots__`, which keeps each node small and attribute access fast.
+
+Time Complexity:
+    - **Insertion**: O(h), where h is the height of the tree. In the average case, it's O(log n), but in the worst case (unbalanced tree), it's O(n).
+    - **Search**: O(h), where h is the height of the tree. In the average case, it's O(log n), but in the worst case (unbalanced tree), it's O(n).
+    - **Deletion**: O(h), where h is the height of the tree. In the average case, it's O(log n), but in the worst case (unbalanced tree), it's O(n).
+    - **Traversal**: O(n), where n is the number of nodes in the tree, with O(h) extra memory for the stack.
+    - **from_sorted**: O(n).
+
+Applications:
+    - BSTs are used in various applications such as efficient searching, sorting, and maintaining ordered collections of data.
+
+"""
+
+class TreeNode:
+    """
+    A node in the Binary Search Tree.
+
+    Attributes:
+        value (int): The value of the node.
+        left (TreeNode): The left child of the node.
+        right (TreeNode): The right child of the node.
+    """
+
+    __slots__ = ("left", "right", "value")
+
+    def __init__(self, key: int):
+        """
+        Initialize a new TreeNode with the given key.
+
+        Args:
+            key (int): The value to be stored in the node.
+        """
+        self.left = None
+        self.right = None
+        self.value = key
+
+
+class BinarySearchTree:
+    """
+    A Binary Search Tree (BST) implementation.
+
+    Attributes:
+        root (TreeNode): The root node of the BST.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty Binary Search Tree.
+        """
+        self.root = None
+
+    @classmethod
+    def from_sorted(cls, keys) -> "BinarySearchTree":
+        """
+        Build a perfectly balanced BST from keys in ascending order, in O(n) and without recursion.
+
+        Every subtree takes the middle key of its range as its root, so the height is ceil(log2(n + 1)).
+
+        Args:
+            keys (iterable): The keys, in ascending order (duplicates allowed).
+
+        Returns:
+            BinarySearchTree: The new tree.
+
+        Raises:
+            ValueError: If the keys are not in ascending order.
+        """
+        keys = list(keys)
+        for i in range(1, len(keys)):
+            if keys[i] < keys[i - 1]:
+                raise ValueError("keys must be in ascending order")
+        tree = cls()
+        if not keys:
+            return tree
+        mid = (len(keys) - 1) // 2
+        tree.root = TreeNode(keys[mid])
+        # (first index, last index, parent, is_left) of every range still to be built
+        stack = [(0, mid - 1, tree.root, True), (mid + 1, len(keys) - 1, tree.root, False)]
+        while stack:
+            lo, hi, parent, is_left = stack.pop()
+            if lo > hi:
+                continue
+            mid = (lo + hi) // 2
+            node = TreeNode(keys[mid])
+            if is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            stack.append((lo, mid - 1, node, True))
+            stack.append((mid + 1, hi, node, False))
+        return tree
+
+    def insert(self, key: int) -> None:
+        """
+        Insert a key into the BST. Equal keys go to the right subtree.
+
+        Args:
+            key (int): The value to be inserted into the BST.
+
+        Returns:
+            None
+        """
+        node = TreeNode(key)
+        current = self.root
+        if current is None:
+            self.root = node
+            return
+        while True:
+            if key < current.value:
+                if current.left is None:
+                    current.left = node
+                    return
+                current = current.left
+            else:
+                if current.right is None:
+                    current.right = node
+                    return
+                current = current.right
+
+    def search(self, key: int) -> bool:
+        """
+        Search for a key in the BST.
+
+        Args:
+            key (int): The value to search for.
+
+        Returns:
+            bool: True if the key is found, otherwise False.
+        """
+        current = self.root
+        while current is not None:
+            value = current.value
+            if key == value:
+                return True
+            current = current.left if key < value else current.right
+        return False
+
+    __contains__ = search
+
+    def delete(self, key: int) -> None:
+        """
+        Delete a key from the BST. Nothing happens if the key is absent.
+
+        Args:
+            key (int): The value to be deleted from the BST.
+
+        Returns:
+            None
+        """
+        parent, node = None, self.root
+        while node is not None and node.value != key:
+            parent, node = node, (node.left if key < node.value else node.right)
+        if node is None:
+            return
+        if node.left is not None and node.right is not None:
+            # Node with two children: copy the inorder successor's value, then unlink the successor instead
+            successor_parent, successor = node, node.right
+            while successor.left is not None:
+                successor_parent, successor = successor, successor.left
+            node.value = successor.value
+            parent, node = successor_parent, successor
+        # Node with only one child or no child
+        child = node.left if node.left is not None else node.right
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+
+    def _min_value_node(self, node: TreeNode) -> TreeNode:
+        """
+        Get the node with the smallest value greater than the given node.
+
+        Args:
+            node (TreeNode): The node to start from.
+
+        Returns:
+            TreeNode: The node with the smallest value.
+        """
+        current = node
+        while current.left is not None:
+            current = current.left
+        return current
+
+    def inorder(self):
+        """
+        Iterate over the values in ascending order, using an explicit stack of at most h nodes.
+
+        Yields:
+            int: Each value.
+        """
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    __iter__ = inorder
+
+    def preorder(self):
+        """
+        Iterate over the values in preorder (root, left, right), using an explicit stack.
+
+        Yields:
+            int: Each value.
+        """
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            yield node.value
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def postorder(self):
+        """
+        Iterate over the values in postorder (left, right, root), using an explicit stack.
+
+        Yields:
+            int: Each value.
+        """
+        stack = []
+        node, last = self.root, None
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            top = stack[-1]
+            if top.right is not None and top.right is not last:
+                node = top.right
+            else:
+                yield top.value
+                last = stack.pop()
+
+    def inorder_traversal(self) -> list[int]:
+        """
+        Perform an inorder traversal of the BST.
+
+        Returns:
+            list[int]: A list of values in the BST in ascending order.
+        """
+        return list(self.inorder())
+
+    def preorder_traversal(self) -> list[int]:
+        """
+        Perform a preorder traversal of the BST.
+
+        Returns:
+            list[int]: A list of values in the BST following preorder traversal.
+        """
+        return list(self.preorder())
+
+    def postorder_traversal(self) -> list[int]:
+        """
+        Perform a postorder traversal of the BST.
+
+        Returns:
+            list[int]: A list of values in the BST following postorder traversal.
+        """
+        return list(self.postorder())
+
+    def height(self) -> int:
+        """
+        Return the height of the tree (0 when empty), level by level.
+
+        Returns:
+            int: The number of levels.
+        """
+        level = [self.root] if self.root is not None else []
+        height = 0
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right) if child is not None]
+        return height
+
+if __name__ == "__main__":
+    # Create a Binary Search Tree instance
+    bst = BinarySearchTree()
+
+    # Insert elements
+    print("Inserting elements:")
+    elements = [10, 5, 20, 3, 7, 15, 25]
+    for elem in elements:
+        bst.insert(elem)
+        print(f"Inserted {elem}")
+
+    # Print inorder traversal (should be sorted)
+    print("\nInorder Traversal:")
+    print(bst.inorder_traversal())  # Expected: [3, 5, 7, 10, 15, 20, 25]
+
+    # Print preorder traversal
+    print("\nPreorder Traversal:")
+    print(bst.preorder_traversal())  # Expected: [10, 5, 3, 7, 20, 15, 25]
+
+    # Print postorder traversal
+    print("\nPostorder Traversal:")
+    print(bst.postorder_traversal())  # Expected: [3, 7, 5, 15, 25, 20, 10]
+
+    # Search for elements
+    print("\nSearching for elements:")
+    search_keys = [7, 30]
+    for key in search_keys:
+        found = bst.search(key)
+        print(f"Search for {key}: {'Found' if found else 'Not Found'}")
+
+    # Delete elements
+    print("\nDeleting elements:")
+    delete_keys = [5, 20, 10]
+    for key in delete_keys:
+        bst.delete(key)
+        print(f"Deleted {key}")
+
+    # Print inorder traversal after deletions
+    print("\nInorder Traversal after deletions:")
+    print(bst.inorder_traversal())  # Expected: [3, 7, 15, 25]
+
+    # Sorted insertion makes a 5000-level tree; no recursion, so no RecursionError
+    chain = BinarySearchTree()
+    for key in range(5000):
+        chain.insert(key)
+    print(f"\nDegenerate tree: height {chain.height()}, sum {sum(chain)}")  # Expected: height 5000, sum 12497500
+
+    balanced = BinarySearchTree.from_sorted(range(100000))
+    print(f"from_sorted: height {balanced.height()}, {99999 in balanced}")  # Expected: height 17, True
\ No newline at end of file
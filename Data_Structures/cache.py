@@ -0,0 +1,457 @@
+"""
+LRU, LFU and TTL Caches
+
+This module implements bounded key-value caches that pair a `DoublyLinkedList` with a dict from key to list node. The dict
+finds an entry in O(1), and since the entry *is* the list node, `removeNode`/`moveToEnd` reorder it in O(1) without the
+O(n) positional `deleteNode`.
+
+Policies:
+1. **LRUCache**: One list in recency order. A hit moves the entry to the end; the head (least recently used) is evicted.
+2. **LFUCache**: One list per access count ("frequency bucket") plus the lowest count in use. A hit moves the entry
+   to the next bucket; the eviction victim is the least recently used entry of the lowest bucket.
+3. **TTLCache**: Entries expire `ttl` seconds after they were last put. The list is in put order, which is also expiry
+   order, so expired entries are always at the head and purging them never scans live entries.
+
+LRUCache and LFUCache also take an optional `ttl`; their expired entries are dropped when they are looked up or when
+`expire()` is called.
+
+Sizing and bookkeeping:
+- `maxsize` bounds the number of entries. `max_bytes` additionally bounds the sum of `size_fn(value)` over all entries
+  (`sys.getsizeof` by default). A value larger than `max_bytes` on its own is not cached.
+- `on_evict(key, value)` is called for every entry removed by the cache itself (eviction or expiry), not for `pop` or `clear`.
+- `hits`, `misses`, `evictions` and `expirations` are counted; `stats()` returns them with the current sizes.
+
+`memoize` is a decorator that caches a function's results in one of these caches.
+
+Time Complexity:
+- `get` / `put` / `pop` / `__contains__`: O(1) (amortized for LFU and TTL)
+- `expire`: O(n) for LRUCache and LFUCache, O(k) for TTLCache, where k is the number of expired entries
+- `clear`: O(1)
+
+Applications:
+Memoizing expensive functions, caching database rows or rendered pages, DNS and session caches with expiry, and
+keeping hot objects in memory under a byte budget.
+"""
+
+import functools
+import sys
+import time
+
+from Data_Structures.linked_list import Double_Node, DoublyLinkedList
+
+_MISSING = object()
+_KWARGS_MARK = object()
+
+
+class _Entry(Double_Node):
+    """
+    A cache entry, linked directly into the policy's list. `data` holds the cached value.
+    """
+
+    __slots__ = ("key", "size", "expires", "freq")
+
+
+class _Cache:
+    """
+    Storage, sizing, expiry and counters shared by every policy.
+
+    Subclasses provide `_link(entry)`, `_unlink(entry)`, `_touch(entry)` (called on a hit) and `_victim()`.
+    """
+
+    def __init__(self, maxsize: int = 128, max_bytes: int = None, size_fn=None, on_evict=None, ttl: float = None,
+                 timer=time.monotonic):
+        """
+        Initializes an empty cache.
+
+        Args:
+            maxsize (int): The maximum number of entries.
+            max_bytes (int or None): The maximum total size of the values, or None for no limit.
+            size_fn (callable or None): Returns the size of a value. Defaults to `sys.getsizeof`.
+            on_evict (callable or None): Called as `on_evict(key, value)` when the cache evicts or expires an entry.
+            ttl (float or None): Seconds an entry stays valid after it is put, or None to never expire.
+            timer (callable): Returns the current time in seconds.
+
+        Raises:
+            ValueError: If `maxsize` is less than 1.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.size_fn = size_fn or sys.getsizeof
+        self.on_evict = on_evict
+        self.ttl = ttl
+        self.timer = timer
+        self.currsize = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._index = {}
+
+    def __len__(self) -> int:
+        """
+        Returns the number of entries, including expired ones that have not been dropped yet.
+
+        Returns:
+            int: The number of entries.
+        """
+        return len(self._index)
+
+    def __contains__(self, key: any) -> bool:
+        """
+        Checks if `key` has a live entry, without counting a hit or miss or changing its priority.
+
+        Args:
+            key (any): The key to look up.
+
+        Returns:
+            bool: True if the key is cached and not expired, False otherwise.
+        """
+        entry = self._index.get(key)
+        return entry is not None and (entry.expires is None or entry.expires > self.timer())
+
+    def get(self, key: any, default: any = None) -> any:
+        """
+        Returns the value cached for `key`, counting a hit or a miss.
+
+        Args:
+            key (any): The key to look up.
+            default (any): Returned when the key is missing or expired.
+
+        Returns:
+            any: The cached value, or `default`.
+        """
+        entry = self._index.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        if entry.expires is not None and entry.expires <= self.timer():
+            self._discard(entry, expired=True)
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(entry)
+        return entry.data
+
+    def put(self, key: any, value: any) -> None:
+        """
+        Caches `value` under `key`, evicting entries as needed to stay within `maxsize` and `max_bytes`.
+
+        Args:
+            key (any): The key.
+            value (any): The value.
+
+        Returns:
+            None
+        """
+        size = 0 if self.max_bytes is None else self.size_fn(value)
+        entry = self._index.pop(key, None)
+        if entry is not None:
+            self._unlink(entry)
+            self.currsize -= entry.size
+            entry.freq += 1
+        if self.max_bytes is not None and size > self.max_bytes:
+            return  # too large to cache at all; an older value for the key is dropped too
+        if entry is None:
+            entry = _Entry(value)
+            entry.key = key
+            entry.freq = 1
+        entry.data = value
+        entry.size = size
+        entry.expires = None if self.ttl is None else self.timer() + self.ttl
+        index = self._index
+        while index and (len(index) >= self.maxsize or
+                         (self.max_bytes is not None and self.currsize + size > self.max_bytes)):
+            self._discard(self._victim(), expired=False)
+        index[key] = entry
+        self._link(entry)
+        self.currsize += size
+
+    def pop(self, key: any, default: any = None) -> any:
+        """
+        Removes the entry for `key` and returns its value. `on_evict` is not called.
+
+        Args:
+            key (any): The key to remove.
+            default (any): Returned when the key is missing or expired.
+
+        Returns:
+            any: The removed value, or `default`.
+        """
+        entry = self._index.pop(key, None)
+        if entry is None:
+            return default
+        self._unlink(entry)
+        self.currsize -= entry.size
+        if entry.expires is not None and entry.expires <= self.timer():
+            return default
+        return entry.data
+
+    def expire(self) -> int:
+        """
+        Drops every expired entry.
+
+        Returns:
+            int: The number of entries dropped.
+        """
+        if self.ttl is None:
+            return 0
+        now = self.timer()
+        expired = [entry for entry in self._index.values() if entry.expires <= now]
+        for entry in expired:
+            self._discard(entry, expired=True)
+        return len(expired)
+
+    def clear(self) -> None:
+        """
+        Removes every entry. The counters are kept. `on_evict` is not called.
+
+        Returns:
+            None
+        """
+        self._index = {}
+        self.currsize = 0
+        self._reset()
+
+    def stats(self) -> dict:
+        """
+        Returns the counters and current sizes.
+
+        Returns:
+            dict: `hits`, `misses`, `hit_rate`, `evictions`, `expirations`, `entries`, `currsize`, `maxsize` and `max_bytes`.
+        """
+        lookups = self.hits + self.misses
+        return dict(hits=self.hits, misses=self.misses, hit_rate=self.hits / lookups if lookups else 0.0,
+                    evictions=self.evictions, expirations=self.expirations, entries=len(self._index),
+                    currsize=self.currsize, maxsize=self.maxsize, max_bytes=self.max_bytes)
+
+    def _discard(self, entry: _Entry, expired: bool) -> None:
+        """
+        Removes an entry on the cache's own initiative, counting it and calling `on_evict`.
+
+        Args:
+            entry (_Entry): The entry to remove.
+            expired (bool): True if the entry expired, False if it was evicted to make room.
+
+        Returns:
+            None
+        """
+        del self._index[entry.key]
+        self._unlink(entry)
+        self.currsize -= entry.size
+        if expired:
+            self.expirations += 1
+        else:
+            self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(entry.key, entry.data)
+
+
+class LRUCache(_Cache):
+    def __init__(self, maxsize: int = 128, max_bytes: int = None, size_fn=None, on_evict=None, ttl: float = None,
+                 timer=time.monotonic):
+        """
+        Initializes an empty least-recently-used cache. See `_Cache.__init__` for the arguments.
+        """
+        super().__init__(maxsize, max_bytes, size_fn, on_evict, ttl, timer)
+        self._reset()
+
+    def _reset(self) -> None:
+        self._order = DoublyLinkedList()  # least recently used at the head
+
+    def _link(self, entry: _Entry) -> None:
+        self._order.appendNode(entry)
+
+    def _unlink(self, entry: _Entry) -> None:
+        self._order.removeNode(entry)
+
+    def _touch(self, entry: _Entry) -> None:
+        self._order.moveToEnd(entry)
+
+    def _victim(self) -> _Entry:
+        return self._order.head
+
+
+class TTLCache(LRUCache):
+    def __init__(self, ttl: float, maxsize: int = 128, max_bytes: int = None, size_fn=None, on_evict=None,
+                 timer=time.monotonic):
+        """
+        Initializes an empty cache whose entries expire `ttl` seconds after they were last put.
+
+        Hits do not extend an entry's life. When the cache is full, the entry closest to expiry is evicted.
+        See `_Cache.__init__` for the other arguments.
+
+        Args:
+            ttl (float): Seconds an entry stays valid after it is put.
+        """
+        super().__init__(maxsize, max_bytes, size_fn, on_evict, ttl, timer)
+
+    def _touch(self, entry: _Entry) -> None:
+        pass
+
+    def put(self, key: any, value: any) -> None:
+        """
+        Drops the expired entries at the head of the list, then caches `value` under `key`.
+
+        Args:
+            key (any): The key.
+            value (any): The value.
+
+        Returns:
+            None
+        """
+        self.expire()
+        super().put(key, value)
+
+    def expire(self) -> int:
+        """
+        Drops every expired entry. They are all at the head of the list, so live entries are never visited.
+
+        Returns:
+            int: The number of entries dropped.
+        """
+        now = self.timer()
+        count = 0
+        head = self._order.head
+        while head is not None and head.expires <= now:
+            self._discard(head, expired=True)
+            head = self._order.head
+            count += 1
+        return count
+
+
+class LFUCache(_Cache):
+    def __init__(self, maxsize: int = 128, max_bytes: int = None, size_fn=None, on_evict=None, ttl: float = None,
+                 timer=time.monotonic):
+        """
+        Initializes an empty least-frequently-used cache. Ties are broken by evicting the least recently used entry.
+        See `_Cache.__init__` for the arguments.
+        """
+        super().__init__(maxsize, max_bytes, size_fn, on_evict, ttl, timer)
+        self._reset()
+
+    def _reset(self) -> None:
+        self._buckets = {}  # access count -> DoublyLinkedList of entries, least recently used at the head
+        self._min_freq = None  # lowest access count in use, None when unknown
+
+    def _link(self, entry: _Entry) -> None:
+        bucket = self._buckets.get(entry.freq)
+        if bucket is None:
+            bucket = self._buckets[entry.freq] = DoublyLinkedList()
+        bucket.appendNode(entry)
+        if entry.freq == 1 or (self._min_freq is not None and entry.freq < self._min_freq):
+            self._min_freq = entry.freq
+
+    def _unlink(self, entry: _Entry) -> None:
+        bucket = self._buckets[entry.freq]
+        bucket.removeNode(entry)
+        if bucket.length == 0:
+            del self._buckets[entry.freq]
+            if entry.freq == self._min_freq:
+                self._min_freq = None
+
+    def _touch(self, entry: _Entry) -> None:
+        freq = entry.freq
+        emptied_min = self._buckets[freq].length == 1 and freq == self._min_freq
+        self._unlink(entry)
+        entry.freq = freq + 1
+        self._link(entry)
+        if emptied_min:
+            self._min_freq = freq + 1
+
+    def _victim(self) -> _Entry:
+        if self._min_freq is None:
+            self._min_freq = min(self._buckets)
+        return self._buckets[self._min_freq].head
+
+
+_POLICIES = {"lru": LRUCache, "lfu": LFUCache}
+
+
+def memoize(maxsize=128, policy: str = "lru", ttl: float = None, **options):
+    """
+    Decorator that caches a function's results, keyed by its arguments.
+
+    Can be used bare (`@memoize`) or with arguments (`@memoize(maxsize=1024, policy="lfu")`). The wrapper exposes the
+    cache as `wrapper.cache` and `wrapper.cache_clear()`. Arguments must be hashable.
+
+    Args:
+        maxsize (int): The maximum number of cached results.
+        policy (str): "lru" or "lfu". With `ttl` and policy "ttl", a TTLCache is used.
+        ttl (float or None): Seconds a result stays valid, or None to never expire.
+        **options: Passed on to the cache (`max_bytes`, `size_fn`, `on_evict`, `timer`).
+
+    Returns:
+        callable: The decorator, or the decorated function when used bare.
+
+    Raises:
+        ValueError: If `policy` is unknown, or is "ttl" without a `ttl`.
+    """
+    if callable(maxsize):
+        return memoize()(maxsize)
+    if policy == "ttl":
+        if ttl is None:
+            raise ValueError("policy 'ttl' needs a ttl")
+        make_cache = functools.partial(TTLCache, ttl, maxsize, **options)
+    elif policy in _POLICIES:
+        make_cache = functools.partial(_POLICIES[policy], maxsize, ttl=ttl, **options)
+    else:
+        raise ValueError(f"unknown cache policy {policy!r}")
+
+    def decorator(fn):
+        cache = make_cache()
+        get, put = cache.get, cache.put
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = args if not kwargs else args + (_KWARGS_MARK,) + tuple(kwargs.items())
+            value = get(key, _MISSING)
+            if value is _MISSING:
+                value = fn(*args, **kwargs)
+                put(key, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+if __name__ == "__main__":
+    evicted = []
+    lru = LRUCache(maxsize=2, on_evict=lambda key, value: evicted.append(key))
+    lru.put("a", 1)
+    lru.put("b", 2)
+    lru.get("a")
+    lru.put("c", 3)  # evicts "b", the least recently used
+    print(evicted, "a" in lru, "b" in lru)  # Expected output: ['b'] True False
+
+    lfu = LFUCache(maxsize=2)
+    lfu.put("x", 1)
+    lfu.put("y", 2)
+    lfu.get("x")
+    lfu.get("x")
+    lfu.get("y")
+    lfu.put("z", 3)  # evicts "y", used less often than "x"
+    print("x" in lfu, "y" in lfu, "z" in lfu)  # Expected output: True False True
+
+    now = [0.0]
+    ttl = TTLCache(ttl=10, timer=lambda: now[0])
+    ttl.put("session", "alice")
+    now[0] = 11.0
+    print(ttl.get("session", "expired"))  # Expected output: expired
+
+    sized = LRUCache(maxsize=100, max_bytes=10, size_fn=len)
+    sized.put("k1", "aaaa")
+    sized.put("k2", "bbbb")
+    sized.put("k3", "cccc")  # 12 bytes would not fit: evicts "k1"
+    print(sized.stats()["currsize"], "k1" in sized)  # Expected output: 8 False
+
+    @memoize(maxsize=256)
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    print(fib(80))  # Expected output: 23416728348467685
+    print(fib.cache.stats()["misses"])  # Expected output: 81
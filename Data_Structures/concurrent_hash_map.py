@@ -0,0 +1,310 @@
+"""
+Concurrent Hash Map (lock striping)
+
+A thread-safe variant of `SimpleHashMap` that splits its keys across N independent segments. Each segment is an
+`OpenAddressingTable` guarded by its own lock, so threads working on keys in different segments never wait for each
+other, and a single global lock no longer serializes every operation.
+
+How it works:
+1. **Striping**: A key's segment is picked from the high bits of a mixed hash, so the segments and each segment's own
+   slot index (the low bits) use independent parts of the hash.
+2. **Atomic compound operations**: `get_or_insert`, `compute_if_absent` and `update` run entirely under the key's
+   segment lock, so no other thread can slip in between the lookup and the write.
+3. **Per-segment resize**: Every segment grows on its own (incrementally, see `OpenAddressingTable`), holding only
+   its own lock, while the other segments keep serving requests.
+4. **Weakly consistent iteration**: `items()`, `keys()` and iteration copy one segment at a time under that segment's
+   lock and yield from the copy. Writers are only blocked while a single segment is copied, never while the caller
+   consumes items. Each segment is seen as it was at some moment during the iteration, so concurrent changes may or
+   may not be reflected, but no key is seen twice.
+
+The functions passed to `compute_if_absent` and `update` run while the segment lock is held, so they must not use the
+map themselves.
+
+Time Complexity:
+- `get` / `put` / `pop` / `get_or_insert` / `compute_if_absent` / `update`: O(1) average, plus lock acquisition
+- `len`: O(number of segments)
+- Iteration: O(n)
+
+Applications:
+Shared caches and counters in thread pools, request de-duplication, and indexes filled by several worker threads.
+"""
+
+import threading
+
+from Data_Structures.hash_tables import OpenAddressingTable
+
+_MISSING = object()
+_MIX = 0x9E3779B97F4A7C15  # 2**64 / golden ratio, spreads the hash bits before the segment is picked
+_MASK64 = (1 << 64) - 1
+
+
+class ConcurrentHashMap:
+    def __init__(self, segments: int = 16, capacity: int = 8, max_load_factor: float = 0.7,
+                 probing: str = "linear"):
+        """
+        Initializes an empty map.
+
+        Args:
+            segments (int): The number of independently locked segments. Rounded up to a power of two.
+            capacity (int): The number of items the whole map should hold before any segment resizes.
+            max_load_factor (float): Passed to each segment's `OpenAddressingTable`.
+            probing (str): Passed to each segment's `OpenAddressingTable`.
+
+        Raises:
+            ValueError: If `segments` is less than 1.
+        """
+        if segments < 1:
+            raise ValueError("segments must be at least 1")
+        count = 1
+        while count < segments:
+            count *= 2
+        self._shift = 64 - (count.bit_length() - 1)  # the top log2(count) bits of the mixed hash pick the segment
+        per_segment = -(-capacity // count)
+        self._segments = [(threading.Lock(), OpenAddressingTable(per_segment, max_load_factor, probing))
+                          for _ in range(count)]
+
+    def _segment(self, key: any) -> tuple:
+        """
+        Returns the (lock, table) segment that owns `key`.
+        """
+        return self._segments[(hash(key) * _MIX & _MASK64) >> self._shift]
+
+    def get(self, key: any, default: any = None) -> any:
+        """
+        Returns the value of `key`.
+
+        Args:
+            key (any): The key to look up.
+            default (any): Returned if the key is absent.
+
+        Returns:
+            any: The value, or `default`.
+        """
+        lock, table = self._segment(key)
+        with lock:
+            return table.get(key, default)
+
+    def put(self, key: any, value: any) -> None:
+        """
+        Inserts `key` or replaces its value.
+
+        Args:
+            key (any): A hashable key.
+            value (any): The value.
+
+        Returns:
+            None
+        """
+        lock, table = self._segment(key)
+        with lock:
+            table.put(key, value)
+
+    def pop(self, key: any, default: any = None) -> any:
+        """
+        Removes `key` and returns its value.
+
+        Args:
+            key (any): The key to remove.
+            default (any): Returned if the key is absent.
+
+        Returns:
+            any: The removed value, or `default`.
+        """
+        lock, table = self._segment(key)
+        with lock:
+            return table.pop(key, default)
+
+    def get_or_insert(self, key: any, value: any) -> any:
+        """
+        Atomically returns the value of `key`, inserting `value` first if the key is absent.
+
+        Args:
+            key (any): A hashable key.
+            value (any): The value to insert if the key is absent.
+
+        Returns:
+            any: The value now stored for `key`.
+        """
+        lock, table = self._segment(key)
+        with lock:
+            current = table.get(key, _MISSING)
+            if current is _MISSING:
+                table.put(key, value)
+                return value
+            return current
+
+    def compute_if_absent(self, key: any, fn) -> any:
+        """
+        Atomically returns the value of `key`, storing `fn(key)` first if the key is absent.
+
+        `fn` is called at most once per missing key, even when several threads ask for the same key at the same time.
+        If `fn` raises, nothing is stored.
+
+        Args:
+            key (any): A hashable key.
+            fn (callable): Computes the value from the key. It must not use this map.
+
+        Returns:
+            any: The value now stored for `key`.
+        """
+        lock, table = self._segment(key)
+        with lock:
+            current = table.get(key, _MISSING)
+            if current is _MISSING:
+                current = fn(key)
+                table.put(key, current)
+            return current
+
+    def update(self, key: any, fn, default: any = None) -> any:
+        """
+        Atomically replaces the value of `key` with `fn(value)`, using `fn(default)` if the key is absent.
+
+        Args:
+            key (any): A hashable key.
+            fn (callable): Computes the new value from the current one. It must not use this map.
+            default (any): The value passed to `fn` when the key is absent.
+
+        Returns:
+            any: The new value.
+        """
+        lock, table = self._segment(key)
+        with lock:
+            value = fn(table.get(key, default))
+            table.put(key, value)
+            return value
+
+    def __contains__(self, key: any) -> bool:
+        """
+        Checks if `key` is in the map.
+
+        Args:
+            key (any): The key to look up.
+
+        Returns:
+            bool: True if the key is present, False otherwise.
+        """
+        lock, table = self._segment(key)
+        with lock:
+            return key in table
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items, summed segment by segment (weakly consistent under concurrent writes).
+
+        Returns:
+            int: The number of items.
+        """
+        return sum(len(table) for _, table in self._segments)
+
+    def items(self):
+        """
+        Iterates over the (key, value) pairs, one segment snapshot at a time (weakly consistent).
+
+        Yields:
+            tuple: Each (key, value) pair.
+        """
+        for lock, table in self._segments:
+            with lock:
+                snapshot = list(table.items())
+            yield from snapshot
+
+    def keys(self):
+        """
+        Iterates over the keys, one segment snapshot at a time (weakly consistent).
+
+        Yields:
+            any: Each key.
+        """
+        for key, _ in self.items():
+            yield key
+
+    def __iter__(self):
+        """
+        Iterates over the keys (weakly consistent).
+
+        Yields:
+            any: Each key.
+        """
+        return self.keys()
+
+    def insert_data(self, key: int, data: any) -> None:
+        """
+        Insert data into the hash map with the given key.
+
+        Args:
+            key (int): The key for the data.
+            data (any): The data to be stored.
+
+        Returns:
+            None
+        """
+        self.put(key, data)
+
+    def remove_data(self, key: int) -> None:
+        """
+        Remove data from the hash map with the given key.
+
+        Args:
+            key (int): The key for the data to be removed.
+
+        Returns:
+            None
+        """
+        self.pop(key)
+
+    def get_data(self, key: int) -> any:
+        """
+        Retrieve data from the hash map using the given key.
+
+        Args:
+            key (int): The key for the data to be retrieved.
+
+        Returns:
+            any: The data associated with the key, or None if the key does not exist.
+        """
+        return self.get(key)
+
+    def print_table(self) -> None:
+        """
+        Print all key-value pairs in the hash map.
+
+        Returns:
+            None
+        """
+        for key, data in self.items():
+            print(f'{key}: {data}')
+
+    def stats(self) -> list:
+        """
+        Returns each segment's `OpenAddressingTable.stats()`, showing how items and resizes spread across segments.
+
+        Returns:
+            list: One dict per segment.
+        """
+        result = []
+        for lock, table in self._segments:
+            with lock:
+                result.append(table.stats())
+        return result
+
+
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    counts = ConcurrentHashMap(segments=8)
+
+    def count_words(words):
+        for word in words:
+            counts.update(word, lambda n: n + 1, 0)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(count_words, [["a", "b", "a"]] * 1000))
+    print(counts.get("a"), counts.get("b"))  # Expected output: 2000 1000
+
+    calls = []
+    squares = ConcurrentHashMap()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: squares.compute_if_absent(12, lambda k: calls.append(k) or k * k), range(100)))
+    print(squares.get(12), len(calls))  # Expected output: 144 1
+    print(squares.get_or_insert(12, 0), squares.get_or_insert(13, 0))  # Expected output: 144 0
+    print(sorted(squares.keys()))  # Expected output: [12, 13]
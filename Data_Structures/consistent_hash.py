@@ -0,0 +1,516 @@
+"""
+Consistent Hashing Ring
+
+Maps keys to nodes (shards, workers) so that adding or removing a node moves only the keys that node gains or loses,
+about 1/N of them, instead of reshuffling nearly every key as `hash(key) % N` does when N changes.
+
+How it works:
+1. **Ring**: Every node owns several points ("virtual nodes", or tokens) on a 64-bit hash ring. A key belongs to the
+   first token at or after its own hash, wrapping around at the end.
+2. **Virtual nodes**: Many tokens per node (`vnodes`, 160 by default) even out the ring segments each node owns, and
+   spread a leaving node's keys over all remaining nodes instead of a single neighbour.
+3. **Weights**: A node with weight w gets `round(vnodes * w)` tokens, and so a proportional share of the keys.
+4. **Lookup**: The tokens are kept in a sorted list with a parallel list of owners, so `locate` is one `bisect`,
+   O(log V) for V tokens. `locate_many` hashes a whole batch and resolves it in one loop.
+5. **Bounded loads**: `locate_many(keys, load_factor=c)` caps every node at `ceil(c * len(keys) * share)` keys of the
+   batch. A key whose node is full walks clockwise to the next token whose node has room ("consistent hashing with
+   bounded loads"), so no node gets more than c times its fair share of a skewed batch.
+6. **Stable hashes**: Keys and tokens are hashed with BLAKE2b rather than `hash()`, which is randomized per process
+   for strings, so every worker process computes the same placement. Numbers are normalised first, so keys that
+   compare equal (`1`, `1.0`, `True`, `Fraction(1)`, `Decimal(1)`) land on the same node, as they are one key in a
+   shard. Other keys are hashed by `repr`, so equal keys must have equal reprs (complex numbers, and values that are
+   neither integral nor exact floats, such as `Decimal("0.1")` == `Fraction(1, 10)`, are not normalised).
+
+`ShardedHashMap` routes `insert_data` / `get_data` / `remove_data` to one `SimpleHashMap` per node and moves only the
+affected entries when nodes join or leave. `plan_join` and `plan_leave` list which keys would move, and between which
+nodes, before anything is changed.
+
+Time Complexity:
+- `locate`: O(log V)
+- `locate_many`: O(k log V) for k keys
+- `add_node` / `remove_node`: O(V log V) to rebuild the token list
+- `plan_join` / `plan_leave`: O(k log V)
+
+Applications:
+Sharding caches and key-value stores, partitioning work across worker processes, and distributed hash tables.
+"""
+
+import hashlib
+import numbers
+from bisect import bisect_left
+from decimal import Decimal
+from math import ceil, isfinite
+
+from Data_Structures.hash_tables import SimpleHashMap
+
+
+def _hash(key: any) -> int:
+    """
+    Returns a 64-bit hash of `key` that is the same in every process.
+
+    Args:
+        key (any): bytes, str, a real number, or any value with a deterministic `repr`.
+
+    Returns:
+        int: The hash.
+    """
+    if isinstance(key, bytes):
+        data = b"b" + key
+    elif isinstance(key, str):
+        data = b"s" + key.encode("utf-8")
+    else:
+        if isinstance(key, (numbers.Real, Decimal)) and type(key) is not int and isfinite(key):
+            # equal numbers must hash alike: True -> 1, 2.0 -> 2, Decimal(2) -> 2, Fraction(1, 2) -> 0.5
+            if key == int(key):
+                key = int(key)
+            elif float(key) == key:
+                key = float(key)
+        data = b"r" + repr(key).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+class HashRing:
+    def __init__(self, nodes=(), vnodes: int = 160):
+        """
+        Initializes a ring.
+
+        Args:
+            nodes (iterable): Initial nodes, each with weight 1. A node is any value with a deterministic `repr`,
+                typically a name.
+            vnodes (int): The number of tokens of a node with weight 1.
+
+        Raises:
+            ValueError: If `vnodes` is less than 1.
+        """
+        if vnodes < 1:
+            raise ValueError("vnodes must be at least 1")
+        self.vnodes = vnodes
+        self._weights = {}
+        self._tokens = []
+        self._owners = []
+        for node in nodes:
+            self._weights[node] = 1.0
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        """
+        Recomputes the sorted token list and its parallel owner list from `_weights`.
+
+        Returns:
+            None
+        """
+        points = []
+        for node, weight in self._weights.items():
+            for i in range(max(1, round(self.vnodes * weight))):
+                points.append((_hash(f"{node!r}#{i}"), node))
+        points.sort(key=lambda point: point[0])
+        self._tokens = [token for token, _ in points]
+        self._owners = [node for _, node in points]
+
+    def add_node(self, node: any, weight: float = 1.0) -> None:
+        """
+        Adds a node, or changes the weight of an existing one.
+
+        Args:
+            node (any): The node.
+            weight (float): Its share of the keys relative to a node of weight 1.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If `weight` is not positive.
+        """
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        self._weights[node] = weight
+        self._rebuild()
+
+    def remove_node(self, node: any) -> None:
+        """
+        Removes a node.
+
+        Args:
+            node (any): The node.
+
+        Returns:
+            None
+
+        Raises:
+            KeyError: If the node is not on the ring.
+        """
+        del self._weights[node]
+        self._rebuild()
+
+    @property
+    def nodes(self) -> list:
+        """
+        The nodes on the ring.
+        """
+        return list(self._weights)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of nodes.
+
+        Returns:
+            int: The number of nodes.
+        """
+        return len(self._weights)
+
+    def __contains__(self, node: any) -> bool:
+        """
+        Checks if `node` is on the ring.
+
+        Args:
+            node (any): The node.
+
+        Returns:
+            bool: True if the node is on the ring, False otherwise.
+        """
+        return node in self._weights
+
+    def locate(self, key: any) -> any:
+        """
+        Returns the node that owns `key`.
+
+        Args:
+            key (any): The key.
+
+        Returns:
+            any: The owning node.
+
+        Raises:
+            LookupError: If the ring has no nodes.
+        """
+        if not self._tokens:
+            raise LookupError("the ring has no nodes")
+        i = bisect_left(self._tokens, _hash(key))
+        return self._owners[i if i < len(self._owners) else 0]
+
+    def locate_many(self, keys, load_factor: float = None) -> list:
+        """
+        Returns the owning node of every key in a batch.
+
+        Args:
+            keys (iterable): The keys.
+            load_factor (float): If given, no node receives more than `ceil(load_factor * len(keys) * share)` keys of
+                this batch, where share is the node's fraction of the total weight. Keys of a full node go to the next
+                node clockwise with room. Must be at least 1.
+
+        Returns:
+            list: The node of each key, in the order of `keys`.
+
+        Raises:
+            LookupError: If the ring has no nodes and `keys` is not empty.
+            ValueError: If `load_factor` is less than 1.
+        """
+        if load_factor is not None and load_factor < 1:
+            raise ValueError("load_factor must be at least 1")
+        keys = list(keys)
+        if not keys:
+            return []
+        if not self._tokens:
+            raise LookupError("the ring has no nodes")
+        tokens, owners = self._tokens, self._owners
+        size = len(tokens)
+        positions = [bisect_left(tokens, _hash(key)) % size for key in keys]
+        if load_factor is None:
+            return [owners[i] for i in positions]
+        total = sum(self._weights.values())
+        capacity = {node: ceil(load_factor * len(positions) * weight / total)
+                    for node, weight in self._weights.items()}
+        load = dict.fromkeys(self._weights, 0)
+        result = []
+        for i in positions:
+            node = owners[i]
+            while load[node] >= capacity[node]:
+                i = (i + 1) % size
+                node = owners[i]
+            load[node] += 1
+            result.append(node)
+        return result
+
+    def _copy(self) -> "HashRing":
+        """
+        Returns a ring with the same nodes, weights and tokens.
+        """
+        ring = HashRing(vnodes=self.vnodes)
+        ring._weights = dict(self._weights)
+        ring._tokens = self._tokens
+        ring._owners = self._owners
+        return ring
+
+    def _plan(self, other: "HashRing", keys) -> dict:
+        """
+        Groups the keys whose owner differs between this ring and `other`.
+
+        Returns:
+            dict: {(source node, target node): [keys]}.
+        """
+        keys = list(keys)
+        plan = {}
+        for key, source, target in zip(keys, self.locate_many(keys), other.locate_many(keys)):
+            if source != target:
+                plan.setdefault((source, target), []).append(key)
+        return plan
+
+    def plan_join(self, node: any, keys, weight: float = 1.0) -> dict:
+        """
+        Lists which keys would move if `node` joined the ring. The ring itself is not changed.
+
+        Args:
+            node (any): The joining node.
+            keys (iterable): The keys currently stored.
+            weight (float): The node's weight.
+
+        Returns:
+            dict: {(source node, `node`): [keys]} for every source that loses keys.
+        """
+        other = self._copy()
+        other.add_node(node, weight)
+        return self._plan(other, keys)
+
+    def plan_leave(self, node: any, keys) -> dict:
+        """
+        Lists which keys would move if `node` left the ring. The ring itself is not changed.
+
+        Args:
+            node (any): The leaving node.
+            keys (iterable): The keys currently stored.
+
+        Returns:
+            dict: {(`node`, target node): [keys]} for every node that receives keys.
+
+        Raises:
+            KeyError: If the node is not on the ring.
+        """
+        other = self._copy()
+        other.remove_node(node)
+        return self._plan(other, keys)
+
+
+class ShardedHashMap:
+    def __init__(self, nodes=(), vnodes: int = 160, **options):
+        """
+        Initializes a map with one empty `SimpleHashMap` shard per node.
+
+        Args:
+            nodes (iterable): The initial nodes, each with weight 1.
+            vnodes (int): Passed to the `HashRing`.
+            **options: Passed to every `SimpleHashMap`.
+        """
+        self.ring = HashRing(nodes, vnodes)
+        self._options = options
+        self._shards = {node: SimpleHashMap(**options) for node in self.ring.nodes}
+
+    def shard(self, node: any) -> SimpleHashMap:
+        """
+        Returns the `SimpleHashMap` of `node`.
+
+        Args:
+            node (any): The node.
+
+        Returns:
+            SimpleHashMap: Its shard.
+
+        Raises:
+            KeyError: If the node is unknown.
+        """
+        return self._shards[node]
+
+    def insert_data(self, key: any, data: any) -> None:
+        """
+        Insert data into the shard that owns the key.
+
+        Args:
+            key (any): The key for the data.
+            data (any): The data to be stored.
+
+        Returns:
+            None
+        """
+        self._shards[self.ring.locate(key)].insert_data(key, data)
+
+    def remove_data(self, key: any) -> None:
+        """
+        Remove data from the shard that owns the key.
+
+        Args:
+            key (any): The key for the data to be removed.
+
+        Returns:
+            None
+        """
+        self._shards[self.ring.locate(key)].remove_data(key)
+
+    def get_data(self, key: any) -> any:
+        """
+        Retrieve data from the shard that owns the key.
+
+        Args:
+            key (any): The key for the data to be retrieved.
+
+        Returns:
+            any: The data associated with the key, or None if the key does not exist.
+        """
+        return self._shards[self.ring.locate(key)].get_data(key)
+
+    def get_many(self, keys) -> list:
+        """
+        Retrieve the data of a batch of keys, routing them with one `locate_many`.
+
+        Args:
+            keys (iterable): The keys.
+
+        Returns:
+            list: The data of each key (None for missing keys), in the order of `keys`.
+        """
+        keys = list(keys)
+        shards = self._shards
+        return [shards[node].get_data(key) for key, node in zip(keys, self.ring.locate_many(keys))]
+
+    def keys(self) -> list:
+        """
+        Returns every key, shard by shard.
+
+        Returns:
+            list: The keys.
+        """
+        return [key for shard in self._shards.values() for key in shard]
+
+    def __len__(self) -> int:
+        """
+        Returns the number of entries across all shards.
+
+        Returns:
+            int: The number of entries.
+        """
+        return sum(len(shard) for shard in self._shards.values())
+
+    def _move(self, plan: dict) -> int:
+        """
+        Moves the entries listed in a plan between shards.
+
+        Returns:
+            int: The number of entries moved.
+        """
+        moved = 0
+        for (source, target), keys in plan.items():
+            source_shard, target_shard = self._shards[source], self._shards[target]
+            for key in keys:
+                target_shard.insert_data(key, source_shard.pop(key))
+            moved += len(keys)
+        return moved
+
+    def add_node(self, node: any, weight: float = 1.0) -> int:
+        """
+        Adds a node with an empty shard and moves the keys it now owns into it.
+
+        Args:
+            node (any): The node.
+            weight (float): Its weight on the ring.
+
+        Returns:
+            int: The number of entries moved.
+        """
+        # the first node has nothing to take over (and an empty ring cannot locate anything)
+        plan = self.ring.plan_join(node, self.keys(), weight) if len(self.ring) else {}
+        self.ring.add_node(node, weight)
+        self._shards.setdefault(node, SimpleHashMap(**self._options))
+        return self._move(plan)
+
+    def remove_node(self, node: any) -> int:
+        """
+        Moves a node's entries to the nodes that now own them, then removes the node and its shard. The last node
+        can only be removed once its shard is empty.
+
+        Args:
+            node (any): The node.
+
+        Returns:
+            int: The number of entries moved.
+
+        Raises:
+            KeyError: If the node is unknown.
+            ValueError: If it is the last node and its shard still holds entries, which would have nowhere to go.
+        """
+        if len(self.ring) == 1 and node in self.ring and len(self._shards[node]):
+            raise ValueError("cannot remove the last node while it holds entries")
+        plan = self.ring.plan_leave(node, list(self._shards[node]))
+        self.ring.remove_node(node)
+        moved = self._move(plan)
+        del self._shards[node]
+        return moved
+
+    def plan_join(self, node: any, weight: float = 1.0) -> dict:
+        """
+        Lists which stored keys would move if `node` joined. Nothing is changed.
+
+        Args:
+            node (any): The joining node.
+            weight (float): Its weight.
+
+        Returns:
+            dict: {(source node, `node`): [keys]}.
+        """
+        return self.ring.plan_join(node, self.keys(), weight)
+
+    def plan_leave(self, node: any) -> dict:
+        """
+        Lists which stored keys would move if `node` left. Nothing is changed.
+
+        Args:
+            node (any): The leaving node.
+
+        Returns:
+            dict: {(`node`, target node): [keys]}.
+        """
+        return self.ring.plan_leave(node, list(self._shards[node]))
+
+    def print_table(self) -> None:
+        """
+        Print all key-value pairs, shard by shard.
+
+        Returns:
+            None
+        """
+        for node, shard in self._shards.items():
+            print(f'[{node}]')
+            shard.print_table()
+
+
+if __name__ == "__main__":
+    ring = HashRing(["a", "b", "c"])
+    keys = [f"user:{i}" for i in range(10000)]
+    before = ring.locate_many(keys)
+    print(ring.locate("user:42") == before[42])  # Expected output: True
+
+    plan = ring.plan_join("d", keys)
+    moved = sum(len(moving) for moving in plan.values())
+    print(all(target == "d" for _, target in plan), 1500 < moved < 3500)  # Expected output: True True
+
+    bounded = ring.locate_many(["hot"] * 30 + keys[:70], load_factor=1.25)
+    print(max(bounded.count(node) for node in "abc") <= 42)  # Expected output: True
+
+    table = ShardedHashMap(["a", "b"])
+    for i in range(100):
+        table.insert_data(i, i * i)
+    moved = table.add_node("c")
+    print(len(table), table.get_data(9), 0 < moved < 100)  # Expected output: 100 81 True
+    table.remove_node("a")
+    print(len(table), table.get_many([3, 4, 200]))  # Expected output: 100 [9, 16, None]
+    print(table.get_data(3.0), table.get_data(True))  # Expected output: 9 1
+
+    grown = ShardedHashMap()
+    print(grown.add_node("a"), grown.plan_join("b"))  # Expected output: 0 {}
+    grown.insert_data("k", 1)
+    grown.add_node("b")
+    print(len(grown), grown.get_data("k"))  # Expected output: 1 1
+    grown.remove_node("a")
+    try:
+        grown.remove_node("b")
+    except ValueError:
+        print("the last node still holds entries")  # Expected output: the last node still holds entries
+    grown.remove_data("k")
+    print(grown.remove_node("b"), len(grown.ring))  # Expected output: 0 0
@@ -20,7 +20,8 @@ Time Complexity:
 - **Printing Adjacency Matrix**: O(V^2).
 - **Prim's Algorithm**: O(E log V) with a priority queue.
 - **Kruskal's Algorithm**: O(E log V) due to sorting edges.
-- **Djikstra's Algorithm**: O(E log V) with a priority queue.
+- **Djikstra's Algorithm**: O(E log V) with a priority queue. With `indexed=True` the queue never holds more than V
+  entries, versus up to E entries when duplicates are pushed.
 - **Floyd-Warshall Algorithm**: O(V^3).
 - **Bellman-Ford Algorithm**: O(VE).
 
@@ -32,6 +33,8 @@ Applications:
 import heapq
 from typing import List, Tuple, Union
 
+from Data_Structures.binary_heap import IndexedHeap
+
 
 class Graph:
     """
@@ -231,12 +234,14 @@ class Graph:
 
         return min_cost, mst_edges
 
-    def djikstra_algorithm(self, start: int) -> List[float]:
+    def djikstra_algorithm(self, start: int, indexed: bool = False) -> List[float]:
         """
         Find the shortest path from a starting vertex to all other vertices using Djikstra's algorithm.
 
         Args:
             start (int): The starting vertex for the shortest path calculations.
+            indexed (bool): If True, use an `IndexedHeap` and lower a vertex's distance in place (decrease-key). The
+                heap then holds each vertex at most once instead of one entry per relaxed edge.
 
         Returns:
             List[float]: The shortest distances from the starting vertex to all other vertices.
@@ -260,6 +265,8 @@ class Graph:
 
         dist = [float('inf')] * self.vertices
         dist[start] = 0
+        if indexed:
+            return self._djikstra_indexed(start, dist)
         min_heap = [(0, start)]  # (distance, vertex)
         visited = [False] * self.vertices
 
@@ -276,6 +283,32 @@ class Graph:
                     heapq.heappush(min_heap, (dist[v], v))
 
         return dist
+
+    def _djikstra_indexed(self, start: int, dist: List[float]) -> List[float]:
+        """
+        Djikstra's algorithm with an indexed priority queue (decrease-key instead of duplicate entries).
+
+        Args:
+            start (int): The starting vertex.
+            dist (List[float]): Distances initialised to infinity, and to 0 for `start`.
+
+        Returns:
+            List[float]: The shortest distances from the starting vertex to all other vertices.
+        """
+        queue = IndexedHeap()
+        queue.push(start, 0)
+        done = [False] * self.vertices
+        while queue:
+            u, d = queue.pop()
+            done[u] = True
+            for v, weight in self.adj_list[u]:
+                if not done[v] and d + weight < dist[v]:
+                    dist[v] = d + weight
+                    if v in queue:
+                        queue.update(v, dist[v])
+                    else:
+                        queue.push(v, dist[v])
+        return dist
     
     def floyd_warshall_algorithm(self) -> List[List[float]]:
         """
@@ -388,6 +421,7 @@ if __name__ == "__main__":
     # Djikstra's Algorithm from vertex 0
     distances = g.djikstra_algorithm(0)
     print(f"\nDjikstra's Algorithm (starting from vertex 0):\nDistances: {distances}")
+    print(f"Same with decrease-key: {g.djikstra_algorithm(0, indexed=True) == distances}")  # Expected output: True
 
     # Bellman-Ford Algorithm from vertex 0
     distances = g.bellman_ford_algorithm(0)
@@ -0,0 +1,598 @@
+"""
+Hash Map with an Open-Addressing Engine
+
+`SimpleHashMap` stores its items in `OpenAddressingTable`, a hash table implemented here rather than Python's dict.
+
+HashMap Overview:
+- A hash map is a data structure that maps keys to values for efficient data retrieval.
+- A key's hash picks its "home" slot; when that slot is taken, a probe sequence picks the next slots to try.
+
+Storage:
+- Keys, hashes and values live in three parallel flat arrays (two lists and an `array('q')` of hashes). There is no
+  per-item node or tuple, and comparing the stored hash first skips most `==` calls on collisions.
+- The number of slots is a power of two, so a slot index is `hash & mask`.
+
+Hash Table Techniques:
+1. Separate Chaining (for comparison, not implemented here):
+   - Uses a list of lists (or another collection) where each index of the list holds a chain of key-value pairs.
+   - Hash collisions are handled by appending new elements to the list at the index where the collision occurs.
+   - Simple to implement but may lead to increased memory usage if many collisions occur.
+
+2. Open Addressing (`probing=`):
+   - All elements are stored in a single array (or table) and collisions are resolved by probing.
+   - When a collision occurs, the hash table searches for the next available slot using a probing sequence.
+   - Variants include:
+     - "linear": Searches for the next available slot sequentially.
+     - "quadratic": Steps of 1, 2, 3, ... (triangular numbers), which visit every slot of a power-of-two table.
+     - "double": Uses a second, hash-derived odd step, reducing clustering.
+     - "robin_hood": Linear probing where an insert takes the slot of any resident that is closer to its own home
+       slot ("takes from the rich"). This evens out probe lengths and lets a failed lookup stop early. Deletion shifts the
+       following items back one slot (backward-shift deletion) instead of leaving a tombstone.
+   - The classic variants mark deleted slots with tombstones, which lookups skip and inserts reuse.
+
+Load Factor and Resizing:
+- The load factor is the number of used slots (items plus tombstones) divided by the number of slots.
+- When it would exceed `max_load_factor` (0.7 by default), a resize starts with new arrays sized for twice the items.
+- Resizing is incremental. Every later insert or delete moves the next `rehash_step` old slots into the new arrays,
+  and lookups check both sets of arrays until the move is complete. No single operation pays for a full rehash.
+
+Instrumentation:
+- `probe_histogram()` returns how many probes a successful lookup of each stored key takes.
+- `stats()` returns the size, capacity, load factor, tombstone count and whether a resize is running.
+
+Operations:
+1. **Insert**: Insert data into the hash map with a given key (`insert_data` / `put`).
+2. **Delete**: Remove data from the hash map with a given key (`remove_data` / `pop`).
+3. **Retrieve**: Retrieve data from the hash map using a given key (`get_data` / `get`).
+4. **Print**: Print all key-value pairs in the hash map.
+
+Time Complexity:
+    - **Insert**: O(1) average case, O(n) worst case (if hash collisions occur frequently). A resize adds O(rehash_step).
+    - **Delete**: O(1) average case, O(n) worst case (if hash collisions occur frequently).
+    - **Retrieve**: O(1) average case, O(n) worst case (if hash collisions occur frequently).
+    - **Print**: O(n), where n is the number of elements in the hash map.
+
+Applications:
+    - Hash maps are commonly used for implementing associative arrays, database indexing, caches, and sets.
+    - They are effective in scenarios where quick lookups, insertions, and deletions are required.
+
+"""
+
+from array import array
+from collections.abc import Mapping
+
+PROBING = ("linear", "quadratic", "double", "robin_hood")
+
+_EMPTY = object()  # never used: ends every probe sequence
+_DELETED = object()  # tombstone: skipped by lookups, reused by inserts
+
+
+class OpenAddressingTable:
+    def __init__(self, capacity: int = 8, max_load_factor: float = 0.7, probing: str = "linear",
+                 rehash_step: int = 32):
+        """
+        Initializes an empty table.
+
+        Args:
+            capacity (int): The number of items the table should hold before its first resize.
+            max_load_factor (float): The fraction of slots (live items plus tombstones) that triggers a resize.
+            probing (str): One of "linear", "quadratic", "double" or "robin_hood".
+            rehash_step (int): The number of old slots moved to the new arrays by each write while a resize is running.
+
+        Raises:
+            ValueError: If `probing` is unknown, `max_load_factor` is not between 0 and 1, or `rehash_step` is less than 1.
+        """
+        if probing not in PROBING:
+            raise ValueError(f"probing must be one of {PROBING}")
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1")
+        if rehash_step < 1:
+            raise ValueError("rehash_step must be at least 1")
+        self.probing = probing
+        self.max_load_factor = max_load_factor
+        self.rehash_step = rehash_step
+        self._robin_hood = probing == "robin_hood"
+        self._double = probing == "double"
+        self._inc = 1 if probing == "quadratic" else 0
+        self._old = None
+        self._allocate(self._slots_for(capacity))
+
+    def _slots_for(self, items: int) -> int:
+        """
+        Returns the smallest power of two (at least 8) that holds `items` without exceeding the load factor.
+        """
+        size = 8
+        while int(size * self.max_load_factor) < items:
+            size *= 2
+        return size
+
+    def _allocate(self, size: int) -> None:
+        """
+        Replaces the current arrays with empty ones of `size` slots.
+
+        Args:
+            size (int): The number of slots, a power of two.
+
+        Returns:
+            None
+        """
+        self._keys = [_EMPTY] * size
+        self._hashes = array("q", bytes(8 * size))
+        self._values = [None] * size
+        self._mask = size - 1
+        self._used = 0  # live items
+        self._filled = 0  # live items plus tombstones
+        self._limit = int(size * self.max_load_factor)
+
+    def _first_step(self, h: int) -> int:
+        """
+        Returns the first probe step for hash `h`: a hash-derived odd step for double hashing, otherwise 1.
+        """
+        return (h >> 8) | 1 if self._double else 1
+
+    def _find(self, key: any, h: int) -> int:
+        """
+        Finds `key` in the current arrays.
+
+        Args:
+            key (any): The key to find.
+            h (int): `hash(key)`.
+
+        Returns:
+            int: The slot holding `key`, or -1.
+        """
+        keys, hashes, mask = self._keys, self._hashes, self._mask
+        i = h & mask
+        if self._robin_hood:
+            distance = 0
+            while True:
+                k = keys[i]
+                if k is _EMPTY or (i - hashes[i]) & mask < distance:
+                    return -1  # a richer slot: the key would have displaced it
+                if hashes[i] == h and (k is key or k == key):
+                    return i
+                i = (i + 1) & mask
+                distance += 1
+        step, inc = self._first_step(h), self._inc
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                return -1
+            if hashes[i] == h and k is not _DELETED and (k is key or k == key):
+                return i
+            i = (i + step) & mask
+            step += inc
+
+    def _find_old(self, key: any, h: int) -> int:
+        """
+        Finds `key` in the arrays being migrated away from during a resize.
+
+        The old arrays only ever gain tombstones, so a plain probe (without the Robin Hood early exit) is used.
+
+        Args:
+            key (any): The key to find.
+            h (int): `hash(key)`.
+
+        Returns:
+            int: The old slot holding `key`, or -1.
+        """
+        keys, hashes, _, mask = self._old
+        i = h & mask
+        step, inc = (1, 0) if self._robin_hood else (self._first_step(h), self._inc)
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                return -1
+            if hashes[i] == h and k is not _DELETED and (k is key or k == key):
+                return i
+            i = (i + step) & mask
+            step += inc
+
+    def _place(self, key: any, h: int, value: any) -> None:
+        """
+        Stores a key that is known to be absent in the current arrays.
+
+        Args:
+            key (any): The key.
+            h (int): `hash(key)`.
+            value (any): The value.
+
+        Returns:
+            None
+        """
+        keys, hashes, values, mask = self._keys, self._hashes, self._values, self._mask
+        i = h & mask
+        self._used += 1
+        if self._robin_hood:
+            distance = 0
+            while True:
+                k = keys[i]
+                if k is _EMPTY:
+                    keys[i], hashes[i], values[i] = key, h, value
+                    self._filled += 1
+                    return
+                resident = (i - hashes[i]) & mask
+                if resident < distance:  # take from the rich: the resident moves on instead
+                    keys[i], key = key, k
+                    hashes[i], h = h, hashes[i]
+                    values[i], value = value, values[i]
+                    distance = resident
+                i = (i + 1) & mask
+                distance += 1
+        step, inc = self._first_step(h), self._inc
+        while True:
+            k = keys[i]
+            if k is _EMPTY or k is _DELETED:
+                if k is _EMPTY:
+                    self._filled += 1
+                keys[i], hashes[i], values[i] = key, h, value
+                return
+            i = (i + step) & mask
+            step += inc
+
+    def _delete_slot(self, i: int) -> any:
+        """
+        Removes the item in slot `i` of the current arrays: a tombstone for the classic schemes, a backward shift
+        (no tombstone) for Robin Hood.
+
+        Args:
+            i (int): The slot to clear.
+
+        Returns:
+            any: The removed value.
+        """
+        keys, hashes, values, mask = self._keys, self._hashes, self._values, self._mask
+        value = values[i]
+        self._used -= 1
+        if not self._robin_hood:
+            keys[i] = _DELETED
+            values[i] = None
+            return value
+        j = (i + 1) & mask
+        while keys[j] is not _EMPTY and (j - hashes[j]) & mask:
+            keys[i], hashes[i], values[i] = keys[j], hashes[j], values[j]
+            i = j
+            j = (j + 1) & mask
+        keys[i] = _EMPTY
+        hashes[i] = 0
+        values[i] = None
+        self._filled -= 1
+        return value
+
+    def _grow(self) -> None:
+        """
+        Starts a resize: the current arrays become the old arrays and empty ones are allocated. Writes then move
+        `rehash_step` old slots at a time, so no single operation pays for a full rehash.
+
+        The size doubles unless the slots were mostly tombstones, and always leaves room for every live item plus
+        the inserts that can happen before the migration ends.
+
+        Returns:
+            None
+        """
+        if self._old is not None:
+            self._migrate(len(self._old[0]))
+        old = (self._keys, self._hashes, self._values, self._mask)
+        live = self._used
+        size = self._slots_for(live + len(old[0]) // self.rehash_step + 1)
+        if 2 * live > self._limit:
+            size = max(size, 2 * len(old[0]))
+        self._allocate(size)
+        if live:
+            self._old = old
+            self._old_used = live
+            self._old_pos = 0
+
+    def _migrate(self, count: int) -> None:
+        """
+        Moves the live items of the next `count` old slots into the current arrays.
+
+        Args:
+            count (int): The number of old slots to process.
+
+        Returns:
+            None
+        """
+        keys, hashes, values, _ = self._old
+        start = self._old_pos
+        end = min(start + count, len(keys))
+        for i in range(start, end):
+            k = keys[i]
+            if k is not _EMPTY and k is not _DELETED:
+                self._place(k, hashes[i], values[i])
+                keys[i] = _DELETED
+                values[i] = None
+                self._old_used -= 1
+        self._old_pos = end
+        if end == len(keys) or self._old_used == 0:
+            self._old = None
+
+    def put(self, key: any, value: any) -> None:
+        """
+        Inserts `key` or replaces its value.
+
+        Args:
+            key (any): A hashable key.
+            value (any): The value.
+
+        Returns:
+            None
+        """
+        h = hash(key)
+        if self._old is not None:
+            self._migrate(self.rehash_step)
+        i = self._find(key, h)
+        if i >= 0:
+            self._values[i] = value
+            return
+        if self._old is not None:
+            i = self._find_old(key, h)
+            if i >= 0:
+                self._old[2][i] = value
+                return
+        if self._filled >= self._limit:
+            self._grow()
+        self._place(key, h, value)
+
+    def get(self, key: any, default: any = None) -> any:
+        """
+        Returns the value of `key`.
+
+        Args:
+            key (any): The key to look up.
+            default (any): Returned if the key is absent.
+
+        Returns:
+            any: The value, or `default`.
+        """
+        h = hash(key)
+        i = self._find(key, h)
+        if i >= 0:
+            return self._values[i]
+        if self._old is not None:
+            i = self._find_old(key, h)
+            if i >= 0:
+                return self._old[2][i]
+        return default
+
+    def pop(self, key: any, default: any = None) -> any:
+        """
+        Removes `key` and returns its value.
+
+        Args:
+            key (any): The key to remove.
+            default (any): Returned if the key is absent.
+
+        Returns:
+            any: The removed value, or `default`.
+        """
+        h = hash(key)
+        if self._old is not None:
+            self._migrate(self.rehash_step)
+        i = self._find(key, h)
+        if i >= 0:
+            return self._delete_slot(i)
+        if self._old is not None:
+            i = self._find_old(key, h)
+            if i >= 0:
+                keys, _, values, _ = self._old
+                value = values[i]
+                keys[i] = _DELETED
+                values[i] = None
+                self._old_used -= 1
+                return value
+        return default
+
+    def __contains__(self, key: any) -> bool:
+        """
+        Checks if `key` is in the table.
+
+        Args:
+            key (any): The key to look up.
+
+        Returns:
+            bool: True if the key is present, False otherwise.
+        """
+        h = hash(key)
+        return self._find(key, h) >= 0 or (self._old is not None and self._find_old(key, h) >= 0)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items.
+
+        Returns:
+            int: The number of items.
+        """
+        return self._used + (self._old_used if self._old is not None else 0)
+
+    def items(self):
+        """
+        Iterates over the (key, value) pairs, in slot order.
+
+        Yields:
+            tuple: Each (key, value) pair.
+        """
+        tables = [(self._keys, self._values)]
+        if self._old is not None:
+            tables.insert(0, (self._old[0], self._old[2]))
+        for keys, values in tables:
+            for k, v in zip(keys, values):
+                if k is not _EMPTY and k is not _DELETED:
+                    yield k, v
+
+    def __iter__(self):
+        """
+        Iterates over the keys, in slot order.
+
+        Yields:
+            any: Each key.
+        """
+        for key, _ in self.items():
+            yield key
+
+    def probe_histogram(self) -> dict:
+        """
+        Counts how many probes a successful lookup of each stored key takes.
+
+        Returns:
+            dict: Probe length (1 = found in its home slot) -> number of keys, in increasing order of length.
+        """
+        histogram = {}
+        tables = [(self._keys, self._hashes, self._mask)]
+        if self._old is not None:
+            tables.append((self._old[0], self._old[1], self._old[3]))
+        for keys, hashes, mask in tables:
+            for slot, k in enumerate(keys):
+                if k is _EMPTY or k is _DELETED:
+                    continue
+                h = hashes[slot]
+                i = h & mask
+                step, inc = (1, 0) if self._robin_hood else (self._first_step(h), self._inc)
+                probes = 1
+                while i != slot:
+                    i = (i + step) & mask
+                    step += inc
+                    probes += 1
+                histogram[probes] = histogram.get(probes, 0) + 1
+        return dict(sorted(histogram.items()))
+
+    def stats(self) -> dict:
+        """
+        Returns the table's size and occupancy.
+
+        Returns:
+            dict: `size` (items), `capacity` (slots), `load_factor`, `tombstones`, `probing` and `resizing`
+                (True while old slots are still being migrated).
+        """
+        capacity = self._mask + 1
+        return dict(size=len(self), capacity=capacity, load_factor=self._filled / capacity,
+                    tombstones=self._filled - self._used, probing=self.probing, resizing=self._old is not None)
+
+
+class _HashMapView(Mapping):
+    """
+    A live, read-only `Mapping` over a table, standing in for the dict that `SimpleHashMap.hash_map` used to be.
+    """
+
+    def __init__(self, table: "OpenAddressingTable") -> None:
+        self._table = table
+
+    def __getitem__(self, key: any) -> any:
+        value = self._table.get(key, _EMPTY)
+        if value is _EMPTY:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: any) -> bool:
+        return key in self._table
+
+    def __iter__(self):
+        return iter(self._table)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __repr__(self) -> str:
+        return repr(dict(self._table.items()))
+
+
+class SimpleHashMap(OpenAddressingTable):
+    """
+    Hash map on top of the open-addressing engine, keeping the original method names.
+    """
+
+    def __init__(self, capacity: int = 8, max_load_factor: float = 0.7, probing: str = "linear",
+                 rehash_step: int = 32):
+        """
+        Initialize an empty hash map. See `OpenAddressingTable.__init__` for the arguments.
+        """
+        super().__init__(capacity, max_load_factor, probing, rehash_step)
+
+    @property
+    def hash_map(self) -> Mapping:
+        """
+        A live, read-only view of the items, kept for code written when the map was backed by a dict attribute of
+        this name. Change the map through `insert_data` / `remove_data`; writing to the view raises TypeError.
+        """
+        return _HashMapView(self)
+
+    def insert_data(self, key: int, data: any) -> None:
+        """
+        Insert data into the hash map with the given key.
+
+        Args:
+            key (int): The key for the data.
+            data (any): The data to be stored.
+
+        Returns:
+            None
+        """
+        self.put(key, data)
+
+    def remove_data(self, key: int) -> None:
+        """
+        Remove data from the hash map with the given key.
+
+        Args:
+            key (int): The key for the data to be removed.
+
+        Returns:
+            None
+        """
+        self.pop(key)
+
+    def get_data(self, key: int) -> any:
+        """
+        Retrieve data from the hash map using the given key.
+
+        Args:
+            key (int): The key for the data to be retrieved.
+
+        Returns:
+            any: The data associated with the key, or None if the key does not exist.
+        """
+        return self.get(key)
+
+    def print_table(self) -> None:
+        """
+        Print all key-value pairs in the hash map.
+
+        Returns:
+            None
+        """
+        for key, data in self.items():
+            print(f'{key}: {data}')
+
+
+# Example usage
+if __name__ == "__main__":
+    # Create an instance of SimpleHashMap
+    shm = SimpleHashMap()
+
+    # Insert data
+    shm.insert_data(1, 'Data 1')
+    shm.insert_data(2, 'Data 2')
+    shm.insert_data(3, 'Data 3')
+
+    # Print hash map
+    print("HashMap Contents:")
+    shm.print_table()
+
+    # Retrieve and print specific data
+    print("Retrieve Data with Key 2:", shm.get_data(2))
+
+    # Remove data
+    shm.remove_data(2)
+
+    # Print hash map after removal
+    print("HashMap Contents after removal:")
+    shm.print_table()
+
+    # The same operations with Robin Hood probing, growing well past the initial capacity
+    rh = SimpleHashMap(probing="robin_hood")
+    for key in range(1000):
+        rh.insert_data(key, key * key)
+    for key in range(0, 1000, 2):
+        rh.remove_data(key)
+    print(len(rh), rh.get_data(999), rh.get_data(998))  # Expected output: 500 998001 None
+    print(rh.stats()["resizing"], sum(rh.probe_histogram().values()))  # Expected output: False 500
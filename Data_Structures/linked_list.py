@@ -0,0 +1,1274 @@
+"""
+Singly Linked List (SLL)
+
+A singly linked list is a linear data structure where each node points to the next node in the sequence. Each node contains a data field and a reference to the next node.
+
+Operations:
+1. **Insertion at the beginning**: Adds a new node with specified data at the start of the list. The new node becomes the new head of the list.
+2. **Insertion at the end**: Adds a new node with specified data at the end of the list. Uses the tail pointer, so no traversal is needed.
+3. **Insertion after a node**: Adds a new node with specified data after a given node. Requires knowing the node after which the new node will be inserted.
+4. **Deletion of a node**: Removes a node at a specified position. Requires traversal to find the node to be removed.
+5. **Search for a node**: Checks whether a node with specified data exists in the list. Requires traversal from the head to search through nodes.
+6. **Sorting the list**: Rearranges the nodes in ascending (or, with `reverse=True`, descending) order of their data or of `key(data)`. Uses a stable,
+   non-recursive natural merge sort that relinks the nodes instead of swapping their data.
+   `mergeSorted(other)` merges two already sorted lists the same way in a single pass.
+7. **Reversing the list**: Reverses the order of nodes in the list. Each node's next pointer is adjusted to point to the previous node.
+8. **Bulk construction**: `extend(iterable)` and `from_iterable(iterable)` link all new nodes in one pass starting at the tail.
+9. **Length**: `len(list)` returns the number of nodes, which is kept up to date by every operation.
+
+The list keeps a `tail` pointer and a node count alongside `head`, and nodes use `__slots__` so they carry no per-instance `__dict__`.
+
+Time Complexity:
+    - **Insertion at the beginning*: O(1) (constant time as it involves updating the head pointer)
+    - **Insertion at the end**: O(1) (constant time using the tail pointer)
+    - **Insertion after a node**: O(1) (constant time if the node is already known)
+    - **Deletion**: O(n) (linear time as it requires traversing the list to find the node to be deleted)
+    - **Search**: O(n) (linear search as it requires traversing the list)
+    - **Sorting**: O(n log n) (bottom-up natural merge sort; O(n) if the list is already sorted or reverse sorted)
+    - **Merging two sorted lists**: O(n + m) with no new nodes
+    - **Reversing**: O(n) (linear time as it involves traversing the list once)
+    - **Bulk construction**: O(k) for k new elements
+    - **Length**: O(1)
+
+Applications:
+    - Used to implement stacks and queues.
+    - Useful for memory-efficient implementations where elements are frequently inserted or removed.
+    - Ideal for scenarios where dynamic memory allocation is required.
+"""
+
+import heapq
+from itertools import islice
+
+
+class Single_Node:
+    __slots__ = ("data", "next")
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+def _comes_before(key, reverse: bool):
+    """
+    Builds the strict ordering test used by the sort and merge helpers.
+
+    Args:
+        key (callable or None): Maps a node's data to its sort key, or None to compare the data itself.
+        reverse (bool): True to order from largest to smallest.
+
+    Returns:
+        callable: `before(a, b)`, True if node `a` must be placed strictly before node `b`.
+    """
+    if key is None:
+        if reverse:
+            return lambda a, b: b.data < a.data
+        return lambda a, b: a.data < b.data
+    if reverse:
+        return lambda a, b: key(b.data) < key(a.data)
+    return lambda a, b: key(a.data) < key(b.data)
+
+
+def _sort_order(head, key, reverse: bool):
+    """
+    Like `_comes_before`, but calls `key` once per node up front instead of twice per comparison.
+
+    Args:
+        head: The first node of the chain to be sorted.
+        key (callable or None): Maps a node's data to its sort key, or None to compare the data itself.
+        reverse (bool): True to order from largest to smallest.
+
+    Returns:
+        callable: `before(a, b)`, True if node `a` must be placed strictly before node `b`.
+    """
+    if key is None:
+        return _comes_before(None, reverse)
+    keys = {}
+    node = head
+    while node is not None:
+        keys[node] = key(node.data)
+        node = node.next
+    if reverse:
+        return lambda a, b: keys[b] < keys[a]
+    return lambda a, b: keys[a] < keys[b]
+
+
+def _merge_runs(a, a_tail, b, b_tail, before, doubly: bool) -> tuple:
+    """
+    Merges two None-terminated sorted runs by relinking their nodes. Ties are taken from `a`, so the merge is stable.
+
+    Args:
+        a, a_tail: First and last node of the first run (both None if it is empty).
+        b, b_tail: First and last node of the second run (both None if it is empty).
+        before (callable): The ordering test from `_comes_before`.
+        doubly (bool): True to also set `prev` pointers while linking.
+
+    Returns:
+        tuple: The (head, tail) of the merged run.
+    """
+    if a is None:
+        return b, b_tail
+    if b is None:
+        return a, a_tail
+    if before(b, a):
+        head = b
+        b = b.next
+    else:
+        head = a
+        a = a.next
+    last = head
+    while a is not None and b is not None:
+        if before(b, a):
+            node = b
+            b = b.next
+        else:
+            node = a
+            a = a.next
+        last.next = node
+        if doubly:
+            node.prev = last
+        last = node
+    if a is not None:
+        rest, tail = a, a_tail
+    else:
+        rest, tail = b, b_tail
+    last.next = rest
+    if doubly:
+        rest.prev = last
+    return head, tail
+
+
+def _natural_merge_sort(head, before, doubly: bool) -> tuple:
+    """
+    Sorts the chain starting at `head` with a bottom-up natural merge sort, relinking the nodes.
+
+    The chain is first cut into its existing sorted runs. Strictly descending runs are reversed in place (strictness
+    keeps equal elements in their original order). Adjacent runs are then merged pairwise, level by level, until one
+    run is left, so no recursion is used and already (or reverse) sorted input takes a single O(n) pass.
+
+    Args:
+        head: The first node of the chain.
+        before (callable): The ordering test from `_comes_before`.
+        doubly (bool): True to keep `prev` pointers correct while relinking.
+
+    Returns:
+        tuple: The (head, tail) of the sorted chain.
+    """
+    runs = []
+    node = head
+    while node is not None:
+        start = node
+        nxt = node.next
+        if nxt is not None and before(nxt, node):
+            while nxt is not None and before(nxt, node):
+                node = nxt
+                nxt = nxt.next
+            end = node
+            prev, current = None, start
+            while prev is not end:
+                following = current.next
+                current.next = prev
+                if doubly:
+                    current.prev = following
+                prev, current = current, following
+            runs.append((end, start))
+        else:
+            while nxt is not None and not before(nxt, node):
+                node = nxt
+                nxt = nxt.next
+            node.next = None
+            runs.append((start, node))
+        node = nxt
+    while len(runs) > 1:
+        merged = [_merge_runs(*runs[i], *runs[i + 1], before, doubly) for i in range(0, len(runs) - 1, 2)]
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        runs = merged
+    head, tail = runs[0]
+    if doubly:
+        head.prev = None
+    return head, tail
+
+
+class SinglyLinkedList:
+    def __init__(self, iterable=None):
+        """
+        Initializes the list, optionally linking the elements of `iterable` in order.
+
+        Args:
+            iterable (iterable or None): Elements to add, first element at the head.
+        """
+        self.head = None
+        self.tail = None
+        self.length = 0
+        if iterable is not None:
+            self.extend(iterable)
+
+    @classmethod
+    def from_iterable(cls, iterable) -> "SinglyLinkedList":
+        """
+        Builds a list from the elements of `iterable`, linking the nodes in one pass.
+
+        Args:
+            iterable (iterable): Elements to add, first element at the head.
+
+        Returns:
+            SinglyLinkedList: The new list.
+        """
+        return cls(iterable)
+
+    def __len__(self) -> int:
+        """
+        Return the number of nodes in the list.
+
+        Returns:
+            int: The number of nodes.
+        """
+        return self.length
+
+    def extend(self, iterable) -> None:
+        """
+        Append every element of `iterable` at the end of the list in one pass.
+
+        Args:
+            iterable (iterable): The elements to append.
+
+        Returns:
+            None
+        """
+        dummy = Single_Node(None)
+        last = dummy
+        count = 0
+        for data in iterable:
+            node = Single_Node(data)
+            last.next = node
+            last = node
+            count += 1
+        if count == 0:
+            return
+        if self.tail is None:
+            self.head = dummy.next
+        else:
+            self.tail.next = dummy.next
+        self.tail = last
+        self.length += count
+
+    def insertAtBeginning(self, new_data: int) -> None:
+        """
+        Insert a new node with data at the beginning of the list.
+
+        Args:
+            new_data (int): The data to be inserted.
+
+        Returns:
+            None
+        """
+        new_node = Single_Node(new_data)
+        new_node.next = self.head
+        self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self.length += 1
+
+    def insertAfter(self, prev_node: Single_Node, new_data: int) -> None:
+        """
+        Insert a new node with data after a given node.
+
+        Args:
+            prev_node (Single_Node): The node after which the new node will be inserted.
+            new_data (int): The data to be inserted.
+
+        Returns:
+            None
+        """
+        if prev_node is None:
+            print("The given previous node must be in the linked list.")
+            return
+        new_node = Single_Node(new_data)
+        new_node.next = prev_node.next
+        prev_node.next = new_node
+        if prev_node is self.tail:
+            self.tail = new_node
+        self.length += 1
+
+    def insertAtEnd(self, new_data: int) -> None:
+        """
+        Insert a new node with data at the end of the list.
+
+        Args:
+            new_data (int): The data to be inserted.
+
+        Returns:
+            None
+        """
+        new_node = Single_Node(new_data)
+        if self.tail is None:
+            self.head = self.tail = new_node
+        else:
+            self.tail.next = new_node
+            self.tail = new_node
+        self.length += 1
+
+    def deleteNode(self, position: int) -> None:
+        """
+        Delete a node at a given position.
+
+        Args:
+            position (int): The position of the node to be deleted (0-based index).
+
+        Returns:
+            None
+        """
+        if position < 0 or position >= self.length:
+            return
+        temp = self.head
+        self.length -= 1
+        if position == 0:
+            self.head = temp.next
+            if self.head is None:
+                self.tail = None
+            return
+        for _ in range(position - 1):
+            temp = temp.next
+        next_node = temp.next.next
+        temp.next = next_node
+        if next_node is None:
+            self.tail = temp
+
+    def search(self, key: int) -> bool:
+        """
+        Search for a node with the given data.
+
+        Args:
+            key (int): The data to search for.
+
+        Returns:
+            bool: True if the node with the given data is found, False otherwise.
+        """
+        if self.tail is not None and self.tail.data == key:
+            return True
+        current = self.head
+        while current:
+            if current.data == key:
+                return True
+            current = current.next
+        return False
+
+    def sortLinkedList(self, key=None, reverse: bool = False) -> None:
+        """
+        Sort the linked list with a stable, non-recursive natural merge sort that relinks the nodes.
+
+        Args:
+            key (callable or None): Maps each element to the value it is sorted by. None sorts by the elements themselves.
+            reverse (bool): True to sort from largest to smallest (equal elements still keep their order).
+
+        Returns:
+            None
+        """
+        if self.head is None:
+            return
+        self.head, self.tail = _natural_merge_sort(self.head, _sort_order(self.head, key, reverse), False)
+
+    def mergeSorted(self, other: "SinglyLinkedList", key=None, reverse: bool = False) -> None:
+        """
+        Merge another sorted list into this sorted list in O(n + m) by relinking nodes; no node is allocated.
+
+        Both lists must already be sorted with the same `key` and `reverse`. On ties, elements of this list come
+        first. `other` is left empty.
+
+        Args:
+            other (SinglyLinkedList): The sorted list to merge in.
+            key (callable or None): The key both lists are sorted by.
+            reverse (bool): True if both lists are sorted from largest to smallest.
+
+        Returns:
+            None
+        """
+        if other is self:
+            return
+        self.head, self.tail = _merge_runs(self.head, self.tail, other.head, other.tail,
+                                           _comes_before(key, reverse), False)
+        self.length += other.length
+        other.head = other.tail = None
+        other.length = 0
+
+    def printList(self) -> None:
+        """
+        Print the linked list.
+
+        Returns:
+            None
+        """
+        temp = self.head
+        while temp:
+            print(str(temp.data) + " ", end="")
+            temp = temp.next
+        print()
+
+    def reverseList(self) -> None:
+        """
+        Reverse the linked list.
+
+        Returns:
+            None
+        """
+        prev = None
+        current = self.head
+        self.tail = current
+        while current:
+            next_node = current.next
+            current.next = prev
+            prev = current
+            current = next_node
+        self.head = prev
+
+
+"""
+Doubly Linked List (DLL)
+
+A doubly linked list is a linear data structure where each node contains a reference to both the next and the previous node in the sequence. This allows for bidirectional traversal.
+
+Time Complexity:
+- Insertion at the beginning: O(1)
+- Insertion at the end: O(1) (using the tail pointer)
+- Insertion after a node: O(1) (if the node is given)
+- Deletion: O(n) (because traversal is required, from whichever end is closer)
+- Node operations (`appendNode`, `removeNode`, `moveToEnd`): O(1), for callers that keep references to nodes
+- Search: O(n) (linear search)
+- Sorting: O(n log n) (natural merge sort that relinks nodes and sets `prev` pointers as it merges)
+- Merging two sorted lists (`mergeSorted`): O(n + m) with no new nodes
+- Reversing: O(n)
+- Bulk construction (`extend`, `from_iterable`): O(k) for k new elements
+- Length (`len`): O(1)
+
+Like the singly linked list, it keeps `tail` and a node count, and its nodes use `__slots__`.
+
+Applications:
+- Used in implementing advanced data structures like doubly linked trees
+- Useful for applications requiring bidirectional traversal
+- Ideal for scenarios where nodes are frequently inserted or removed from both ends
+
+"""
+
+
+class Double_Node:
+    __slots__ = ("data", "next", "prev")
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        self.prev = None
+
+
+class DoublyLinkedList:
+    def __init__(self, iterable=None):
+        """
+        Initializes the list, optionally linking the elements of `iterable` in order.
+
+        Args:
+            iterable (iterable or None): Elements to add, first element at the head.
+        """
+        self.head = None
+        self.tail = None
+        self.length = 0
+        if iterable is not None:
+            self.extend(iterable)
+
+    @classmethod
+    def from_iterable(cls, iterable) -> "DoublyLinkedList":
+        """
+        Builds a list from the elements of `iterable`, linking the nodes in one pass.
+
+        Args:
+            iterable (iterable): Elements to add, first element at the head.
+
+        Returns:
+            DoublyLinkedList: The new list.
+        """
+        return cls(iterable)
+
+    def __len__(self) -> int:
+        """
+        Return the number of nodes in the list.
+
+        Returns:
+            int: The number of nodes.
+        """
+        return self.length
+
+    def extend(self, iterable) -> None:
+        """
+        Append every element of `iterable` at the end of the list in one pass.
+
+        Args:
+            iterable (iterable): The elements to append.
+
+        Returns:
+            None
+        """
+        last = self.tail
+        count = 0
+        for data in iterable:
+            node = Double_Node(data)
+            node.prev = last
+            if last is None:
+                self.head = node
+            else:
+                last.next = node
+            last = node
+            count += 1
+        self.tail = last
+        self.length += count
+
+    def insertAtBeginning(self, new_data: int) -> None:
+        """
+        Insert a new node with data at the beginning of the list.
+
+        Args:
+            new_data (int): The data to be inserted.
+
+        Returns:
+            None
+        """
+        new_node = Double_Node(new_data)
+        new_node.next = self.head
+        if self.head is not None:
+            self.head.prev = new_node
+        else:
+            self.tail = new_node
+        self.head = new_node
+        self.length += 1
+
+    def insertAfter(self, prev_node: Double_Node, new_data: int) -> None:
+        """
+        Insert a new node with data after a given node.
+
+        Args:
+            prev_node (Double_Node): The node after which the new node will be inserted.
+            new_data (int): The data to be inserted.
+
+        Returns:
+            None
+        """
+        if prev_node is None:
+            print("The given previous node must be in the linked list.")
+            return
+        new_node = Double_Node(new_data)
+        new_node.next = prev_node.next
+        prev_node.next = new_node
+        new_node.prev = prev_node
+        if new_node.next is not None:
+            new_node.next.prev = new_node
+        else:
+            self.tail = new_node
+        self.length += 1
+
+    def insertAtEnd(self, new_data: int) -> None:
+        """
+        Insert a new node with data at the end of the list.
+
+        Args:
+            new_data (int): The data to be inserted.
+
+        Returns:
+            None
+        """
+        new_node = Double_Node(new_data)
+        if self.tail is None:
+            self.head = self.tail = new_node
+        else:
+            self.tail.next = new_node
+            new_node.prev = self.tail
+            self.tail = new_node
+        self.length += 1
+
+    def deleteNode(self, position: int) -> None:
+        """
+        Delete a node at a given position.
+
+        Args:
+            position (int): The position of the node to be deleted (0-based index).
+
+        Returns:
+            None
+        """
+        if position < 0 or position >= self.length:
+            return
+        if position < self.length // 2:
+            temp = self.head
+            for _ in range(position):
+                temp = temp.next
+        else:
+            temp = self.tail
+            for _ in range(self.length - 1 - position):
+                temp = temp.prev
+        if temp.prev is None:
+            self.head = temp.next
+        else:
+            temp.prev.next = temp.next
+        if temp.next is None:
+            self.tail = temp.prev
+        else:
+            temp.next.prev = temp.prev
+        self.length -= 1
+
+    def search(self, key: int) -> bool:
+        """
+        Search for a node with the given data.
+
+        Args:
+            key (int): The data to search for.
+
+        Returns:
+            bool: True if the node with the given data is found, False otherwise.
+        """
+        if self.tail is not None and self.tail.data == key:
+            return True
+        current = self.head
+        while current:
+            if current.data == key:
+                return True
+            current = current.next
+        return False
+
+    def sortLinkedList(self, key=None, reverse: bool = False) -> None:
+        """
+        Sort the linked list with a stable, non-recursive natural merge sort that relinks the nodes.
+
+        Args:
+            key (callable or None): Maps each element to the value it is sorted by. None sorts by the elements themselves.
+            reverse (bool): True to sort from largest to smallest (equal elements still keep their order).
+
+        Returns:
+            None
+        """
+        if self.head is None:
+            return
+        self.head, self.tail = _natural_merge_sort(self.head, _sort_order(self.head, key, reverse), True)
+
+    def mergeSorted(self, other: "DoublyLinkedList", key=None, reverse: bool = False) -> None:
+        """
+        Merge another sorted list into this sorted list in O(n + m) by relinking nodes; no node is allocated.
+
+        Both lists must already be sorted with the same `key` and `reverse`. On ties, elements of this list come
+        first. `other` is left empty.
+
+        Args:
+            other (DoublyLinkedList): The sorted list to merge in.
+            key (callable or None): The key both lists are sorted by.
+            reverse (bool): True if both lists are sorted from largest to smallest.
+
+        Returns:
+            None
+        """
+        if other is self:
+            return
+        self.head, self.tail = _merge_runs(self.head, self.tail, other.head, other.tail,
+                                           _comes_before(key, reverse), True)
+        self.length += other.length
+        other.head = other.tail = None
+        other.length = 0
+
+    def printList(self) -> None:
+        """
+        Print the linked list.
+
+        Returns:
+            None
+        """
+        temp = self.head
+        while temp:
+            print(str(temp.data) + " ", end="")
+            temp = temp.next
+        print()
+
+    def appendNode(self, node: Double_Node) -> None:
+        """
+        Link an existing, unlinked node at the end of the list.
+
+        Args:
+            node (Double_Node): The node to link. Subclasses of Double_Node may carry extra fields.
+
+        Returns:
+            None
+        """
+        node.next = None
+        node.prev = self.tail
+        if self.tail is None:
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        self.length += 1
+
+    def removeNode(self, node: Double_Node) -> None:
+        """
+        Unlink a node of this list in O(1), without searching for it.
+
+        Args:
+            node (Double_Node): A node currently in this list.
+
+        Returns:
+            None
+        """
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        node.prev = node.next = None
+        self.length -= 1
+
+    def moveToEnd(self, node: Double_Node) -> None:
+        """
+        Move a node of this list to the end in O(1).
+
+        Args:
+            node (Double_Node): A node currently in this list.
+
+        Returns:
+            None
+        """
+        following = node.next
+        if following is None:
+            return
+        if node.prev is None:
+            self.head = following
+        else:
+            node.prev.next = following
+        following.prev = node.prev
+        node.prev = self.tail
+        node.next = None
+        self.tail.next = node
+        self.tail = node
+
+    def reverseList(self) -> None:
+        """
+        Reverse the doubly linked list.
+
+        Returns:
+            None
+        """
+        temp = None
+        current = self.head
+        self.tail = current
+        while current is not None:
+            temp = current.prev
+            current.prev = current.next
+            current.next = temp
+            current = current.prev
+        if temp is not None:
+            self.head = temp.prev
+
+
+class Chunk:
+    __slots__ = ("items", "next")
+
+    def __init__(self, items: list):
+        self.items = items
+        self.next = None
+
+
+class UnrolledLinkedList:
+    """
+    Unrolled Linked List
+
+    An unrolled linked list stores up to `chunk_size` elements in each node (a `Chunk`) instead of one. Walking the list
+    touches one node per chunk rather than one per element, and each chunk's elements sit together in one Python
+    list, so `search`, `printList`, `reverseList` and iteration spend their time in C-level list operations instead of
+    pointer chasing.
+
+    Chunks are split and merged so they stay well filled:
+    - **Insertion** into a full chunk first splits it into two half-full chunks.
+    - **Deletion** that leaves a chunk less than half full merges it with the next chunk if both fit in one, and
+      otherwise moves elements over from the next chunk.
+
+    Positions are 0-based indexes. Since there is no node per element, `insertAfter` takes the position of the element
+    to insert after instead of a node.
+
+    Time Complexity (n elements, B = chunk_size):
+    - Indexed access (`list[i]`), insertion and deletion at a position: O(n/B + B)
+    - Insertion at the end: O(1)
+    - Search, iteration, reversing: O(n) with only n/B node hops
+    - Sorting: O(n log n) (stable, using `sorted`)
+    - Merging two sorted lists (`mergeSorted`): O(n + m)
+    - Length (`len`): O(1)
+
+    Applications:
+    - Large sequences that are mostly scanned, with occasional insertions and deletions in the middle
+    - Text editor buffers and other rope-like structures
+    - Reducing per-element memory and pointer overhead compared to a node-per-element list
+    """
+
+    def __init__(self, iterable=None, chunk_size: int = 64):
+        """
+        Initializes the list, optionally adding the elements of `iterable` in order.
+
+        Args:
+            iterable (iterable or None): Elements to add, first element at the head.
+            chunk_size (int): The maximum number of elements per chunk.
+
+        Raises:
+            ValueError: If `chunk_size` is less than 2.
+        """
+        if chunk_size < 2:
+            raise ValueError("chunk_size must be at least 2")
+        self.chunk_size = chunk_size
+        self.head = None
+        self.tail = None
+        self.length = 0
+        if iterable is not None:
+            self.extend(iterable)
+
+    @classmethod
+    def from_iterable(cls, iterable, chunk_size: int = 64) -> "UnrolledLinkedList":
+        """
+        Builds a list from the elements of `iterable`, filling whole chunks.
+
+        Args:
+            iterable (iterable): Elements to add, first element at the head.
+            chunk_size (int): The maximum number of elements per chunk.
+
+        Returns:
+            UnrolledLinkedList: The new list.
+        """
+        return cls(iterable, chunk_size)
+
+    def __len__(self) -> int:
+        """
+        Return the number of elements in the list.
+
+        Returns:
+            int: The number of elements.
+        """
+        return self.length
+
+    def __iter__(self):
+        """
+        Iterate over the elements from head to tail.
+
+        Yields:
+            any: Each element in order.
+        """
+        chunk = self.head
+        while chunk is not None:
+            yield from chunk.items
+            chunk = chunk.next
+
+    def __getitem__(self, index: int) -> any:
+        """
+        Return the element at `index`, skipping whole chunks on the way.
+
+        Args:
+            index (int): The position of the element; negative values count from the end.
+
+        Returns:
+            any: The element.
+
+        Raises:
+            IndexError: If `index` is out of range.
+        """
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("list index out of range")
+        chunk, offset = self._locate(index)
+        return chunk.items[offset]
+
+    def _locate(self, index: int) -> tuple:
+        """
+        Find the chunk holding position `index` (0 <= index < length).
+
+        Args:
+            index (int): The position to find.
+
+        Returns:
+            tuple: The (chunk, offset within the chunk).
+        """
+        tail_start = self.length - len(self.tail.items)
+        if index >= tail_start:
+            return self.tail, index - tail_start
+        chunk = self.head
+        while index >= len(chunk.items):
+            index -= len(chunk.items)
+            chunk = chunk.next
+        return chunk, index
+
+    def _append_chunk(self, chunk: Chunk) -> None:
+        """
+        Link `chunk` after the tail chunk.
+
+        Args:
+            chunk (Chunk): The chunk to link.
+
+        Returns:
+            None
+        """
+        if self.tail is None:
+            self.head = chunk
+        else:
+            self.tail.next = chunk
+        self.tail = chunk
+
+    def _split(self, chunk: Chunk) -> None:
+        """
+        Move the upper half of a full chunk into a new chunk linked right after it.
+
+        Args:
+            chunk (Chunk): The chunk to split.
+
+        Returns:
+            None
+        """
+        half = len(chunk.items) // 2
+        new_chunk = Chunk(chunk.items[half:])
+        del chunk.items[half:]
+        new_chunk.next = chunk.next
+        chunk.next = new_chunk
+        if chunk is self.tail:
+            self.tail = new_chunk
+
+    def extend(self, iterable) -> None:
+        """
+        Append every element of `iterable` at the end of the list, filling the tail chunk and then whole new chunks.
+
+        Args:
+            iterable (iterable): The elements to append.
+
+        Returns:
+            None
+        """
+        size = self.chunk_size
+        iterator = iter(iterable)
+        if self.tail is not None:
+            items = self.tail.items
+            before = len(items)
+            items.extend(islice(iterator, size - before))
+            self.length += len(items) - before
+        while True:
+            items = list(islice(iterator, size))
+            if not items:
+                return
+            self._append_chunk(Chunk(items))
+            self.length += len(items)
+
+    def insert(self, position: int, new_data: any) -> None:
+        """
+        Insert an element so that it ends up at `position`, splitting its chunk first if it is full.
+
+        Args:
+            position (int): The position for the new element; values past the end append, negative values prepend.
+            new_data (any): The data to be inserted.
+
+        Returns:
+            None
+        """
+        position = max(position, 0)
+        if position >= self.length:
+            self.insertAtEnd(new_data)
+            return
+        chunk, offset = self._locate(position)
+        if len(chunk.items) >= self.chunk_size:
+            self._split(chunk)
+            if offset > len(chunk.items):
+                offset -= len(chunk.items)
+                chunk = chunk.next
+        chunk.items.insert(offset, new_data)
+        self.length += 1
+
+    def insertAtBeginning(self, new_data: any) -> None:
+        """
+        Insert an element at the beginning of the list.
+
+        Args:
+            new_data (any): The data to be inserted.
+
+        Returns:
+            None
+        """
+        self.insert(0, new_data)
+
+    def insertAfter(self, position: int, new_data: any) -> None:
+        """
+        Insert an element after the element at a given position.
+
+        Args:
+            position (int): The position of the element after which the new element will be inserted (0-based index).
+            new_data (any): The data to be inserted.
+
+        Returns:
+            None
+        """
+        if position < 0 or position >= self.length:
+            print("The given position must be in the linked list.")
+            return
+        self.insert(position + 1, new_data)
+
+    def insertAtEnd(self, new_data: any) -> None:
+        """
+        Insert an element at the end of the list.
+
+        Args:
+            new_data (any): The data to be inserted.
+
+        Returns:
+            None
+        """
+        if self.tail is None or len(self.tail.items) >= self.chunk_size:
+            self._append_chunk(Chunk([new_data]))
+        else:
+            self.tail.items.append(new_data)
+        self.length += 1
+
+    def deleteNode(self, position: int) -> None:
+        """
+        Delete the element at a given position, merging or refilling its chunk if it drops below half full.
+
+        Args:
+            position (int): The position of the element to be deleted (0-based index).
+
+        Returns:
+            None
+        """
+        if position < 0 or position >= self.length:
+            return
+        prev, chunk = None, self.head
+        while position >= len(chunk.items):
+            position -= len(chunk.items)
+            prev, chunk = chunk, chunk.next
+        del chunk.items[position]
+        self.length -= 1
+        items = chunk.items
+        half = self.chunk_size // 2
+        following = chunk.next
+        if following is not None and len(items) < half:
+            if len(items) + len(following.items) <= self.chunk_size:
+                items.extend(following.items)
+                chunk.next = following.next
+                if following is self.tail:
+                    self.tail = chunk
+            else:
+                take = half - len(items)
+                items.extend(following.items[:take])
+                del following.items[:take]
+        elif not items:
+            if prev is None:
+                self.head = following
+            else:
+                prev.next = following
+            if chunk is self.tail:
+                self.tail = prev
+
+    def search(self, key: any) -> bool:
+        """
+        Search for an element, scanning each chunk with a single `in` test.
+
+        Args:
+            key (any): The data to search for.
+
+        Returns:
+            bool: True if the element is found, False otherwise.
+        """
+        chunk = self.head
+        while chunk is not None:
+            if key in chunk.items:
+                return True
+            chunk = chunk.next
+        return False
+
+    def sortLinkedList(self, key=None, reverse: bool = False) -> None:
+        """
+        Sort the list (stable) and repack it into full chunks.
+
+        Args:
+            key (callable or None): Maps each element to the value it is sorted by. None sorts by the elements themselves.
+            reverse (bool): True to sort from largest to smallest (equal elements still keep their order).
+
+        Returns:
+            None
+        """
+        self._rebuild(sorted(self, key=key, reverse=reverse))
+
+    def mergeSorted(self, other: "UnrolledLinkedList", key=None, reverse: bool = False) -> None:
+        """
+        Merge another sorted list into this sorted list in O(n + m). On ties, elements of this list come first.
+        `other` is left empty.
+
+        Args:
+            other (UnrolledLinkedList): The sorted list to merge in.
+            key (callable or None): The key both lists are sorted by.
+            reverse (bool): True if both lists are sorted from largest to smallest.
+
+        Returns:
+            None
+        """
+        if other is self:
+            return
+        self._rebuild(list(heapq.merge(self, other, key=key, reverse=reverse)))
+        other.head = other.tail = None
+        other.length = 0
+
+    def _rebuild(self, items: list) -> None:
+        """
+        Replace the contents of the list with `items`, packed into full chunks.
+
+        Args:
+            items (list): The new elements in order.
+
+        Returns:
+            None
+        """
+        self.head = self.tail = None
+        self.length = 0
+        self.extend(items)
+
+    def printList(self) -> None:
+        """
+        Print the linked list.
+
+        Returns:
+            None
+        """
+        print("".join(f"{data} " for data in self))
+
+    def reverseList(self) -> None:
+        """
+        Reverse the list by reversing the chunk order and the elements inside each chunk.
+
+        Returns:
+            None
+        """
+        prev = None
+        current = self.head
+        self.tail = current
+        while current:
+            current.items.reverse()
+            next_chunk = current.next
+            current.next = prev
+            prev = current
+            current = next_chunk
+        self.head = prev
+
+if __name__ == "__main__":
+    # Test SinglyLinkedList
+    sll = SinglyLinkedList()
+
+    print("Testing SinglyLinkedList:")
+
+    # Insert at the beginning
+    sll.insertAtBeginning(3)
+    sll.insertAtBeginning(2)
+    sll.insertAtBeginning(1)
+    print("List after inserting at beginning:")
+    sll.printList()  # Expected output: 1 2 3
+
+    # Insert at the end
+    sll.insertAtEnd(4)
+    sll.insertAtEnd(5)
+    print("List after inserting at end:")
+    sll.printList()  # Expected output: 1 2 3 4 5
+
+    # Insert after a node
+    second_node = sll.head.next
+    sll.insertAfter(second_node, 2.5)
+    print("List after inserting 2.5 after second node:")
+    sll.printList()  # Expected output: 1 2 2.5 3 4 5
+
+    # Delete a node
+    sll.deleteNode(3)
+    print("List after deleting node at position 3:")
+    sll.printList()  # Expected output: 1 2 2.5 4 5
+
+    # Search for a value
+    print("Search for 4 in the list:")
+    print(sll.search(4))  # Expected output: True
+
+    print("Search for 6 in the list:")
+    print(sll.search(6))  # Expected output: False
+
+    # Sort the list
+    sll.sortLinkedList()
+    print("List after sorting:")
+    sll.printList()  # Expected output: 1 2 2.5 4 5
+
+    # Reverse the list
+    sll.reverseList()
+    print("List after reversing:")
+    sll.printList()  # Expected output: 5 4 2.5 2 1
+
+    # Sort by key, largest first, and merge in another sorted list
+    sll.sortLinkedList(key=abs, reverse=True)
+    sll.mergeSorted(SinglyLinkedList([6, 3, -1]), key=abs, reverse=True)
+    print("List after merging [6, 3, -1]:")
+    sll.printList()  # Expected output: 6 5 4 3 2.5 2 1 -1
+
+    # Test DoublyLinkedList
+    dll = DoublyLinkedList()
+
+    print("Testing DoublyLinkedList:")
+
+    # Insert at the beginning
+    dll.insertAtBeginning(3)
+    dll.insertAtBeginning(2)
+    dll.insertAtBeginning(1)
+    print("List after inserting at beginning:")
+    dll.printList()  # Expected output: 1 2 3
+
+    # Insert at the end
+    dll.insertAtEnd(4)
+    dll.insertAtEnd(5)
+    print("List after inserting at end:")
+    dll.printList()  # Expected output: 1 2 3 4 5
+
+    # Insert after a node
+    second_node = dll.head.next
+    dll.insertAfter(second_node, 2.5)
+    print("List after inserting 2.5 after second node:")
+    dll.printList()  # Expected output: 1 2 2.5 3 4 5
+
+    # Delete a node
+    dll.deleteNode(3)
+    print("List after deleting node at position 3:")
+    dll.printList()  # Expected output: 1 2 2.5 4 5
+
+    # Search for a value
+    print("Search for 4 in the list:")
+    print(dll.search(4))  # Expected output: True
+
+    print("Search for 6 in the list:")
+    print(dll.search(6))  # Expected output: False
+
+    # Sort the list
+    dll.sortLinkedList()
+    print("List after sorting:")
+    dll.printList()  # Expected output: 1 2 2.5 4 5
+
+    # Reverse the list
+    dll.reverseList()
+    print("List after reversing:")
+    dll.printList()  # Expected output: 5 4 2.5 2 1
+
+    # Sort by key, largest first, and merge in another sorted list
+    dll.sortLinkedList(key=abs, reverse=True)
+    dll.mergeSorted(DoublyLinkedList([6, 3, -1]), key=abs, reverse=True)
+    print("List after merging [6, 3, -1]:")
+    dll.printList()  # Expected output: 6 5 4 3 2.5 2 1 -1
+
+    # Test UnrolledLinkedList
+    ull = UnrolledLinkedList(range(1, 9), chunk_size=4)
+
+    print("Testing UnrolledLinkedList:")
+    ull.printList()  # Expected output: 1 2 3 4 5 6 7 8
+    ull.insertAfter(1, 2.5)  # splits the full first chunk
+    ull.insertAtBeginning(0)
+    print("List after inserting 2.5 after position 1 and 0 at the beginning:")
+    ull.printList()  # Expected output: 0 1 2 2.5 3 4 5 6 7 8
+    print(ull[3], len(ull))  # Expected output: 2.5 10
+    ull.deleteNode(3)
+    print("Search for 7 in the list:")
+    print(ull.search(7))  # Expected output: True
+    ull.reverseList()
+    print("List after deleting position 3 and reversing:")
+    ull.printList()  # Expected output: 8 7 6 5 4 3 2 1 0
@@ -0,0 +1,273 @@
+"""
+Ordered Map Mixin for Binary Search Trees
+
+`OrderedMapMixin` adds the ordered-map API to a binary search tree whose nodes carry a key and a `data` value. It is
+shared by `AVLTree` and `RedBlackTree`, which differ only in how they name the key and mark a missing child:
+- `_key`: a callable returning a node's key (an `operator.attrgetter`).
+- `_nil`: the missing-child marker (None, or a sentinel node such as the red-black tree's TNULL).
+- `root`: the root node (`_nil` when the tree is empty).
+- `insert(key, data)`: inserts a key, or replaces the data of an existing key.
+- `_delete_key(key)`: removes a key that is in the tree.
+
+Operations:
+1. **Mapping access**: `tree[key] = data`, `tree[key]`, `del tree[key]`, `get(key, default)`, `key in tree`.
+2. **Range**: `range(lo, hi, reverse=False)` lazily yields the (key, data) pairs with lo <= key <= hi, in ascending
+   (or descending) key order. `items()` and iteration over the keys are built on it.
+3. **Neighbours**: `floor` / `ceiling` / `predecessor` / `successor` return the nearest entry at or below / at or above /
+   strictly below / strictly above a key, which does not have to be in the tree.
+4. **Pop**: `pop_min` / `pop_max` remove and return the smallest / largest entry.
+
+Time Complexity (for a balanced tree of n keys):
+    - **Mapping access**: O(log n).
+    - **Range**: O(log n + k) time for k entries, O(log n) memory: an explicit stack holds at most one root-to-leaf path.
+    - **Neighbours / Pop**: O(log n).
+
+Applications:
+    - Time series and leaderboards that are paged through by key without materializing the whole tree.
+    - Interval lookups ("the latest entry at or before t") with floor / ceiling.
+"""
+
+
+class OrderedMapMixin:
+    """
+    Ordered-map methods for a binary search tree. See the module docstring for what the tree has to provide.
+    """
+
+    _nil = None
+
+    def _lookup(self, key: any):
+        """
+        Find the node holding `key`, iteratively.
+
+        Args:
+            key (any): The key.
+
+        Returns:
+            The node, or None if the key is absent.
+        """
+        get_key, nil = self._key, self._nil
+        node = self.root
+        while node is not nil:
+            node_key = get_key(node)
+            if key < node_key:
+                node = node.left
+            elif node_key < key:
+                node = node.right
+            else:
+                return node
+        return None
+
+    def get(self, key: any, default: any = None) -> any:
+        """
+        Return the data mapped to `key`.
+
+        Args:
+            key (any): The key.
+            default (any): Returned if the key is absent.
+
+        Returns:
+            any: The data, or `default`.
+        """
+        node = self._lookup(key)
+        return default if node is None else node.data
+
+    def __getitem__(self, key: any) -> any:
+        """
+        Return the data mapped to `key`.
+
+        Raises:
+            KeyError: If the key is absent.
+        """
+        node = self._lookup(key)
+        if node is None:
+            raise KeyError(key)
+        return node.data
+
+    def __setitem__(self, key: any, data: any) -> None:
+        """
+        Map `key` to `data`, inserting the key if needed.
+        """
+        self.insert(key, data)
+
+    def __delitem__(self, key: any) -> None:
+        """
+        Delete `key`.
+
+        Raises:
+            KeyError: If the key is absent.
+        """
+        if self._lookup(key) is None:
+            raise KeyError(key)
+        self._delete_key(key)
+
+    def __contains__(self, key: any) -> bool:
+        """
+        Check if `key` is in the tree.
+        """
+        return self._lookup(key) is not None
+
+    def range(self, lo: any = None, hi: any = None, reverse: bool = False):
+        """
+        Lazily iterate over the (key, data) pairs with `lo <= key <= hi`, in ascending (or descending) key order.
+
+        Finding the first entry takes O(log n); each further entry is amortized O(1), so k entries cost
+        O(log n + k). The explicit stack holds at most one root-to-leaf path, O(log n) memory. The tree must not be
+        modified while the iterator is in use.
+
+        Args:
+            lo (any): The lower bound (inclusive), or None for no lower bound.
+            hi (any): The upper bound (inclusive), or None for no upper bound.
+            reverse (bool): True to iterate from `hi` down to `lo`.
+
+        Yields:
+            tuple: Each (key, data) pair.
+        """
+        get_key, nil = self._key, self._nil
+        stack = []
+        node = self.root
+        if not reverse:
+            while node is not nil:
+                if lo is not None and get_key(node) < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            while stack:
+                node = stack.pop()
+                key = get_key(node)
+                if hi is not None and hi < key:
+                    return
+                yield key, node.data
+                node = node.right
+                while node is not nil:
+                    stack.append(node)
+                    node = node.left
+        else:
+            while node is not nil:
+                if hi is not None and hi < get_key(node):
+                    node = node.left
+                else:
+                    stack.append(node)
+                    node = node.right
+            while stack:
+                node = stack.pop()
+                key = get_key(node)
+                if lo is not None and key < lo:
+                    return
+                yield key, node.data
+                node = node.left
+                while node is not nil:
+                    stack.append(node)
+                    node = node.right
+
+    def items(self):
+        """
+        Lazily iterate over all (key, data) pairs in ascending key order.
+
+        Yields:
+            tuple: Each (key, data) pair.
+        """
+        return self.range()
+
+    def __iter__(self):
+        """
+        Lazily iterate over the keys in ascending order.
+
+        Yields:
+            any: Each key.
+        """
+        for key, _ in self.range():
+            yield key
+
+    def _closest(self, key: any, below: bool, inclusive: bool) -> tuple:
+        """
+        Find the nearest key below (or above) `key`, walking one root-to-leaf path.
+
+        Args:
+            key (any): The reference key.
+            below (bool): True for the largest key below `key`, False for the smallest key above it.
+            inclusive (bool): True to accept `key` itself.
+
+        Returns:
+            tuple: The (key, data) pair, or None if there is no such key.
+        """
+        get_key, nil = self._key, self._nil
+        best = None
+        node = self.root
+        while node is not nil:
+            node_key = get_key(node)
+            if inclusive and node_key == key:
+                return node_key, node.data
+            if (node_key < key) if below else (key < node_key):
+                best = node
+                node = node.right if below else node.left
+            else:
+                node = node.left if below else node.right
+        return (get_key(best), best.data) if best is not None else None
+
+    def floor(self, key: any) -> tuple:
+        """
+        Return the entry with the largest key `<= key`, or None if every key is larger.
+        """
+        return self._closest(key, True, True)
+
+    def ceiling(self, key: any) -> tuple:
+        """
+        Return the entry with the smallest key `>= key`, or None if every key is smaller.
+        """
+        return self._closest(key, False, True)
+
+    def predecessor(self, key: any) -> tuple:
+        """
+        Return the entry with the largest key `< key`, or None. `key` does not have to be in the tree.
+        """
+        return self._closest(key, True, False)
+
+    def successor(self, key: any) -> tuple:
+        """
+        Return the entry with the smallest key `> key`, or None. `key` does not have to be in the tree.
+        """
+        return self._closest(key, False, False)
+
+    def _pop_edge(self, smallest: bool) -> tuple:
+        """
+        Remove and return the entry with the smallest (or largest) key.
+
+        Raises:
+            KeyError: If the tree is empty.
+        """
+        nil = self._nil
+        node = self.root
+        if node is nil:
+            raise KeyError(f"{'pop_min' if smallest else 'pop_max'} from an empty tree")
+        child = node.left if smallest else node.right
+        while child is not nil:
+            node = child
+            child = node.left if smallest else node.right
+        entry = (self._key(node), node.data)
+        self._delete_key(entry[0])
+        return entry
+
+    def pop_min(self) -> tuple:
+        """
+        Remove and return the entry with the smallest key.
+
+        Returns:
+            tuple: The (key, data) pair.
+
+        Raises:
+            KeyError: If the tree is empty.
+        """
+        return self._pop_edge(True)
+
+    def pop_max(self) -> tuple:
+        """
+        Remove and return the entry with the largest key.
+
+        Returns:
+            tuple: The (key, data) pair.
+
+        Raises:
+            KeyError: If the tree is empty.
+        """
+        return self._pop_edge(False)
@@ -0,0 +1,653 @@
+"""
+Persistent Hash Map (memory-mapped file)
+
+A disk-backed variant of `SimpleHashMap`. The whole table lives in one file that is opened with `mmap`, so opening is
+O(1) whatever the file size, and `get_data` touches only the few pages it needs: one bucket and one heap record.
+Nothing is rebuilt or loaded at startup.
+
+File layout (version 1, little endian):
+1. **Header** (72 bytes): magic `b"DSAPHMAP"`, format version, flags, bucket count, live entry count, tombstone count,
+   heap start, heap end, index end, dead heap bytes.
+2. **Bucket array**: `bucket_count` (a power of two) slots of 16 bytes, each holding the key's 64-bit hash and the file
+   offset of its heap record. Offset 0 marks an empty slot and 1 a tombstone. Collisions use linear probing.
+3. **Value heap**: an append-only log of records, each 8-byte aligned. A record has a 16-byte header (CRC32, flags, key
+   length, value length), the encoded key, and the pickled value. A delete is a record with the delete flag and no
+   value.
+
+Keys may be `bytes`, `str` or `int`; they are encoded with a type tag and hashed with BLAKE2b, so hashes are stable
+across processes. Values are pickled, so only open files you trust.
+
+Crash safety (append, then index):
+1. The record is appended after `heap end`, then `heap end` is moved past it. This commits the record.
+2. The record is applied to the bucket array (the hash is written before the offset, so a half-written slot is never
+   mistaken for a live one), then `index end` is moved up to `heap end`.
+Opening a file whose `index end` is behind its `heap end` (a crash between the steps) replays the committed records
+after `index end` and recounts the entries. Applying a record twice has no further effect, and a record that fails its
+CRC ends the replay. With `sync=True` every step is flushed to disk in order, which also survives power loss; without
+it, writes reach the OS page cache and survive a crash of the process.
+
+Compaction:
+- Overwritten and deleted records leave dead bytes in the heap, and deletes leave tombstones in the bucket array.
+- `compact()` writes the live entries to a new file with a freshly sized bucket array and atomically renames it over the
+  old one, so a crash leaves either the old or the new file. It runs automatically when the buckets would exceed
+  `max_load_factor` or when dead bytes outweigh live ones.
+
+Bulk build:
+- `PersistentHashMap.build(path, items)` streams (key, value) pairs into a heap, sizes the bucket array once the count
+  is known, and indexes everything in one pass. With `sorted_keys=True`, repeated keys are adjacent, so they are dropped
+  while streaming and the index pass never reads keys back from the heap.
+
+Operations:
+1. **Insert** (`insert_data`): append and index a record.
+2. **Delete** (`remove_data`): append a delete record and leave a tombstone.
+3. **Retrieve** (`get_data`): probe the bucket array and read one record.
+4. **Print** (`print_table`): print every live entry.
+
+Time Complexity:
+- Open: O(1) (plus a replay of the records written after the last completed operation, after a crash)
+- `get_data` / `insert_data` / `remove_data`: O(1) average
+- `compact` / `build`: O(n)
+
+Applications:
+Lookup tables that must be available immediately after a restart, read-mostly indexes larger than RAM, and caches
+shared between processes that open the same file.
+"""
+
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import zlib
+from array import array
+
+MAGIC = b"DSAPHMAP"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sIIQQQQQQQ")  # magic, version, flags, then the seven `_FIELDS`
+_BUCKET = struct.Struct("<QQ")  # key hash, record offset
+_RECORD = struct.Struct("<IIII")  # crc32, flags, key length, value length
+_EMPTY = 0
+_DELETED = 1
+_DELETE_FLAG = 1
+_FIELDS = ("bucket_count", "count", "tombstones", "heap_start", "heap_end", "index_end", "dead_bytes")
+
+
+def _encode_key(key) -> bytes:
+    """
+    Encodes a key with a one-byte type tag, so equal keys always have equal encodings.
+
+    Args:
+        key (bytes, str or int): The key.
+
+    Returns:
+        bytes: The encoded key.
+
+    Raises:
+        TypeError: If the key has another type.
+    """
+    if isinstance(key, bytes):
+        return b"b" + key
+    if isinstance(key, str):
+        return b"s" + key.encode("utf-8")
+    if isinstance(key, int) and not isinstance(key, bool):
+        return b"i" + str(key).encode("ascii")
+    raise TypeError(f"keys must be bytes, str or int, not {type(key).__name__}")
+
+
+def _decode_key(data: bytes):
+    """
+    Decodes a key produced by `_encode_key`.
+    """
+    tag, body = data[:1], data[1:]
+    if tag == b"b":
+        return bytes(body)
+    if tag == b"s":
+        return body.decode("utf-8")
+    return int(body)
+
+
+def _hash(encoded: bytes) -> int:
+    """
+    Returns a 64-bit hash of an encoded key that is the same in every process.
+    """
+    return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), "little")
+
+
+def _record(encoded: bytes, payload: bytes, flags: int = 0) -> bytes:
+    """
+    Builds one heap record, padded to a multiple of 8 bytes.
+
+    Args:
+        encoded (bytes): The encoded key.
+        payload (bytes): The pickled value (empty for a delete record).
+        flags (int): `_DELETE_FLAG` for a delete record, else 0.
+
+    Returns:
+        bytes: The record.
+    """
+    crc = zlib.crc32(payload, zlib.crc32(encoded, flags))
+    body = _RECORD.pack(crc, flags, len(encoded), len(payload)) + encoded + payload
+    return body + bytes(-len(body) % 8)
+
+
+def _record_size(key_length: int, value_length: int) -> int:
+    """
+    Returns the padded size of a record.
+    """
+    size = _RECORD.size + key_length + value_length
+    return size + (-size % 8)
+
+
+class PersistentHashMap:
+    def __init__(self, path: str, sync: bool = False, max_load_factor: float = 0.5, bucket_count: int = 1024):
+        """
+        Opens the table stored at `path`, creating an empty one if the file does not exist.
+
+        Args:
+            path (str): The table file.
+            sync (bool): True to flush every write to disk in commit order (slower, survives power loss).
+            max_load_factor (float): The fraction of buckets (entries plus tombstones) that triggers a compaction.
+            bucket_count (int): The number of buckets of a newly created file. Rounded up to a power of two.
+
+        Raises:
+            ValueError: If the file is not a table of a supported version.
+        """
+        self.path = path
+        self.sync = sync
+        self.max_load_factor = max_load_factor
+        if not os.path.exists(path):
+            size = 8
+            while size < bucket_count:
+                size *= 2
+            self._create(path, size)
+        self._open()
+
+    @staticmethod
+    def _create(path: str, bucket_count: int, records=()) -> None:
+        """
+        Writes an empty table (or one whose heap holds `records`, not yet indexed) and atomically moves it to `path`.
+
+        Args:
+            path (str): The destination file.
+            bucket_count (int): The number of buckets, a power of two.
+            records (iterable): Records (bytes) to place after the bucket array.
+
+        Returns:
+            None
+        """
+        heap_start = _HEADER.size + bucket_count * _BUCKET.size
+        temp = path + ".tmp"
+        with open(temp, "wb") as file:
+            file.truncate(heap_start)
+            file.seek(heap_start)
+            heap_end = heap_start
+            for record in records:
+                file.write(record)
+                heap_end += len(record)
+            file.seek(0)
+            file.write(_HEADER.pack(MAGIC, VERSION, 0, bucket_count, 0, 0, heap_start, heap_end, heap_start, 0))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp, path)
+
+    def _open(self) -> None:
+        """
+        Maps the file, checks its header and replays any records committed but not yet indexed.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the file is not a table of a supported version.
+        """
+        self._file = open(self.path, "r+b")
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        magic, version, _, *fields = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a persistent hash map")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"{self.path} has format version {version}, expected {VERSION}")
+        (self.bucket_count, self.count, self.tombstones, self.heap_start, self.heap_end, self.index_end,
+         self.dead_bytes) = fields
+        self._mask = self.bucket_count - 1
+        if self.index_end < self.heap_end:
+            self._recover()
+
+    def _write_header(self, *names: str) -> None:
+        """
+        Writes the named header fields (each an aligned 8-byte write), in the order given.
+
+        Args:
+            *names (str): Field names from `_FIELDS`.
+
+        Returns:
+            None
+        """
+        for name in names:
+            struct.pack_into("<Q", self._mm, 16 + 8 * _FIELDS.index(name), getattr(self, name))
+
+    def _flush(self) -> None:
+        if self.sync:
+            self._mm.flush()
+
+    def _slot_offset(self, slot: int) -> int:
+        return _HEADER.size + slot * _BUCKET.size
+
+    def _find(self, encoded: bytes, h: int) -> tuple:
+        """
+        Probes the bucket array for an encoded key.
+
+        Args:
+            encoded (bytes): The encoded key.
+            h (int): Its hash.
+
+        Returns:
+            tuple: (slot, record offset) of the key, or (first free slot, 0) if it is absent.
+        """
+        mm = self._mm
+        mask = self._mask
+        i = h & mask
+        free = -1
+        while True:
+            slot_hash, offset = _BUCKET.unpack_from(mm, _HEADER.size + i * _BUCKET.size)
+            if offset == _EMPTY:
+                return (i if free < 0 else free), 0
+            if offset == _DELETED:
+                if free < 0:
+                    free = i
+            elif slot_hash == h:
+                _, _, key_length, _ = _RECORD.unpack_from(mm, offset)
+                start = offset + _RECORD.size
+                if mm[start:start + key_length] == encoded:
+                    return i, offset
+            i = (i + 1) & mask
+
+    def _read_record(self, offset: int) -> tuple:
+        """
+        Reads the record at `offset`.
+
+        Returns:
+            tuple: (flags, encoded key, value bytes, padded size).
+        """
+        mm = self._mm
+        _, flags, key_length, value_length = _RECORD.unpack_from(mm, offset)
+        start = offset + _RECORD.size
+        return (flags, mm[start:start + key_length], mm[start + key_length:start + key_length + value_length],
+                _record_size(key_length, value_length))
+
+    def _apply(self, offset: int) -> None:
+        """
+        Makes the bucket array reflect the committed record at `offset`. Applying a record again has no effect.
+
+        Args:
+            offset (int): The record's file offset.
+
+        Returns:
+            None
+        """
+        flags, encoded, _, size = self._read_record(offset)
+        encoded = bytes(encoded)
+        h = _hash(encoded)
+        slot, current = self._find(encoded, h)
+        position = self._slot_offset(slot)
+        if current == offset:
+            return
+        if current:
+            self.dead_bytes += self._read_record(current)[3]
+        if flags & _DELETE_FLAG:
+            self.dead_bytes += size
+            if current:
+                struct.pack_into("<Q", self._mm, position + 8, _DELETED)
+                self.count -= 1
+                self.tombstones += 1
+            return
+        if not current:
+            if _BUCKET.unpack_from(self._mm, position)[1] == _DELETED:
+                self.tombstones -= 1
+            self.count += 1
+            struct.pack_into("<Q", self._mm, position, h)  # hash first, offset last
+        struct.pack_into("<Q", self._mm, position + 8, offset)
+
+    def _recover(self) -> None:
+        """
+        Replays the committed records that were not indexed when the file was last closed, then recounts the entries.
+
+        Returns:
+            None
+        """
+        offset = self.index_end
+        while offset < self.heap_end:
+            if offset + _RECORD.size > len(self._mm):
+                break
+            crc, flags, key_length, value_length = _RECORD.unpack_from(self._mm, offset)
+            start = offset + _RECORD.size
+            end = start + key_length + value_length
+            if end > len(self._mm) or zlib.crc32(self._mm[start + key_length:end],
+                                                 zlib.crc32(self._mm[start:start + key_length], flags)) != crc:
+                break
+            self._apply(offset)
+            offset += _record_size(key_length, value_length)
+        self.heap_end = offset
+        count = tombstones = 0
+        live_bytes = 0
+        for slot in range(self.bucket_count):
+            record_offset = _BUCKET.unpack_from(self._mm, self._slot_offset(slot))[1]
+            if record_offset == _DELETED:
+                tombstones += 1
+            elif record_offset != _EMPTY:
+                count += 1
+                live_bytes += self._read_record(record_offset)[3]
+        self.count, self.tombstones = count, tombstones
+        self.dead_bytes = self.heap_end - self.heap_start - live_bytes
+        self.index_end = self.heap_end
+        self._write_header("heap_end", "count", "tombstones", "dead_bytes", "index_end")
+        self._mm.flush()
+
+    def _append(self, record: bytes) -> None:
+        """
+        Appends a record to the heap and commits it (step 1), then indexes it (step 2).
+
+        Args:
+            record (bytes): A record from `_record`.
+
+        Returns:
+            None
+        """
+        offset = self.heap_end
+        end = offset + len(record)
+        if end > len(self._mm):
+            self._mm.resize(max(end, 2 * len(self._mm), len(self._mm) + (1 << 20)))
+        self._mm[offset:end] = record
+        self._flush()
+        self.heap_end = end
+        self._write_header("heap_end")
+        self._flush()
+        self._apply(offset)
+        self.index_end = end
+        self._write_header("count", "tombstones", "dead_bytes", "index_end")
+        self._flush()
+
+    def _needs_compaction(self, extra_slots: int) -> bool:
+        """
+        Checks the bucket load and the share of dead heap bytes.
+        """
+        if self.count + self.tombstones + extra_slots > self.bucket_count * self.max_load_factor:
+            return True
+        live = self.heap_end - self.heap_start - self.dead_bytes
+        return self.dead_bytes > max(live, 1 << 20)
+
+    def insert_data(self, key, data: any) -> None:
+        """
+        Insert data into the table with the given key, replacing any previous data.
+
+        Args:
+            key (bytes, str or int): The key for the data.
+            data (any): The data to be stored. Must be picklable.
+
+        Returns:
+            None
+        """
+        if self._needs_compaction(1):
+            self.compact()
+        self._append(_record(_encode_key(key), pickle.dumps(data, pickle.HIGHEST_PROTOCOL)))
+
+    def remove_data(self, key) -> None:
+        """
+        Remove data from the table with the given key.
+
+        Args:
+            key (bytes, str or int): The key for the data to be removed.
+
+        Returns:
+            None
+        """
+        encoded = _encode_key(key)
+        if self._find(encoded, _hash(encoded))[1]:
+            self._append(_record(encoded, b"", _DELETE_FLAG))
+
+    def get_data(self, key) -> any:
+        """
+        Retrieve data from the table using the given key.
+
+        Args:
+            key (bytes, str or int): The key for the data to be retrieved.
+
+        Returns:
+            any: The data associated with the key, or None if the key does not exist.
+        """
+        encoded = _encode_key(key)
+        offset = self._find(encoded, _hash(encoded))[1]
+        if not offset:
+            return None
+        return pickle.loads(self._read_record(offset)[2])
+
+    def __contains__(self, key) -> bool:
+        """
+        Checks if `key` is in the table.
+
+        Args:
+            key (bytes, str or int): The key.
+
+        Returns:
+            bool: True if the key is present, False otherwise.
+        """
+        encoded = _encode_key(key)
+        return self._find(encoded, _hash(encoded))[1] != 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of entries.
+
+        Returns:
+            int: The number of entries.
+        """
+        return self.count
+
+    def items(self):
+        """
+        Iterates over the (key, data) pairs, in bucket order.
+
+        Yields:
+            tuple: Each (key, data) pair.
+        """
+        for slot in range(self.bucket_count):
+            offset = _BUCKET.unpack_from(self._mm, self._slot_offset(slot))[1]
+            if offset > _DELETED:
+                _, encoded, payload, _ = self._read_record(offset)
+                yield _decode_key(encoded), pickle.loads(payload)
+
+    def print_table(self) -> None:
+        """
+        Print all key-value pairs in the table.
+
+        Returns:
+            None
+        """
+        for key, data in self.items():
+            print(f'{key}: {data}')
+
+    def compact(self) -> None:
+        """
+        Rewrites the live entries into a new file with a bucket array sized for them, and atomically replaces the
+        old file with it.
+
+        Returns:
+            None
+        """
+        bucket_count = 8
+        while bucket_count * self.max_load_factor < 2 * (self.count + 1):
+            bucket_count *= 2
+        self._create(self.path, bucket_count, self._live_records())
+        self.close()
+        self._open()  # the new heap is committed but not indexed yet, so opening indexes it
+
+    def _live_records(self):
+        """
+        Yields the raw bytes of every live record, in bucket order.
+        """
+        for slot in range(self.bucket_count):
+            offset = _BUCKET.unpack_from(self._mm, self._slot_offset(slot))[1]
+            if offset > _DELETED:
+                _, _, key_length, value_length = _RECORD.unpack_from(self._mm, offset)
+                yield self._mm[offset:offset + _record_size(key_length, value_length)]
+
+    @classmethod
+    def build(cls, path: str, items, sorted_keys: bool = False, max_load_factor: float = 0.5,
+              sync: bool = False) -> "PersistentHashMap":
+        """
+        Builds a table from a stream of (key, value) pairs, replacing any existing file at `path`.
+
+        The records are streamed to a temporary file, so only 16 bytes per entry (hash and offset) are held in memory.
+        For a repeated key the last value wins.
+
+        Args:
+            path (str): The table file to create.
+            items (iterable): (key, value) pairs.
+            sorted_keys (bool): True if equal keys are adjacent in `items` (e.g. the stream is sorted by key).
+            max_load_factor (float): The bucket load of the new table.
+            sync (bool): Passed on to the opened table.
+
+        Returns:
+            PersistentHashMap: The opened table.
+        """
+        hashes, offsets = array("Q"), array("Q")
+        directory = os.path.dirname(os.path.abspath(path))
+        with tempfile.TemporaryFile(dir=directory) as heap:
+            size = 0
+            pending = None  # the last record is held back so an adjacent repeat of its key can replace it
+            for key, value in items:
+                encoded = _encode_key(key)
+                record = _record(encoded, pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+                if pending is not None and not (sorted_keys and pending[0] == encoded):
+                    heap.write(pending[1])
+                    hashes.append(_hash(pending[0]))
+                    offsets.append(size)
+                    size += len(pending[1])
+                pending = (encoded, record)
+            if pending is not None:
+                heap.write(pending[1])
+                hashes.append(_hash(pending[0]))
+                offsets.append(size)
+                size += len(pending[1])
+            bucket_count = 8
+            while bucket_count * max_load_factor < len(offsets) + 1:
+                bucket_count *= 2
+            heap_start = _HEADER.size + bucket_count * _BUCKET.size
+            heap.seek(0)
+            temp = path + ".tmp"
+            with open(temp, "wb") as file:
+                file.write(bytes(_HEADER.size))
+                file.truncate(heap_start)
+                file.seek(heap_start)
+                while True:
+                    chunk = heap.read(1 << 20)
+                    if not chunk:
+                        break
+                    file.write(chunk)
+        with open(temp, "r+b") as file:
+            mm = mmap.mmap(file.fileno(), 0)
+            mask = bucket_count - 1
+            count = 0
+            dead = 0
+            for h, relative in zip(hashes, offsets):
+                offset = heap_start + relative
+                i = h & mask
+                while True:
+                    position = _HEADER.size + i * _BUCKET.size
+                    slot_hash, current = _BUCKET.unpack_from(mm, position)
+                    if current == _EMPTY:
+                        _BUCKET.pack_into(mm, position, h, offset)
+                        count += 1
+                        break
+                    if not sorted_keys and slot_hash == h and cls._same_key(mm, current, offset):
+                        dead += _record_size(*_RECORD.unpack_from(mm, current)[2:])
+                        _BUCKET.pack_into(mm, position, h, offset)
+                        break
+                    i = (i + 1) & mask
+            heap_end = heap_start + size
+            _HEADER.pack_into(mm, 0, MAGIC, VERSION, 0, bucket_count, count, 0, heap_start, heap_end, heap_end, dead)
+            mm.flush()
+            mm.close()
+            os.fsync(file.fileno())
+        os.replace(temp, path)
+        return cls(path, sync=sync, max_load_factor=max_load_factor)
+
+    @staticmethod
+    def _same_key(mm, first: int, second: int) -> bool:
+        """
+        Checks if the records at two offsets have the same key.
+        """
+        first_length = _RECORD.unpack_from(mm, first)[2]
+        second_length = _RECORD.unpack_from(mm, second)[2]
+        return (first_length == second_length and
+                mm[first + _RECORD.size:first + _RECORD.size + first_length] ==
+                mm[second + _RECORD.size:second + _RECORD.size + second_length])
+
+    def stats(self) -> dict:
+        """
+        Returns the table's occupancy and file usage.
+
+        Returns:
+            dict: `count`, `tombstones`, `bucket_count`, `load_factor`, `heap_bytes`, `dead_bytes` and `file_bytes`.
+        """
+        return dict(count=self.count, tombstones=self.tombstones, bucket_count=self.bucket_count,
+                    load_factor=(self.count + self.tombstones) / self.bucket_count,
+                    heap_bytes=self.heap_end - self.heap_start, dead_bytes=self.dead_bytes, file_bytes=len(self._mm))
+
+    def flush(self) -> None:
+        """
+        Flushes every pending write to disk.
+
+        Returns:
+            None
+        """
+        self._mm.flush()
+
+    def close(self) -> None:
+        """
+        Unmaps and closes the file. Unflushed writes still reach the file through the OS.
+
+        Returns:
+            None
+        """
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+if __name__ == "__main__":
+    import shutil
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "table.phm")
+
+    with PersistentHashMap(path) as table:
+        table.insert_data("apple", 1)
+        table.insert_data("banana", [2, 3])
+        table.insert_data(42, {"answer": True})
+        table.insert_data("apple", 10)
+        table.remove_data("banana")
+        print(table.get_data("apple"), table.get_data("banana"), len(table))  # Expected output: 10 None 2
+
+    with PersistentHashMap(path) as table:  # reopening maps the file, nothing is loaded
+        print(table.get_data(42))  # Expected output: {'answer': True}
+        table.compact()
+        print(sorted(map(str, dict(table.items()))), table.stats()["dead_bytes"])  # Expected output: ['42', 'apple'] 0
+
+    table = PersistentHashMap.build(path, ((i // 2, i) for i in range(10)), sorted_keys=True)
+    print(len(table), table.get_data(3))  # Expected output: 5 7
+    table.close()
+    shutil.rmtree(directory)
@@ -0,0 +1,1176 @@
+"""
+Queue Data Structure
+
+This module implements a queue backed by a growable ring buffer. A queue is a linear data structure that follows the First In, First Out (FIFO) principle.
+
+The ring buffer is a preallocated list of slots with a head index and a count. The tail is (head + count) % capacity, so neither
+enqueue nor dequeue ever shifts elements. When the buffer is full its capacity doubles, and when it drops to a quarter full it
+halves (never below the initial capacity), which keeps both operations amortized O(1) and bounds wasted memory.
+
+Operations:
+1. **Enqueue**: Adds an element to the rear of the queue. This operation writes the element into the tail slot.
+2. **Dequeue**: Removes an element from the front of the queue. This operation reads the head slot and advances the head index.
+3. **Enqueue Many**: Adds several elements to the rear of the queue with at most two slice assignments.
+4. **Dequeue Many**: Removes up to n elements from the front of the queue with at most two slice copies.
+5. **Display**: Shows all elements in the queue from front to rear. This operation involves traversing the entire buffer to present its contents.
+6. **Size**: Returns the number of elements currently in the queue. This operation retrieves the element count.
+7. **Is Empty**: Checks if the queue is empty. This operation verifies whether the element count is zero.
+
+The `queue` attribute, which used to be the backing list, is now a read-only property returning a copy of the items in order.
+
+Time Complexity:
+    - **Enqueue**: O(1) amortized (O(n) when the buffer doubles)
+    - **Dequeue**: O(1) amortized (O(n) when the buffer halves)
+    - **Enqueue Many**: O(k) amortized, where k is the number of elements added
+    - **Dequeue Many**: O(k), where k is the number of elements removed
+    - **Display**: O(n) (linear time as it requires traversing the entire buffer to show its contents)
+    - **Size**: O(1) (constant time as it retrieves the element count)
+    - **Is Empty**: O(1) (constant time as it checks the element count)
+
+Applications:
+    - Queues are used in scenarios such as scheduling tasks, handling requests in web servers, and breadth-first search algorithms.
+"""
+
+
+import struct
+import threading
+import time
+from collections import deque
+from queue import Empty, Full
+
+
+class Queue:
+    def __init__(self, capacity: int = 16):
+        """
+        Initializes an empty queue.
+
+        Args:
+            capacity (int): The initial number of slots in the ring buffer. The buffer never shrinks below this size.
+        """
+        self._min_capacity = max(1, capacity)
+        self._slots = [None] * self._min_capacity
+        self._head = 0
+        self._count = 0
+
+    @property
+    def queue(self) -> list:
+        """
+        The items from front to rear, as a new list. Read-only: this was the backing list before the ring buffer, and is
+        kept for code that reads it; changing the returned list does not change the queue.
+        """
+        return self._items(self._count)
+
+    def _resize(self, new_capacity: int) -> None:
+        """
+        Copies the items into a new buffer of `new_capacity` slots, unwrapping them so the head is at slot 0.
+
+        Args:
+            new_capacity (int): The number of slots in the new buffer. Must be at least the current size.
+
+        Returns:
+            None
+        """
+        self._slots = self._items(self._count) + [None] * (new_capacity - self._count)
+        self._head = 0
+
+    def _items(self, n: int) -> list:
+        """
+        Returns the first `n` items from the front of the queue without removing them.
+
+        Args:
+            n (int): The number of items to return. Must not exceed the current size.
+
+        Returns:
+            list: The items in FIFO order.
+        """
+        end = self._head + n
+        capacity = len(self._slots)
+        if end <= capacity:
+            return self._slots[self._head:end]
+        return self._slots[self._head:] + self._slots[:end - capacity]
+
+    def enqueue(self, item: any) -> None:
+        """
+        Adds an item to the end of the queue.
+
+        Args:
+            item (any): The item to be added to the queue.
+
+        Returns:
+            None
+        """
+        capacity = len(self._slots)
+        if self._count == capacity:
+            self._resize(capacity * 2)
+            capacity *= 2
+        self._slots[(self._head + self._count) % capacity] = item
+        self._count += 1
+
+    def enqueue_many(self, items) -> None:
+        """
+        Adds several items to the end of the queue, in order.
+
+        Args:
+            items (iterable): The items to be added to the queue.
+
+        Returns:
+            None
+        """
+        items = list(items)
+        k = len(items)
+        if k == 0:
+            return
+        capacity = len(self._slots)
+        if self._count + k > capacity:
+            while self._count + k > capacity:
+                capacity *= 2
+            self._resize(capacity)
+        tail = (self._head + self._count) % capacity
+        first = min(k, capacity - tail)
+        self._slots[tail:tail + first] = items[:first]
+        self._slots[:k - first] = items[first:]
+        self._count += k
+
+    def dequeue(self) -> any:
+        """
+        Removes the item from the front of the queue.
+
+        Returns:
+            any: The item that was removed from the queue. If the queue is empty, returns a message "Queue is empty".
+        """
+        if self._count < 1:
+            return "Queue is empty"
+        item = self._slots[self._head]
+        self._slots[self._head] = None  # drop the reference so the item can be freed
+        self._head = (self._head + 1) % len(self._slots)
+        self._count -= 1
+        self._maybe_shrink()
+        return item
+
+    def dequeue_many(self, n: int) -> list:
+        """
+        Removes up to `n` items from the front of the queue.
+
+        Args:
+            n (int): The maximum number of items to remove.
+
+        Returns:
+            list: The removed items in FIFO order. Empty if the queue is empty.
+        """
+        k = min(max(n, 0), self._count)
+        if k == 0:
+            return []
+        items = self._items(k)
+        capacity = len(self._slots)
+        end = self._head + k
+        if end <= capacity:
+            self._slots[self._head:end] = [None] * k
+        else:
+            self._slots[self._head:] = [None] * (capacity - self._head)
+            self._slots[:end - capacity] = [None] * (end - capacity)
+        self._head = end % capacity
+        self._count -= k
+        self._maybe_shrink()
+        return items
+
+    def _maybe_shrink(self) -> None:
+        """
+        Halves the buffer (repeatedly) while it is at most a quarter full and above its initial capacity.
+
+        Returns:
+            None
+        """
+        capacity = len(self._slots)
+        if self._count > capacity // 4 or capacity <= self._min_capacity:
+            return
+        while self._count <= capacity // 4 and capacity // 2 >= self._min_capacity:
+            capacity //= 2
+        if capacity != len(self._slots):
+            self._resize(capacity)
+
+    def display(self) -> None:
+        """
+        Displays the items in the queue.
+
+        Returns:
+            None
+        """
+        print(self._items(self._count))
+
+    def size(self) -> int:
+        """
+        Returns the number of items in the queue.
+
+        Returns:
+            int: The number of items in the queue.
+        """
+        return self._count
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the queue is empty.
+
+        Returns:
+            bool: True if the queue is empty, False otherwise.
+        """
+        return self._count == 0
+
+
+"""
+Deque Data Structure using collections.deque
+
+This module implements a deque using the collections.deque class. A deque (double-ended queue) allows insertion and deletion of items from both ends efficiently.
+
+Time Complexity:
+- `append_left`: O(1)
+- `append_right`: O(1)
+- `pop_left`: O(1)
+- `pop_right`: O(1)
+- `peek_left`: O(1)
+- `peek_right`: O(1)
+- `is_empty`: O(1)
+- `size`: O(1)
+
+Applications:
+Deques are used in scenarios such as implementing a queue with both ends accessible, maintaining history in applications, and managing buffer data.
+"""
+
+
+class Deque:
+    def __init__(self):
+        """Initializes an empty deque."""
+        self.queue = deque()
+
+    def append_left(self, item: any) -> None:
+        """
+        Adds an item to the front of the deque.
+
+        Args:
+            item (any): The item to be added to the front of the deque.
+
+        Returns:
+            None
+        """
+        self.queue.appendleft(item)
+
+    def append_right(self, item: any) -> None:
+        """
+        Adds an item to the end of the deque.
+
+        Args:
+            item (any): The item to be added to the end of the deque.
+
+        Returns:
+            None
+        """
+        self.queue.append(item)
+
+    def pop_left(self) -> any:
+        """
+        Removes the item from the front of the deque.
+
+        Returns:
+            any: The item that was removed from the front of the deque. If the deque is empty, returns None.
+        """
+        if self.queue:
+            return self.queue.popleft()
+        else:
+            print("Deque is empty, cannot pop from the front.")
+            return None
+
+    def pop_right(self) -> any:
+        """
+        Removes the item from the end of the deque.
+
+        Returns:
+            any: The item that was removed from the end of the deque. If the deque is empty, returns None.
+        """
+        if self.queue:
+            return self.queue.pop()
+        else:
+            print("Deque is empty, cannot pop from the end.")
+            return None
+
+    def peek_left(self) -> any:
+        """
+        Retrieves the item from the front of the deque without removing it.
+
+        Returns:
+            any: The item at the front of the deque. If the deque is empty, returns None.
+        """
+        if self.queue:
+            return self.queue[0]
+        else:
+            print("Deque is empty, no front item.")
+            return None
+
+    def peek_right(self) -> any:
+        """
+        Retrieves the item from the end of the deque without removing it.
+
+        Returns:
+            any: The item at the end of the deque. If the deque is empty, returns None.
+        """
+        if self.queue:
+            return self.queue[-1]
+        else:
+            print("Deque is empty, no end item.")
+            return None
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the deque is empty.
+
+        Returns:
+            bool: True if the deque is empty, False otherwise.
+        """
+        return len(self.queue) == 0
+
+    def size(self) -> int:
+        """
+        Returns the number of items in the deque.
+
+        Returns:
+            int: The number of items in the deque.
+        """
+        return len(self.queue)
+
+    def display(self) -> None:
+        """
+        Displays the items in the deque.
+
+        Returns:
+            None
+        """
+        print(self.queue)
+
+
+"""
+Circular Queue Data Structure using collections.deque
+
+This module implements a circular queue using the collections.deque class. A circular queue efficiently manages elements in a fixed-size buffer by reusing space.
+
+Time Complexity:
+- `enqueue`: O(1)
+- `dequeue`: O(1)
+- `display`: O(n)
+- `is_empty`: O(1)
+- `size`: O(1)
+
+Applications:
+Circular queues are used in scenarios such as buffer management in circular buffers, implementing round-robin scheduling algorithms, and managing resources with fixed capacities.
+"""
+
+
+class CircularQueue:
+    def __init__(self, size: int):
+        """
+        Initializes a circular queue with a fixed size.
+
+        Args:
+            size (int): The maximum number of items the circular queue can hold.
+
+        Returns:
+            None
+        """
+        self.max_size = size  # Renamed to avoid conflict
+        self.queue = deque(maxlen=size)
+
+    def enqueue(self, data: any) -> None:
+        """
+        Adds an item to the end of the circular queue.
+
+        Args:
+            data (any): The item to be added to the queue.
+
+        Returns:
+            None
+        """
+        self.queue.append(data)  # O(1) operation
+
+    def dequeue(self) -> any:
+        """
+        Removes the item from the front of the circular queue.
+
+        Returns:
+            any: The item that was removed from the front of the queue. If the queue is empty, prints a message and returns None.
+        """
+        if not self.queue:
+            print("Queue is empty")
+            return None
+        return self.queue.popleft()  # O(1) operation
+
+    def display(self) -> None:
+        """
+        Displays the items in the circular queue.
+
+        Returns:
+            None
+        """
+        if not self.queue:
+            print("Queue is empty")
+        else:
+            print("Queue elements:", list(self.queue))
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the circular queue is empty.
+
+        Returns:
+            bool: True if the queue is empty, False otherwise.
+        """
+        return len(self.queue) == 0
+
+    def size(self) -> int:
+        """
+        Returns the number of items in the circular queue.
+
+        Returns:
+            int: The number of items in the circular queue.
+        """
+        return len(self.queue)
+
+
+"""
+Blocking Circular Queue (thread-safe, multi-producer/multi-consumer)
+
+This module implements a bounded circular queue that can be shared by any number of producer and consumer threads.
+Unlike `CircularQueue`, which always overwrites the oldest item when full, the full-queue behaviour is an explicit policy:
+
+- `BLOCK` (default): producers wait until a consumer frees a slot, giving back-pressure instead of silent data loss.
+- `OVERWRITE`: producers never wait; the oldest item is dropped and counted in the `overwritten` statistic.
+
+One lock guards the buffer, with two conditions on it: `not_empty` wakes a single consumer per item and `not_full` wakes a
+single producer per freed slot, so waiters are not stampeded. `get_many` drains a whole batch under one lock acquisition,
+which amortizes locking for consumers that can process items in groups.
+
+Errors follow the standard library `queue` module: `put_nowait`/`put` raise `queue.Full` and `get_nowait`/`get` raise
+`queue.Empty` when they cannot complete.
+
+Statistics (see `stats()`):
+- `puts`, `gets`: items added and removed.
+- `overwritten`: items dropped by the OVERWRITE policy.
+- `contended`: lock acquisitions that found the lock already held by another thread.
+- `put_waits`, `get_waits`: how many times a producer/consumer had to wait on a full/empty queue.
+- `put_wait_time`, `get_wait_time`: total seconds spent in those waits.
+
+Time Complexity:
+- `put` / `put_nowait`: O(1) (excluding waiting)
+- `get` / `get_nowait`: O(1) (excluding waiting)
+- `get_many`: O(k), where k is the number of items returned
+- `size` / `is_empty` / `is_full`: O(1)
+
+Applications:
+Bounded producer/consumer pipelines where dropped work is data loss, thread pools fed from a shared work queue, and rate
+matching between fast producers and slow consumers.
+"""
+
+
+class BlockingCircularQueue(CircularQueue):
+    BLOCK = "block"
+    OVERWRITE = "overwrite"
+
+    def __init__(self, size: int, policy: str = BLOCK):
+        """
+        Initializes a thread-safe circular queue with a fixed size.
+
+        Args:
+            size (int): The maximum number of items the queue can hold.
+            policy (str): What `put` does when the queue is full: BLOCK waits for space, OVERWRITE drops the oldest item.
+
+        Raises:
+            ValueError: If size is not positive or policy is unknown.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if policy not in (self.BLOCK, self.OVERWRITE):
+            raise ValueError(f"policy must be {self.BLOCK!r} or {self.OVERWRITE!r}")
+        super().__init__(size)
+        self.policy = policy
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+        self._stats = dict.fromkeys(
+            ("puts", "gets", "overwritten", "contended", "put_waits", "get_waits"), 0)
+        self._stats["put_wait_time"] = 0.0
+        self._stats["get_wait_time"] = 0.0
+
+    def _acquire(self) -> None:
+        """
+        Acquires the lock, counting the acquisition as contended if another thread holds it.
+
+        Returns:
+            None
+        """
+        if not self.lock.acquire(blocking=False):
+            self.lock.acquire()
+            self._stats["contended"] += 1
+
+    def _wait(self, condition: threading.Condition, ready, timeout, kind: str) -> bool:
+        """
+        Waits on `condition` until `ready()` is true or the timeout expires. Must be called with the lock held.
+
+        Args:
+            condition (threading.Condition): The condition to wait on.
+            ready (callable): Returns True once the caller can proceed.
+            timeout (float or None): Maximum seconds to wait, or None to wait forever.
+            kind (str): "put" or "get", used to select the statistics to update.
+
+        Returns:
+            bool: True if `ready()` became true, False on timeout.
+        """
+        if ready():
+            return True
+        self._stats[kind + "_waits"] += 1
+        start = time.perf_counter()
+        ok = condition.wait_for(ready, timeout)
+        self._stats[kind + "_wait_time"] += time.perf_counter() - start
+        return ok
+
+    def put(self, data: any, block: bool = True, timeout: float = None) -> None:
+        """
+        Adds an item to the end of the queue.
+
+        Args:
+            data (any): The item to be added to the queue.
+            block (bool): Under the BLOCK policy, whether to wait for a free slot when the queue is full.
+            timeout (float or None): Maximum seconds to wait for a free slot, or None to wait forever.
+
+        Returns:
+            None
+
+        Raises:
+            queue.Full: If the queue is still full when the wait ends (BLOCK policy only).
+        """
+        self._acquire()
+        try:
+            if len(self.queue) >= self.max_size:
+                if self.policy == self.OVERWRITE:
+                    self._stats["overwritten"] += 1
+                elif not block or not self._wait(self.not_full, lambda: len(self.queue) < self.max_size,
+                                                 timeout, "put"):
+                    raise Full
+            self.queue.append(data)  # the deque's maxlen drops the oldest item under OVERWRITE
+            self._stats["puts"] += 1
+            self.not_empty.notify()
+        finally:
+            self.lock.release()
+
+    def put_nowait(self, data: any) -> None:
+        """
+        Adds an item without waiting.
+
+        Args:
+            data (any): The item to be added to the queue.
+
+        Returns:
+            None
+
+        Raises:
+            queue.Full: If the queue is full under the BLOCK policy.
+        """
+        self.put(data, block=False)
+
+    def get(self, block: bool = True, timeout: float = None) -> any:
+        """
+        Removes the item from the front of the queue.
+
+        Args:
+            block (bool): Whether to wait for an item when the queue is empty.
+            timeout (float or None): Maximum seconds to wait for an item, or None to wait forever.
+
+        Returns:
+            any: The item that was removed from the front of the queue.
+
+        Raises:
+            queue.Empty: If the queue is still empty when the wait ends.
+        """
+        self._acquire()
+        try:
+            if not block or not self._wait(self.not_empty, lambda: len(self.queue) > 0, timeout, "get"):
+                if not self.queue:
+                    raise Empty
+            item = self.queue.popleft()
+            self._stats["gets"] += 1
+            self.not_full.notify()
+            return item
+        finally:
+            self.lock.release()
+
+    def get_nowait(self) -> any:
+        """
+        Removes the item from the front of the queue without waiting.
+
+        Returns:
+            any: The item that was removed from the front of the queue.
+
+        Raises:
+            queue.Empty: If the queue is empty.
+        """
+        return self.get(block=False)
+
+    def get_many(self, max_n: int, timeout: float = None) -> list:
+        """
+        Removes up to `max_n` items under a single lock acquisition.
+
+        Waits (up to `timeout`) only for the first item; whatever else is already queued is taken without further waiting.
+
+        Args:
+            max_n (int): The maximum number of items to return.
+            timeout (float or None): Maximum seconds to wait for the first item, 0 to not wait, or None to wait forever.
+
+        Returns:
+            list: The removed items in FIFO order. Empty if the wait timed out.
+        """
+        self._acquire()
+        try:
+            if timeout == 0:
+                ready = len(self.queue) > 0
+            else:
+                ready = self._wait(self.not_empty, lambda: len(self.queue) > 0, timeout, "get")
+            if not ready:
+                return []
+            popleft = self.queue.popleft
+            items = [popleft() for _ in range(min(max_n, len(self.queue)))]
+            self._stats["gets"] += len(items)
+            self.not_full.notify(len(items))
+            return items
+        finally:
+            self.lock.release()
+
+    def enqueue(self, data: any) -> None:
+        """
+        Adds an item to the end of the queue, following the queue's full-queue policy.
+
+        Args:
+            data (any): The item to be added to the queue.
+
+        Returns:
+            None
+        """
+        self.put(data)
+
+    def dequeue(self) -> any:
+        """
+        Removes the item from the front of the queue without waiting.
+
+        Returns:
+            any: The item that was removed from the front of the queue, or None if the queue is empty.
+        """
+        try:
+            return self.get_nowait()
+        except Empty:
+            return None
+
+    def is_full(self) -> bool:
+        """
+        Checks if the queue is full.
+
+        Returns:
+            bool: True if the queue holds `max_size` items, False otherwise.
+        """
+        return len(self.queue) >= self.max_size
+
+    def stats(self) -> dict:
+        """
+        Returns a snapshot of the queue's counters.
+
+        Returns:
+            dict: The counters described in the section docstring above.
+        """
+        with self.lock:
+            return dict(self._stats)
+
+
+"""
+Shared-Memory Circular Queue (cross-process, single-producer/single-consumer)
+
+This module implements a circular queue of fixed-width records that lives in a `multiprocessing.shared_memory` block, so a
+producer process and a consumer process exchange records without pickling or copying them through a pipe.
+
+Layout of the shared block:
+- bytes 0-7: head (records consumed so far), written only by the consumer
+- bytes 64-71: tail (records produced so far), written only by the producer
+- bytes 128-: `size` record slots of `record_size` bytes each; record i lives in slot i % size
+
+Head and tail only ever grow and sit on separate cache lines, so with exactly one producer and one consumer no lock is needed:
+the producer fills slots and then publishes them by advancing the tail, and the consumer reads slots and then frees them by
+advancing the head. Using more than one producer or more than one consumer on the same queue is not supported.
+
+Records are described either by a `struct` format string (e.g. "qd" for an int64 and a float64) or, if NumPy is installed,
+by a NumPy dtype (e.g. "i8" or [("id", "i8"), ("value", "f8")]); every method works with either. Zero-copy access works
+in two steps on each side:
+- Producer: `reserve(n)` returns a writable memoryview over up to n contiguous free slots; write into it, then `commit(k)`.
+- Consumer: `peek_batch(n)` returns a memoryview over up to n contiguous ready records (or `peek_array` for a NumPy view);
+  read from it, then `release(k)`. Views must not be used after their slots are committed/released.
+`put`/`get`/`put_many`/`get_many` wrap these with struct (or dtype) packing for convenience.
+
+The queue pickles by name, so it can be passed to a `multiprocessing` worker, which attaches to the same block.
+The creating process owns the block and should call `unlink()` once every process has called `close()`.
+
+Time Complexity:
+- `put` / `get`: O(1) (excluding waiting)
+- `reserve` / `commit` / `peek_batch` / `release`: O(1)
+- `put_many` / `get_many`: O(k), where k is the number of records moved
+- `size` / `is_empty` / `is_full`: O(1)
+
+Applications:
+Feeding a `multiprocessing` pool with small fixed-width records (ids, offsets, measurements) at rates where pickling through
+`multiprocessing.Queue` dominates the cost.
+"""
+
+
+class _DtypeStruct:
+    """
+    The part of the `struct.Struct` interface the queue uses (`size`, `pack_into`, `unpack_from`, `iter_unpack`), for
+    records described by a NumPy dtype. Records are tuples of field values, as with `struct`.
+    """
+
+    def __init__(self, dtype):
+        import numpy as np
+        self._np = np
+        self.dtype = np.dtype(dtype)
+        self.size = self.dtype.itemsize
+
+    def pack_into(self, buffer, offset: int, *fields) -> None:
+        record = self._np.frombuffer(buffer, self.dtype, 1, offset)
+        record[0] = fields if self.dtype.names else fields[0]
+
+    def unpack_from(self, buffer, offset: int = 0) -> tuple:
+        value = self._np.frombuffer(buffer, self.dtype, 1, offset)[0].item()
+        return value if self.dtype.names else (value,)
+
+    def iter_unpack(self, buffer) -> list:
+        # a list rather than a generator, so the array is gone and the caller can release `buffer`
+        values = self._np.frombuffer(buffer, self.dtype).tolist()
+        return values if self.dtype.names else [(value,) for value in values]
+
+
+class SharedCircularQueue:
+    HEADER_SIZE = 128
+    _HEAD = 0  # index of the head counter in the header viewed as uint64
+    _TAIL = 8  # index of the tail counter, 64 bytes after the head
+
+    def __init__(self, size: int, fmt: str = "q", dtype=None, name: str = None, create: bool = True):
+        """
+        Creates a shared-memory circular queue, or attaches to an existing one.
+
+        Args:
+            size (int): The number of record slots.
+            fmt (str): The `struct` format of one record. Ignored if `dtype` is given.
+            dtype: A NumPy dtype describing one record. Requires NumPy.
+            name (str or None): The shared memory block name. None picks a unique name (create only).
+            create (bool): True to create the block, False to attach to the existing block called `name`.
+
+        Raises:
+            ValueError: If size is not positive.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.max_size = size
+        self.fmt = fmt
+        self.dtype = dtype
+        self._struct = struct.Struct(fmt) if dtype is None else _DtypeStruct(dtype)
+        self.record_size = self._struct.size
+        data_size = size * self.record_size
+        from multiprocessing import shared_memory  # imported here so plain Queue users do not load multiprocessing
+        self._shm = shared_memory.SharedMemory(name=name, create=create, size=self.HEADER_SIZE + data_size)
+        self._counters = self._shm.buf[:self.HEADER_SIZE].cast("Q")
+        self._data = self._shm.buf[self.HEADER_SIZE:self.HEADER_SIZE + data_size]
+        if create:
+            self._counters[self._HEAD] = 0
+            self._counters[self._TAIL] = 0
+
+    @classmethod
+    def attach(cls, name: str, size: int, fmt: str = "q", dtype=None) -> "SharedCircularQueue":
+        """
+        Attaches to a queue created by another process.
+
+        Args:
+            name (str): The shared memory block name (the creator's `name` attribute).
+            size (int): The number of record slots the queue was created with.
+            fmt (str): The record `struct` format the queue was created with.
+            dtype: The record NumPy dtype the queue was created with, if any.
+
+        Returns:
+            SharedCircularQueue: A handle on the same shared block.
+        """
+        return cls(size, fmt, dtype, name=name, create=False)
+
+    def __reduce__(self):
+        return (type(self).attach, (self.name, self.max_size, self.fmt, self.dtype))
+
+    @property
+    def name(self) -> str:
+        """The name other processes use to attach to this queue."""
+        return self._shm.name
+
+    def _wait(self, ready, timeout) -> bool:
+        """
+        Polls `ready()` with a short backoff until it is true or the timeout expires.
+
+        Args:
+            ready (callable): Returns True once the caller can proceed.
+            timeout (float or None): Maximum seconds to wait, or None to wait forever.
+
+        Returns:
+            bool: True if `ready()` became true, False on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        spins = 0
+        while not ready():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0 if spins < 100 else 0.0001)
+            spins += 1
+        return True
+
+    # Producer side
+
+    def reserve(self, n: int) -> memoryview:
+        """
+        Returns a writable view over up to `n` contiguous free slots at the tail. Does not publish anything.
+
+        Args:
+            n (int): The maximum number of records the caller wants to write.
+
+        Returns:
+            memoryview: A byte view of k * record_size bytes (k may be 0 if the queue is full).
+        """
+        tail = self._counters[self._TAIL]
+        free = self.max_size - (tail - self._counters[self._HEAD])
+        slot = tail % self.max_size
+        k = min(n, free, self.max_size - slot)
+        return self._data[slot * self.record_size:(slot + k) * self.record_size]
+
+    def commit(self, k: int) -> None:
+        """
+        Publishes `k` records written into the view returned by `reserve`.
+
+        Args:
+            k (int): The number of records written.
+
+        Returns:
+            None
+        """
+        self._counters[self._TAIL] += k
+
+    def put(self, *fields, block: bool = True, timeout: float = None) -> None:
+        """
+        Packs one record from `fields` and adds it to the end of the queue.
+
+        Args:
+            *fields: The record's field values, in `fmt` order.
+            block (bool): Whether to wait for a free slot when the queue is full.
+            timeout (float or None): Maximum seconds to wait, or None to wait forever.
+
+        Returns:
+            None
+
+        Raises:
+            queue.Full: If the queue is still full when the wait ends.
+        """
+        if self.is_full() and (not block or not self._wait(lambda: not self.is_full(), timeout)):
+            raise Full
+        tail = self._counters[self._TAIL]
+        self._struct.pack_into(self._data, (tail % self.max_size) * self.record_size, *fields)
+        self._counters[self._TAIL] = tail + 1
+
+    def put_many(self, records) -> None:
+        """
+        Packs and adds every record in `records`, filling contiguous runs of slots before each publish.
+
+        Args:
+            records (iterable): Tuples of field values, in `fmt` order. Waits for space as needed.
+
+        Returns:
+            None
+        """
+        records = list(records)
+        pack_into, record_size = self._struct.pack_into, self.record_size
+        i = 0
+        while i < len(records):
+            view = self.reserve(len(records) - i)
+            k = len(view) // record_size
+            if k == 0:
+                self._wait(lambda: not self.is_full(), None)
+                continue
+            for j in range(k):
+                pack_into(view, j * record_size, *records[i + j])
+            self.commit(k)
+            i += k
+
+    def enqueue(self, data: any) -> None:
+        """
+        Adds a record to the end of the queue, waiting while the queue is full.
+
+        Args:
+            data (any): A tuple of field values, or a single value for one-field records.
+
+        Returns:
+            None
+        """
+        self.put(*data) if isinstance(data, tuple) else self.put(data)
+
+    # Consumer side
+
+    def peek_batch(self, max_n: int) -> memoryview:
+        """
+        Returns a read view over up to `max_n` contiguous ready records at the head, without consuming them.
+
+        Args:
+            max_n (int): The maximum number of records to expose.
+
+        Returns:
+            memoryview: A byte view of k * record_size bytes (k may be 0 if the queue is empty).
+        """
+        head = self._counters[self._HEAD]
+        ready = self._counters[self._TAIL] - head
+        slot = head % self.max_size
+        k = min(max_n, ready, self.max_size - slot)
+        return self._data[slot * self.record_size:(slot + k) * self.record_size]
+
+    def peek_array(self, max_n: int):
+        """
+        Returns a NumPy view over up to `max_n` contiguous ready records, without consuming them. Requires a dtype.
+
+        Args:
+            max_n (int): The maximum number of records to expose.
+
+        Returns:
+            numpy.ndarray: A zero-copy array of the ready records.
+        """
+        import numpy as np
+        return np.frombuffer(self.peek_batch(max_n), dtype=self.dtype)
+
+    def release(self, k: int) -> None:
+        """
+        Frees the first `k` records at the head for the producer to reuse.
+
+        Args:
+            k (int): The number of records consumed.
+
+        Returns:
+            None
+        """
+        self._counters[self._HEAD] += k
+
+    def get(self, block: bool = True, timeout: float = None) -> tuple:
+        """
+        Removes the record at the front of the queue and unpacks it.
+
+        Args:
+            block (bool): Whether to wait for a record when the queue is empty.
+            timeout (float or None): Maximum seconds to wait, or None to wait forever.
+
+        Returns:
+            tuple: The record's field values.
+
+        Raises:
+            queue.Empty: If the queue is still empty when the wait ends.
+        """
+        if self.is_empty() and (not block or not self._wait(lambda: not self.is_empty(), timeout)):
+            raise Empty
+        head = self._counters[self._HEAD]
+        record = self._struct.unpack_from(self._data, (head % self.max_size) * self.record_size)
+        self._counters[self._HEAD] = head + 1
+        return record
+
+    def get_many(self, max_n: int) -> list:
+        """
+        Removes and unpacks up to `max_n` ready records without waiting.
+
+        Args:
+            max_n (int): The maximum number of records to return.
+
+        Returns:
+            list: The records as tuples, in FIFO order. Empty if the queue is empty.
+        """
+        records = []
+        while len(records) < max_n:
+            view = self.peek_batch(max_n - len(records))
+            if not view:
+                break
+            k = len(view) // self.record_size
+            records.extend(self._struct.iter_unpack(view))
+            view.release()
+            self.release(k)
+        return records
+
+    def dequeue(self) -> any:
+        """
+        Removes the record at the front of the queue without waiting.
+
+        Returns:
+            any: The record's field values as a tuple, or None if the queue is empty.
+        """
+        try:
+            return self.get(block=False)
+        except Empty:
+            return None
+
+    def size(self) -> int:
+        """
+        Returns the number of records in the queue.
+
+        Returns:
+            int: The number of records in the queue.
+        """
+        return self._counters[self._TAIL] - self._counters[self._HEAD]
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the queue is empty.
+
+        Returns:
+            bool: True if the queue is empty, False otherwise.
+        """
+        return self.size() == 0
+
+    def is_full(self) -> bool:
+        """
+        Checks if the queue is full.
+
+        Returns:
+            bool: True if every slot holds an unconsumed record, False otherwise.
+        """
+        return self.size() >= self.max_size
+
+    def display(self) -> None:
+        """
+        Displays the records in the queue without consuming them.
+
+        Returns:
+            None
+        """
+        head = self._counters[self._HEAD]
+        print("Queue elements:", [self._struct.unpack_from(self._data, ((head + i) % self.max_size) * self.record_size)
+                                  for i in range(self.size())])
+
+    def close(self) -> None:
+        """
+        Detaches this process from the shared block. Views returned by reserve/peek_batch must be released first.
+
+        Returns:
+            None
+        """
+        self._counters.release()
+        self._data.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """
+        Destroys the shared block. Call once, from the creating process, after every process has closed it.
+
+        Returns:
+            None
+        """
+        self._shm.unlink()
+
+
+# Test cases for Queue
+if __name__ == "__main__":
+    # Queue Test
+    q = Queue()
+    print("Queue operations:")
+    q.enqueue(1)
+    q.enqueue(2)
+    q.enqueue(3)
+    print("Queue after enqueuing 1, 2, 3:")
+    q.display()  # Expected output: [1, 2, 3]
+    print("Dequeue operation:")
+    print(q.dequeue())  # Expected output: 1
+    print("Queue after dequeuing:")
+    q.display()  # Expected output: [2, 3]
+    print("Is the queue empty?")
+    print(q.is_empty())  # Expected output: False
+    print("Size of the queue:")
+    print(q.size())  # Expected output: 2
+    q.enqueue_many([4, 5, 6])
+    print("Dequeue many operation:")
+    print(q.dequeue_many(4))  # Expected output: [2, 3, 4, 5]
+
+    # Deque Test
+    dq = Deque()
+    print("\nDeque operations:")
+    dq.append_left(1)
+    dq.append_right(2)
+    dq.append_left(0)
+    print("Deque after operations:")
+    dq.display()  # Expected output: deque([0, 1, 2])
+    print("Pop left operation:")
+    print(dq.pop_left())  # Expected output: 0
+    print("Pop right operation:")
+    print(dq.pop_right())  # Expected output: 2
+    print("Peek left operation:")
+    print(dq.peek_left())  # Expected output: 1
+    print("Peek right operation:")
+    print(dq.peek_right())  # Expected output: 1
+    print("Is the deque empty?")
+    print(dq.is_empty())  # Expected output: False
+    print("Size of the deque:")
+    print(dq.size())  # Expected output: 1
+
+    # Circular Queue Test
+    cq = CircularQueue(size=3)
+    print("\nCircular Queue operations:")
+    cq.enqueue(1)
+    cq.enqueue(2)
+    cq.enqueue(3)
+    print("Circular Queue after enqueuing 1, 2, 3:")
+    cq.display()  # Expected output: [1, 2, 3]
+    cq.enqueue(4)  # This should overwrite the oldest item (1)
+    print("Circular Queue after enqueuing 4:")
+    cq.display()  # Expected output: [2, 3, 4]
+    print("Dequeue operation:")
+    print(cq.dequeue())  # Expected output: 2
+    print("Circular Queue after dequeuing:")
+    cq.display()  # Expected output: [3, 4]
+    print("Is the circular queue empty?")
+    print(cq.is_empty())  # Expected output: False
+    print("Size of the circular queue:")
+    print(cq.size())  # Expected output: 2
+
+    # Blocking Circular Queue Test
+    bq = BlockingCircularQueue(size=2)
+    print("\nBlocking Circular Queue operations:")
+    bq.put(1)
+    bq.put(2)
+    try:
+        bq.put(3, timeout=0.01)
+    except Full:
+        print("Queue is full, put timed out")  # Expected output: Queue is full, put timed out
+    print(bq.get_many(10))  # Expected output: [1, 2]
+    consumer = threading.Thread(target=lambda: print("Consumed:", bq.get()))
+    consumer.start()
+    bq.put(4)
+    consumer.join()  # Expected output: Consumed: 4
+    print(bq.stats())
+
+    # Shared-Memory Circular Queue Test
+    sq = SharedCircularQueue(size=4, fmt="qd")
+    try:
+        print("\nShared-Memory Circular Queue operations:")
+        sq.put(1, 0.5)
+        sq.put_many([(2, 1.5), (3, 2.5)])
+        sq.display()  # Expected output: [(1, 0.5), (2, 1.5), (3, 2.5)]
+        print(sq.get())  # Expected output: (1, 0.5)
+        print(sq.get_many(10))  # Expected output: [(2, 1.5), (3, 2.5)]
+    finally:
+        sq.close()
+        sq.unlink()
+
+    try:
+        dq = SharedCircularQueue(size=4, dtype=[("id", "i8"), ("value", "f8")])
+    except ImportError:
+        dq = None  # the dtype mode needs NumPy
+    if dq is not None:
+        try:
+            dq.put(5, 0.25)
+            dq.put_many([(6, 0.5)])
+            dq.display()  # Expected output: [(5, 0.25), (6, 0.5)]
+            print(dq.peek_array(10)["id"].tolist())  # Expected output: [5, 6]
+            print(dq.get(), dq.get_many(10))  # Expected output: (5, 0.25) [(6, 0.5)]
+        finally:
+            dq.close()
+            dq.unlink()
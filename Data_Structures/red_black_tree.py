@@ -11,6 +11,9 @@ Operations:
 6. **Inorder Traversal**: Performs an in-order traversal of the Red-Black Tree and prints node keys.
 7. **Preorder Traversal**: Performs a pre-order traversal of the Red-Black Tree and prints node keys.
 8. **Postorder Traversal**: Performs a post-order traversal of the Red-Black Tree and prints node keys.
+9. **Ordered Map**: Each node also carries `data`, so the tree maps keys to values; inserting an existing key replaces
+   its data. The map API (`tree[key]`, lazy `range(lo, hi, reverse)`, `floor` / `ceiling` / `predecessor` /
+   `successor`, `pop_min` / `pop_max`) comes from `OrderedMapMixin` in `Data_Structures.ordered_map`.
 
 Time Complexity:    
     - **Search**: O(log n), where n is the number of nodes in the tree.
@@ -19,6 +22,7 @@ Time Complexity:
     - **Minimum**: O(log n), where n is the number of nodes in the tree.
     - **Maximum**: O(log n), where n is the number of nodes in the tree.
     - **Traversal**: O(n), where n is the number of nodes in the tree.
+    - **Ordered map**: see `Data_Structures.ordered_map` (O(log n), and O(log n + k) for a range of k entries).
 
 Applications:
     - Maintaining a balanced tree structure for efficient search, insertion, and deletion operations.
@@ -26,6 +30,11 @@ Applications:
     - Supports efficient set operations such as union, intersection, and difference.
 """
 
+from operator import attrgetter
+
+from Data_Structures.ordered_map import OrderedMapMixin
+
+
 class Node:
     """Represents a node in the Red-Black Tree.
 
@@ -35,34 +44,49 @@ class Node:
         left (Node): Pointer to the left child.
         right (Node): Pointer to the right child.
         parent (Node): Pointer to the parent node.
+        data (any): The value mapped to the key.
     """
 
-    def __init__(self, key: int, color: str = 'RED') -> None:
+    __slots__ = ('key', 'color', 'left', 'right', 'parent', 'data')
+
+    def __init__(self, key: int, color: str = 'RED', data: any = None) -> None:
         """Initializes a new node with the given key and color.
 
         Args:
             key (int): The key value of the node.
             color (str): The color of the node, either 'RED' or 'BLACK'. Default is 'RED'.
+            data (any): The value mapped to the key. Default is None.
         """
         self.key = key
+        self.data = data
         self.color = color
         self.left = None
         self.right = None
         self.parent = None
 
 
-class RedBlackTree:
+class RedBlackTree(OrderedMapMixin):
     """Represents a Red-Black Tree.
 
+    The ordered-map methods (`tree[key]`, `range`, `floor`, `pop_min`, ...) come from `OrderedMapMixin`.
+
     Attributes:
         TNULL (Node): Sentinel NIL node representing the end of the tree.
         root (Node): The root node of the Red-Black Tree.
     """
 
+    _key = attrgetter('key')  # OrderedMapMixin: the key of a node
+
     def __init__(self) -> None:
         """Initializes an empty Red-Black Tree with a sentinel NIL node."""
         self.TNULL = Node(0, color='BLACK')
         self.root = self.TNULL
+        self._size = 0
+        self._nil = self.TNULL  # OrderedMapMixin: the missing-child marker
+
+    def __len__(self) -> int:
+        """Returns the number of keys in the tree."""
+        return self._size
 
     def search_tree(self, node: Node, key: int) -> Node:
         """Searches for a node with the given key in the subtree rooted at `node`.
@@ -81,27 +105,46 @@ class RedBlackTree:
             return self.search_tree(node.left, key)
         return self.search_tree(node.right, key)
 
-    def insert(self, key: int) -> None:
+    def search(self, key: int) -> Node:
+        """Iteratively searches the whole tree for a node with the given key.
+
+        Args:
+            key (int): The key to search for.
+
+        Returns:
+            Node: The node with the given key if found, otherwise the NIL node.
+        """
+        node = self.root
+        while node != self.TNULL and key != node.key:
+            node = node.left if key < node.key else node.right
+        return node
+
+    def insert(self, key: int, data: any = None) -> None:
         """Inserts a new node with the given key into the Red-Black Tree and maintains tree properties.
 
+        If the key is already present, its data is replaced instead.
+
         Args:
             key (int): The key of the new node to be inserted.
+            data (any): The value mapped to the key.
         """
-        node = Node(key)
-        node.parent = None
-        node.left = self.TNULL
-        node.right = self.TNULL
-        node.color = 'RED'
-
         y = None
         x = self.root
 
         while x != self.TNULL:
             y = x
-            if node.key < x.key:
+            if key < x.key:
                 x = x.left
-            else:
+            elif x.key < key:
                 x = x.right
+            else:
+                x.data = data
+                return
+
+        node = Node(key, 'RED', data)
+        node.left = self.TNULL
+        node.right = self.TNULL
+        self._size += 1
 
         node.parent = y
         if y is None:
@@ -209,6 +252,8 @@ class RedBlackTree:
         """
         self.delete_node_helper(self.root, key)
 
+    _delete_key = delete_node  # OrderedMapMixin: how to remove a key
+
     def delete_node_helper(self, node: Node, key: int) -> None:
         """Helper function to find and delete a node with the given key, then fix any violations.
 
@@ -228,6 +273,7 @@ class RedBlackTree:
 
         if z == self.TNULL:
             return
+        self._size -= 1
 
         y = z
         y_original_color = y.color
@@ -293,7 +339,7 @@ class RedBlackTree:
                     self.right_rotate(x.parent)
                     w = x.parent.left
 
-                if w.right.color == 'BLACK' and w.right.color == 'BLACK':
+                if w.left.color == 'BLACK' and w.right.color == 'BLACK':
                     w.color = 'RED'
                     x = x.parent
                 else:
@@ -419,3 +465,13 @@ if __name__ == "__main__":
     rbt.delete_node(20)
     print("In-order traversal after deleting 20:")
     rbt.inorder_traversal()
+
+    # Ordered map
+    prices = RedBlackTree()
+    for day, price in [(3, 9.5), (1, 10.0), (7, 8.25), (5, 9.0)]:
+        prices[day] = price
+    print("Ordered map:")
+    print(list(prices.range(2, 6)), list(prices.range(reverse=True))[0])  # Expected: [(3, 9.5), (5, 9.0)] (7, 8.25)
+    print(prices.floor(4), prices.ceiling(4), prices.successor(7), prices.predecessor(1))
+    # Expected: (3, 9.5) (5, 9.0) None None
+    print(prices.pop_min(), prices.pop_max(), list(prices), len(prices))  # Expected: (1, 10.0) (7, 8.25) [3, 5] 2
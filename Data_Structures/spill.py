@@ -0,0 +1,435 @@
+"""
+Spill-to-Disk Stack and Queue
+
+This module implements versions of `Stack` and `Queue` whose contents can grow far beyond RAM. Items are grouped into
+fixed-size segments. Only a bounded number of "hot" segments stay in memory; the rest are pickled to segment files in a
+temporary directory and read back through `mmap` when they are needed again.
+
+How it works:
+1. **Segments**: Every `segment_size` pushed/enqueued items form a segment. The segment being written is always in memory.
+2. **Spilling**: When a new segment is started and more than `hot_segments` segments are in memory, a cold segment
+   (one that will not be needed soon) is written to its own file and dropped from memory.
+3. **Prefetch**: Reading is sequential, so the next spilled segment is loaded on a background thread before the reader
+   reaches it: as soon as a queue starts a new head segment, or once a stack has popped half of its top segment.
+   The file is mapped with `mmap` and the OS is told the access is sequential.
+4. **Reclamation**: A segment file is deleted as soon as its segment is loaded back, and a segment is dropped from memory
+   as soon as it has been drained, so disk and memory use shrink as the backlog drains.
+
+The public API is the same as `Stack` (`push`/`pop`/`is_empty`/`size`/`display`) and `Queue`
+(`enqueue`/`dequeue`/`enqueue_many`/`dequeue_many`/`is_empty`/`size`/`display`), including the "Stack is empty" /
+"Queue is empty" return values. Items must be picklable. Call `close()` (or use a `with` block) to delete the segment
+directory; it is also removed when the object is garbage collected.
+
+Time Complexity:
+    - **Push / Enqueue**: O(1) amortized (a spill writes one segment every `segment_size` operations)
+    - **Pop / Dequeue**: O(1) amortized (a reload reads one segment every `segment_size` operations)
+    - **Size / Is Empty**: O(1)
+    - **Display**: O(n), reading spilled segments without consuming them
+
+Applications:
+    - Incident-replay and backfill backlogs that outgrow memory, external-memory DFS/BFS frontiers, and any producer that
+      can run far ahead of its consumer.
+"""
+
+import mmap
+import os
+import pickle
+import shutil
+import tempfile
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+class _Segment:
+    __slots__ = ("items", "path", "count", "future")
+
+    def __init__(self):
+        self.items = []
+        self.path = None
+        self.count = 0
+        self.future = None
+
+
+def _read_segment(path: str) -> list:
+    """
+    Reads a segment file back through a read-only memory map.
+
+    Args:
+        path (str): The segment file.
+
+    Returns:
+        list: The segment's items.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        if hasattr(mapped, "madvise"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        return pickle.loads(mapped)
+
+
+def _remove_directory(directory: str, executor: ThreadPoolExecutor) -> None:
+    executor.shutdown(wait=True)
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+class _SegmentStore:
+    """
+    Writes segments to files in a private temporary directory and reads them back, with background prefetch.
+    """
+
+    def __init__(self, spill_dir: str, prefix: str):
+        """
+        Creates the segment directory.
+
+        Args:
+            spill_dir (str or None): Where to create the segment directory. None uses the system temp directory.
+            prefix (str): The directory name prefix.
+        """
+        self.directory = tempfile.mkdtemp(prefix=prefix, dir=spill_dir)
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="spill-prefetch")
+        self._finalizer = weakref.finalize(self, _remove_directory, self.directory, self._executor)
+        self._next_id = 0
+        self.spilled = 0
+        self.loaded = 0
+
+    def spill(self, segment: _Segment) -> None:
+        """
+        Writes an in-memory segment to a new file and drops its items from memory.
+
+        Args:
+            segment (_Segment): The segment to spill.
+
+        Returns:
+            None
+        """
+        path = os.path.join(self.directory, f"{self._next_id:08d}.seg")
+        self._next_id += 1
+        with open(path, "wb") as f:
+            pickle.dump(segment.items, f, pickle.HIGHEST_PROTOCOL)
+        segment.count = len(segment.items)
+        segment.items = None
+        segment.path = path
+        self.spilled += 1
+
+    def prefetch(self, segment: _Segment) -> None:
+        """
+        Starts loading a spilled segment on the background thread, if it is not in memory or loading already.
+
+        Args:
+            segment (_Segment): The segment that will be read next.
+
+        Returns:
+            None
+        """
+        if segment.items is None and segment.future is None:
+            segment.future = self._executor.submit(_read_segment, segment.path)
+
+    def load(self, segment: _Segment) -> None:
+        """
+        Makes a segment's items available in memory, waiting for its prefetch if one is running, and deletes its file.
+
+        Args:
+            segment (_Segment): The segment about to be read.
+
+        Returns:
+            None
+        """
+        if segment.items is not None:
+            return
+        segment.items = segment.future.result() if segment.future is not None else _read_segment(segment.path)
+        segment.future = None
+        os.remove(segment.path)
+        segment.path = None
+        self.loaded += 1
+
+    def peek(self, segment: _Segment) -> list:
+        """
+        Returns a segment's items without loading it into the structure or deleting its file.
+
+        Args:
+            segment (_Segment): Any segment.
+
+        Returns:
+            list: The segment's items.
+        """
+        return segment.items if segment.items is not None else _read_segment(segment.path)
+
+    def close(self) -> None:
+        """
+        Deletes the segment directory and stops the prefetch thread.
+
+        Returns:
+            None
+        """
+        self._finalizer()
+
+
+class SpillStack:
+    def __init__(self, segment_size: int = 65536, hot_segments: int = 2, spill_dir: str = None):
+        """
+        Initializes an empty stack that spills cold segments to disk.
+
+        Args:
+            segment_size (int): Items per segment.
+            hot_segments (int): How many segments may stay in memory (at least 2: the top and the one below it).
+            spill_dir (str or None): Where to create the segment directory. None uses the system temp directory.
+        """
+        self.segment_size = max(1, segment_size)
+        self.hot_segments = max(2, hot_segments)
+        self._store = _SegmentStore(spill_dir, "spill-stack-")
+        self._segments = [_Segment()]
+        self._size = 0
+
+    def _in_memory(self) -> int:
+        return sum(segment.items is not None for segment in self._segments)
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the stack is empty.
+
+        Returns:
+            bool: True if the stack is empty, False otherwise.
+        """
+        return self._size == 0
+
+    def push(self, item) -> None:
+        """
+        Pushes an item onto the stack, spilling the coldest in-memory segment when a new segment starts.
+
+        Args:
+            item: The item to be added to the stack. Must be picklable.
+
+        Returns:
+            None
+        """
+        top = self._segments[-1]
+        if len(top.items) >= self.segment_size:
+            top = _Segment()
+            self._segments.append(top)
+            if self._in_memory() > self.hot_segments:
+                # spill from the bottom up: the deepest segments are the last to be popped
+                for segment in self._segments[:-2]:
+                    if segment.items is not None:
+                        self._store.spill(segment)
+                        break
+        top.items.append(item)
+        self._size += 1
+
+    def pop(self):
+        """
+        Pops an item from the stack, reloading the segment below once the top segment is drained.
+
+        Returns:
+            The item removed from the stack, or a message indicating that the stack is empty if no items are present.
+        """
+        if self._size == 0:
+            return "Stack is empty"
+        top = self._segments[-1]
+        if not top.items:
+            self._segments.pop()
+            top = self._segments[-1]
+            self._store.load(top)
+        item = top.items.pop()
+        self._size -= 1
+        if len(self._segments) > 1 and len(top.items) == self.segment_size // 2:
+            self._store.prefetch(self._segments[-2])
+        return item
+
+    def display(self) -> None:
+        """
+        Displays the elements of the stack, bottom to top, reading spilled segments without consuming them.
+
+        Returns:
+            None
+        """
+        print([item for segment in self._segments for item in self._store.peek(segment)])
+
+    def size(self) -> int:
+        """
+        Returns the number of items in the stack.
+
+        Returns:
+            int: The number of items in the stack.
+        """
+        return self._size
+
+    def stats(self) -> dict:
+        """
+        Returns spill counters and the current segment layout.
+
+        Returns:
+            dict: `segments`, `in_memory` segments, `spilled` and `loaded` segment counts so far.
+        """
+        return dict(segments=len(self._segments), in_memory=self._in_memory(),
+                    spilled=self._store.spilled, loaded=self._store.loaded)
+
+    def close(self) -> None:
+        """
+        Deletes the segment files. The stack must not be used afterwards.
+
+        Returns:
+            None
+        """
+        self._store.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class SpillQueue:
+    def __init__(self, segment_size: int = 65536, hot_segments: int = 2, spill_dir: str = None):
+        """
+        Initializes an empty queue that spills cold segments to disk.
+
+        Args:
+            segment_size (int): Items per segment.
+            hot_segments (int): How many segments may stay in memory (at least 2: the head and the tail).
+            spill_dir (str or None): Where to create the segment directory. None uses the system temp directory.
+        """
+        self.segment_size = max(1, segment_size)
+        self.hot_segments = max(2, hot_segments)
+        self._store = _SegmentStore(spill_dir, "spill-queue-")
+        self._segments = deque()
+        self._head_index = 0  # position of the front item in the head segment
+        self._size = 0
+
+    def _in_memory(self) -> int:
+        return sum(segment.items is not None for segment in self._segments)
+
+    def enqueue(self, item: any) -> None:
+        """
+        Adds an item to the end of the queue, spilling the segment it fills if too many segments are in memory.
+
+        Args:
+            item (any): The item to be added to the queue. Must be picklable.
+
+        Returns:
+            None
+        """
+        if not self._segments or len(self._segments[-1].items) >= self.segment_size:
+            self._segments.append(_Segment())
+            if len(self._segments) > 2 and self._in_memory() > self.hot_segments:
+                # the segment just filled is the one read last among those in memory
+                self._store.spill(self._segments[-2])
+        self._segments[-1].items.append(item)
+        self._size += 1
+
+    def enqueue_many(self, items) -> None:
+        """
+        Adds several items to the end of the queue, in order.
+
+        Args:
+            items (iterable): The items to be added to the queue.
+
+        Returns:
+            None
+        """
+        for item in items:
+            self.enqueue(item)
+
+    def dequeue(self) -> any:
+        """
+        Removes the item from the front of the queue, moving to (and prefetching) the next segment when needed.
+
+        Returns:
+            any: The item that was removed from the queue. If the queue is empty, returns a message "Queue is empty".
+        """
+        if self._size == 0:
+            return "Queue is empty"
+        head = self._segments[0]
+        item = head.items[self._head_index]
+        head.items[self._head_index] = None
+        self._head_index += 1
+        self._size -= 1
+        if self._head_index == len(head.items) and (len(self._segments) > 1 or self._size == 0):
+            self._segments.popleft()
+            self._head_index = 0
+            if self._segments:
+                self._store.load(self._segments[0])
+                if len(self._segments) > 1:
+                    self._store.prefetch(self._segments[1])
+        return item
+
+    def dequeue_many(self, n: int) -> list:
+        """
+        Removes up to `n` items from the front of the queue.
+
+        Args:
+            n (int): The maximum number of items to remove.
+
+        Returns:
+            list: The removed items in FIFO order. Empty if the queue is empty.
+        """
+        return [self.dequeue() for _ in range(min(max(n, 0), self._size))]
+
+    def display(self) -> None:
+        """
+        Displays the items in the queue, front to rear, reading spilled segments without consuming them.
+
+        Returns:
+            None
+        """
+        items = [item for segment in self._segments for item in self._store.peek(segment)]
+        print(items[self._head_index:])
+
+    def size(self) -> int:
+        """
+        Returns the number of items in the queue.
+
+        Returns:
+            int: The number of items in the queue.
+        """
+        return self._size
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the queue is empty.
+
+        Returns:
+            bool: True if the queue is empty, False otherwise.
+        """
+        return self._size == 0
+
+    def stats(self) -> dict:
+        """
+        Returns spill counters and the current segment layout.
+
+        Returns:
+            dict: `segments`, `in_memory` segments, `spilled` and `loaded` segment counts so far.
+        """
+        return dict(segments=len(self._segments), in_memory=self._in_memory(),
+                    spilled=self._store.spilled, loaded=self._store.loaded)
+
+    def close(self) -> None:
+        """
+        Deletes the segment files. The queue must not be used afterwards.
+
+        Returns:
+            None
+        """
+        self._store.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+if __name__ == "__main__":
+    with SpillStack(segment_size=2) as stack:
+        for i in range(7):
+            stack.push(i)
+        print("SpillStack:", stack.stats())  # Expected: 4 segments, 2 in memory, 2 spilled
+        stack.display()  # Expected: [0, 1, 2, 3, 4, 5, 6]
+        print([stack.pop() for _ in range(8)])  # Expected: [6, 5, 4, 3, 2, 1, 0, 'Stack is empty']
+
+    with SpillQueue(segment_size=2) as queue:
+        queue.enqueue_many(range(7))
+        print("SpillQueue:", queue.stats())  # Expected: 4 segments, 2 in memory, 2 spilled
+        queue.display()  # Expected: [0, 1, 2, 3, 4, 5, 6]
+        print(queue.dequeue_many(3))  # Expected: [0, 1, 2]
+        print([queue.dequeue() for _ in range(5)])  # Expected: [3, 4, 5, 6, 'Queue is empty']
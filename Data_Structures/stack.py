@@ -0,0 +1,341 @@
+"""
+Stack Data Structure
+
+This module implements a stack data structure using a Python list. A stack is a linear data structure that follows the Last In, First Out (LIFO) principle.
+
+Operations:
+1. **Push**: Adds an element to the top of the stack. This operation involves appending the element to the end of the list.
+2. **Pop**: Removes the element from the top of the stack. This operation involves removing the last element from the end of the list.
+3. **Is Empty**: Determines if the stack is empty. This operation involves checking whether the list has any elements.
+4. **Display**: Shows all elements in the stack from top to bottom. This operation involves traversing the entire list.
+5. **Size**: Returns the number of elements currently in the stack. This operation retrieves the length of the list.
+
+Time Complexity:
+    - **Push**: O(1) (constant time as it involves appending an element to the end of the list)
+    - **Pop**: O(1) (constant time as it involves removing the last element from the end of the list)
+    - **Is Empty**: O(1) (constant time as it involves checking if the list is empty)
+    - **Display**: O(n) (linear time as it requires traversing the entire list to show its contents)
+    - **Size**: O(1) (constant time as it retrieves the length of the list)
+
+Applications:
+    - Stacks are used in various applications such as function call management, expression evaluation, backtracking algorithms, and undo mechanisms in applications.
+"""
+
+
+from array import array
+from bisect import bisect_left
+from operator import gt, lt
+
+
+class Stack:
+    def __init__(self):
+        """
+        Initializes an empty stack.
+        """
+        self.stack = []
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the stack is empty.
+
+        Returns:
+            bool: True if the stack is empty, False otherwise.
+        """
+        return len(self.stack) == 0
+
+    def push(self, item) -> None:
+        """
+        Pushes an item onto the stack.
+
+        Args:
+            item: The item to be added to the stack.
+
+        Returns:
+            None
+        """
+        self.stack.append(item)
+
+    def pop(self):
+        """
+        Pops an item from the stack.
+
+        Returns:
+            The item removed from the stack, or a message indicating that the stack is empty if no items are present.
+        """
+        if self.is_empty():
+            return "Stack is empty"
+        return self.stack.pop()
+
+    def display(self) -> None:
+        """
+        Displays the elements of the stack.
+
+        Returns:
+            None
+        """
+        print(self.stack)
+
+    def size(self) -> int:
+        """
+        Returns the number of items in the stack.
+
+        Returns:
+            int: The number of items in the stack.
+        """
+        return len(self.stack)
+
+
+"""
+Typed Stack Data Structure
+
+This module also implements a stack of numbers backed by `array.array`. Items are stored unboxed in one contiguous
+buffer (8 bytes each for the default "q"/int64 typecode, instead of a pointer plus a separate int object per item in a
+list), which takes roughly a quarter of the memory of the list-backed `Stack` for large numeric stacks.
+
+Unlike `Stack`, popping an empty `TypedStack` raises IndexError instead of returning a message, so callers do not need to
+type-check the result.
+
+Optional min/max tracking keeps auxiliary stacks of the positions where a new minimum (or maximum) was pushed. The top of
+each auxiliary stack is always the position of the current minimum (maximum), so `current_min()`/`current_max()` are O(1).
+Because positions increase from bottom to top, `pop_many` drops the affected auxiliary entries with one binary search.
+
+Operations:
+1. **Push / Push Many**: Appends one item, or extends the buffer with a whole sequence in a single call.
+2. **Pop / Pop Many**: Removes the top item, or cuts the top k items off the buffer as one slice.
+3. **Peek**: Returns the top item without removing it.
+4. **Current Min / Current Max**: Returns the smallest / largest item in the stack (when tracking is enabled).
+5. **Is Empty / Size / Display**: As for `Stack`.
+
+Time Complexity:
+    - **Push**: O(1) amortized
+    - **Push Many**: O(k) amortized, where k is the number of items pushed
+    - **Pop**: O(1)
+    - **Pop Many**: O(k + log n)
+    - **Peek / Current Min / Current Max / Is Empty / Size**: O(1)
+    - **Display**: O(n)
+
+Applications:
+    - Large numeric stacks such as DFS frontiers over integer node ids, undo logs of offsets, and monotonic-stack
+      algorithms (next greater element, sliding window extrema).
+"""
+
+
+class TypedStack:
+    def __init__(self, typecode: str = "q", track_min: bool = False, track_max: bool = False):
+        """
+        Initializes an empty typed stack.
+
+        Args:
+            typecode (str): The `array` typecode of the items, e.g. "q" (int64), "i" (int32) or "d" (float64).
+            track_min (bool): Whether to maintain O(1) `current_min()`.
+            track_max (bool): Whether to maintain O(1) `current_max()`.
+        """
+        self.stack = array(typecode)
+        self._min_positions = array("q") if track_min else None
+        self._max_positions = array("q") if track_max else None
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the stack is empty.
+
+        Returns:
+            bool: True if the stack is empty, False otherwise.
+        """
+        return len(self.stack) == 0
+
+    def push(self, item) -> None:
+        """
+        Pushes an item onto the stack.
+
+        Args:
+            item: The number to be added to the stack. Must fit the stack's typecode.
+
+        Returns:
+            None
+        """
+        position = len(self.stack)
+        self.stack.append(item)
+        if self._min_positions is not None and (not self._min_positions or item < self.stack[self._min_positions[-1]]):
+            self._min_positions.append(position)
+        if self._max_positions is not None and (not self._max_positions or item > self.stack[self._max_positions[-1]]):
+            self._max_positions.append(position)
+
+    def push_many(self, items) -> None:
+        """
+        Pushes every item in `items` onto the stack, the last one ending up on top.
+
+        Args:
+            items (iterable): The numbers to be added. An `array` of the same typecode is copied without conversion.
+
+        Returns:
+            None
+        """
+        start = len(self.stack)
+        if isinstance(items, array):
+            self.stack.extend(items)
+        else:
+            self.stack.fromlist(list(items))
+        for positions, better in ((self._min_positions, lt), (self._max_positions, gt)):
+            if positions is None:
+                continue
+            best = self.stack[positions[-1]] if positions else None
+            for position in range(start, len(self.stack)):
+                value = self.stack[position]
+                if best is None or better(value, best):
+                    positions.append(position)
+                    best = value
+
+    def pop(self):
+        """
+        Pops an item from the stack.
+
+        Returns:
+            The item removed from the top of the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+        """
+        if not self.stack:
+            raise IndexError("pop from empty stack")
+        item = self.stack.pop()
+        position = len(self.stack)
+        if self._min_positions and self._min_positions[-1] == position:
+            self._min_positions.pop()
+        if self._max_positions and self._max_positions[-1] == position:
+            self._max_positions.pop()
+        return item
+
+    def pop_many(self, k: int) -> array:
+        """
+        Pops the top `k` items from the stack as one slice.
+
+        Args:
+            k (int): The number of items to pop.
+
+        Returns:
+            array: The popped items in stack order (bottom to top), so `push_many(pop_many(k))` restores the stack.
+
+        Raises:
+            IndexError: If the stack holds fewer than `k` items.
+        """
+        if k > len(self.stack):
+            raise IndexError("pop_many from a stack with fewer than k items")
+        if k <= 0:
+            return array(self.stack.typecode)
+        new_size = len(self.stack) - k
+        items = self.stack[new_size:]
+        del self.stack[new_size:]
+        for positions in (self._min_positions, self._max_positions):
+            if positions is not None:
+                del positions[bisect_left(positions, new_size):]
+        return items
+
+    def peek(self):
+        """
+        Returns the top item without removing it.
+
+        Returns:
+            The item on top of the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+        """
+        if not self.stack:
+            raise IndexError("peek at empty stack")
+        return self.stack[-1]
+
+    def current_min(self):
+        """
+        Returns the smallest item in the stack.
+
+        Returns:
+            The minimum item.
+
+        Raises:
+            ValueError: If min tracking is disabled.
+            IndexError: If the stack is empty.
+        """
+        if self._min_positions is None:
+            raise ValueError("min tracking is disabled; create the stack with track_min=True")
+        if not self._min_positions:
+            raise IndexError("min of empty stack")
+        return self.stack[self._min_positions[-1]]
+
+    def current_max(self):
+        """
+        Returns the largest item in the stack.
+
+        Returns:
+            The maximum item.
+
+        Raises:
+            ValueError: If max tracking is disabled.
+            IndexError: If the stack is empty.
+        """
+        if self._max_positions is None:
+            raise ValueError("max tracking is disabled; create the stack with track_max=True")
+        if not self._max_positions:
+            raise IndexError("max of empty stack")
+        return self.stack[self._max_positions[-1]]
+
+    def display(self) -> None:
+        """
+        Displays the elements of the stack.
+
+        Returns:
+            None
+        """
+        print(self.stack.tolist())
+
+    def size(self) -> int:
+        """
+        Returns the number of items in the stack.
+
+        Returns:
+            int: The number of items in the stack.
+        """
+        return len(self.stack)
+
+
+if __name__ == "__main__":
+    stack = Stack()
+
+    # Test is_empty on an empty stack
+    print("Is the stack empty?", stack.is_empty())  # Expected: True
+
+    # Push items onto the stack
+    stack.push(10)
+    stack.push(20)
+    stack.push(30)
+
+    # Display stack contents
+    print("Stack after pushes:")
+    stack.display()  # Expected: [10, 20, 30]
+
+    # Pop items from the stack
+    print("Popped item:", stack.pop())  # Expected: 30
+    print("Popped item:", stack.pop())  # Expected: 20
+    print("Popped item:", stack.pop())  # Expected: 10
+    print("Popped item:", stack.pop())  # Expected: Stack is empty
+
+    # Check size of the stack
+    print("Size of stack:", stack.size())  # Expected: 0
+
+    # Push more items and display size
+    stack.push(40)
+    stack.push(50)
+    print("Size of stack after more pushes:", stack.size())  # Expected: 2
+    print("Stack contents:")
+    stack.display()  # Expected: [40, 50]
+
+    # Typed stack with min/max tracking
+    typed = TypedStack("q", track_min=True, track_max=True)
+    typed.push_many([5, 3, 8, 1, 9])
+    print("Typed stack min/max:", typed.current_min(), typed.current_max())  # Expected: 1 9
+    print("Popped slice:", typed.pop_many(2).tolist())  # Expected: [1, 9]
+    print("Typed stack min/max:", typed.current_min(), typed.current_max())  # Expected: 3 8
+    typed.pop_many(3)
+    try:
+        typed.pop()
+    except IndexError as error:
+        print("Underflow:", error)  # Expected: Underflow: pop from empty stack
@@ -0,0 +1,344 @@
+"""
+Work-Stealing Scheduler built on Deque
+
+This module implements a fork/join task scheduler where every worker thread owns a `Deque` of ready tasks.
+
+How it works:
+1. **Owner end (right)**: A worker pushes the tasks it spawns onto the right end of its own deque and pops from the right end,
+   so it runs its newest (smallest, cache-warm) task first, like a recursive call would.
+2. **Thief end (left)**: A worker whose deque is empty picks another worker and steals half of that worker's tasks from the
+   left end. The oldest tasks are the biggest pieces of a divide-and-conquer job, so one steal moves a lot of work.
+3. **Parking**: When no deque has any task, idle workers sleep on a condition variable instead of spinning, and are woken
+   one at a time as new tasks are pushed.
+4. **Joining**: A task that waits for a child task keeps running the tasks left in its own deque (its own children and
+   their descendants) until the child is done, then parks on the child's event. It does not steal while waiting: a
+   stolen task would run on top of the waiting task's stack, so joins could nest without bound and overflow it.
+
+Leaf work can optionally be sent to a `concurrent.futures` executor (e.g. a `ProcessPoolExecutor`) with `run_leaf`. The
+worker threads then only split and combine, while the CPU-heavy leaves run in parallel processes, outside the GIL.
+
+Per-worker statistics (see `stats()`): `executed`, `spawned`, `steals` (successful steal operations), `stolen` (tasks
+taken by steals), `failed_steals`, `parks` and `idle_time` (seconds spent parked or waiting on a join with nothing to run).
+
+Time Complexity:
+- `spawn` / owner pop: O(1)
+- steal: O(k), where k is half of the victim's deque
+- `wait`: O(1) plus whatever work the waiting worker runs meanwhile
+
+Applications:
+Parallel divide-and-conquer algorithms such as `parallel_mergesort` in `Search_Sort.merge_sort` and `parallel_quicksort`
+in `Search_Sort.quick_sort`, recursive tree and graph traversals, and other fork/join workloads.
+"""
+
+import itertools
+import os
+import random
+import threading
+import time
+
+from Data_Structures.queues import Deque
+
+
+class Task:
+    """
+    A unit of work scheduled on a WorkStealingScheduler.
+
+    Attributes:
+        fn (callable): The function to run.
+        args (tuple): The arguments to call `fn` with.
+    """
+
+    __slots__ = ("fn", "args", "value", "error", "done")
+
+    def __init__(self, fn, args: tuple):
+        self.fn = fn
+        self.args = args
+        self.value = None
+        self.error = None
+        self.done = threading.Event()
+
+    def run(self) -> None:
+        """
+        Runs the task and records its result or exception.
+
+        Returns:
+            None
+        """
+        try:
+            self.value = self.fn(*self.args)
+        except BaseException as error:
+            self.error = error
+        self.done.set()
+
+
+class WorkStealingScheduler:
+    def __init__(self, workers: int = None, leaf_executor=None):
+        """
+        Starts the worker threads.
+
+        Args:
+            workers (int or None): The number of worker threads. Defaults to the number of CPUs.
+            leaf_executor (concurrent.futures.Executor or None): Where `run_leaf` sends leaf work.
+                None runs leaves directly on the calling worker thread.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.leaf_executor = leaf_executor
+        self.deques = [Deque() for _ in range(self.workers)]
+        self.locks = [threading.Lock() for _ in range(self.workers)]
+        self._stats = [dict(executed=0, spawned=0, steals=0, stolen=0, failed_steals=0, parks=0, idle_time=0.0)
+                       for _ in range(self.workers)]
+        self._idle = threading.Condition()
+        self._pending = 0  # tasks sitting in deques, guarded by self._idle
+        self._sleepers = 0
+        self._shutdown = False
+        self._submit_counter = itertools.count()  # next() is atomic, so concurrent outside submits do not race
+        self._local = threading.local()
+        self._threads = [threading.Thread(target=self._worker_loop, args=(i,), daemon=True,
+                                          name=f"work-stealing-{i}") for i in range(self.workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def _current_worker(self):
+        """
+        Returns the index of the worker running the calling thread, or None for outside threads.
+        """
+        return getattr(self._local, "index", None)
+
+    def _push(self, index: int, task: Task) -> None:
+        """
+        Pushes `task` onto the right (owner) end of worker `index`'s deque and wakes one parked worker.
+
+        Args:
+            index (int): The worker whose deque receives the task.
+            task (Task): The task to push.
+
+        Returns:
+            None
+        """
+        with self.locks[index]:
+            self.deques[index].append_right(task)
+        with self._idle:
+            self._pending += 1
+            if self._sleepers:
+                self._idle.notify()
+
+    def _pop_own(self, index: int):
+        """
+        Pops the newest task from the right end of worker `index`'s own deque.
+
+        Args:
+            index (int): The worker popping.
+
+        Returns:
+            Task or None: The task, or None if the deque is empty.
+        """
+        with self.locks[index]:
+            if self.deques[index].is_empty():
+                return None
+            task = self.deques[index].pop_right()
+        with self._idle:
+            self._pending -= 1
+        return task
+
+    def _steal(self, index: int):
+        """
+        Steals half of a random victim's tasks from the left end, keeping all but one in worker `index`'s deque.
+
+        Args:
+            index (int): The thief.
+
+        Returns:
+            Task or None: A stolen task to run now, or None if every other deque was empty.
+        """
+        stats = self._stats[index]
+        start = random.randrange(self.workers)
+        for offset in range(self.workers):
+            victim = (start + offset) % self.workers
+            if victim == index:
+                continue
+            with self.locks[victim]:
+                victim_deque = self.deques[victim]
+                count = (victim_deque.size() + 1) // 2
+                loot = [victim_deque.pop_left() for _ in range(count)]
+            if not loot:
+                continue
+            stats["steals"] += 1
+            stats["stolen"] += len(loot)
+            task = loot.pop()
+            if loot:
+                with self.locks[index]:
+                    for other in loot:
+                        self.deques[index].append_right(other)
+            with self._idle:
+                self._pending -= 1
+                if loot and self._sleepers:
+                    self._idle.notify()  # the thief now has spare tasks for others to steal
+            return task
+        stats["failed_steals"] += 1
+        return None
+
+    def _find_task(self, index: int):
+        """
+        Returns the next task for worker `index`: its own newest task, else a stolen one.
+        """
+        return self._pop_own(index) or self._steal(index)
+
+    def _execute(self, index: int, task: Task) -> None:
+        """
+        Runs `task` on worker `index`, counting it.
+        """
+        self._stats[index]["executed"] += 1
+        task.run()
+
+    def _worker_loop(self, index: int) -> None:
+        """
+        Runs tasks until shutdown, parking whenever no deque holds a task.
+
+        Args:
+            index (int): This worker's index.
+
+        Returns:
+            None
+        """
+        self._local.index = index
+        stats = self._stats[index]
+        while True:
+            task = self._find_task(index)
+            if task is not None:
+                self._execute(index, task)
+                continue
+            with self._idle:
+                if self._shutdown:
+                    return
+                if self._pending == 0:
+                    stats["parks"] += 1
+                    self._sleepers += 1
+                    start = time.perf_counter()
+                    self._idle.wait_for(lambda: self._pending > 0 or self._shutdown)
+                    stats["idle_time"] += time.perf_counter() - start
+                    self._sleepers -= 1
+
+    def submit(self, fn, *args) -> Task:
+        """
+        Schedules `fn(*args)`. From inside a task this is the same as `spawn`; from outside, deques are used in turn.
+
+        Args:
+            fn (callable): The function to run.
+            *args: The arguments to call `fn` with.
+
+        Returns:
+            Task: The scheduled task; pass it to `wait` for the result.
+        """
+        index = self._current_worker()
+        if index is None:
+            index = next(self._submit_counter) % self.workers
+        else:
+            self._stats[index]["spawned"] += 1
+        task = Task(fn, args)
+        self._push(index, task)
+        return task
+
+    spawn = submit
+
+    def wait(self, task: Task) -> any:
+        """
+        Waits for `task` and returns its result. Worker threads keep running tasks from their own deque while they wait,
+        but do not steal, which bounds how deeply joins nest on one thread's stack.
+
+        Args:
+            task (Task): A task returned by `submit`/`spawn`.
+
+        Returns:
+            any: The task's return value.
+
+        Raises:
+            Exception: Whatever the task raised.
+        """
+        index = self._current_worker()
+        if index is None:
+            task.done.wait()
+        else:
+            stats = self._stats[index]
+            while not task.done.is_set():
+                other = self._pop_own(index)
+                if other is not None:
+                    self._execute(index, other)
+                else:
+                    start = time.perf_counter()
+                    task.done.wait(0.0005)  # the child is running elsewhere; recheck the own deque shortly
+                    stats["idle_time"] += time.perf_counter() - start
+        if task.error is not None:
+            raise task.error
+        return task.value
+
+    def run(self, fn, *args) -> any:
+        """
+        Schedules `fn(*args)` and waits for its result.
+
+        Args:
+            fn (callable): The function to run.
+            *args: The arguments to call `fn` with.
+
+        Returns:
+            any: The return value of `fn`.
+        """
+        return self.wait(self.submit(fn, *args))
+
+    def run_leaf(self, fn, *args) -> any:
+        """
+        Runs leaf work on the leaf executor if one is configured, otherwise directly.
+
+        With a process pool, `fn` and its arguments must be picklable.
+
+        Args:
+            fn (callable): The leaf function.
+            *args: The arguments to call `fn` with.
+
+        Returns:
+            any: The return value of `fn`.
+        """
+        if self.leaf_executor is None:
+            return fn(*args)
+        return self.leaf_executor.submit(fn, *args).result()
+
+    def stats(self) -> list:
+        """
+        Returns a snapshot of each worker's counters.
+
+        Returns:
+            list: One dict per worker, in worker order.
+        """
+        return [dict(stats) for stats in self._stats]
+
+    def shutdown(self) -> None:
+        """
+        Stops the workers once their deques are empty and waits for them to exit.
+
+        Returns:
+            None
+        """
+        with self._idle:
+            self._shutdown = True
+            self._idle.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+
+if __name__ == "__main__":
+    def fib(scheduler, n):
+        if n < 2:
+            return n
+        left = scheduler.spawn(fib, scheduler, n - 1)
+        right = fib(scheduler, n - 2)
+        return scheduler.wait(left) + right
+
+    with WorkStealingScheduler(workers=4) as scheduler:
+        print("fib(20) =", scheduler.run(fib, scheduler, 20))  # Expected output: fib(20) = 6765
+        for index, stats in enumerate(scheduler.stats()):
+            print(f"worker {index}: {stats}")
@@ -0,0 +1,5 @@
+"""
+Dynamic Programming Algorithms
+
+Each algorithm lives in its own module (e.g. ``Misc_Algo.Dynamic_Programming.knapsack_01``).
+"""
@@ -0,0 +1,5 @@
+"""
+Miscellaneous Algorithms
+
+Grouped by technique in subpackages (e.g. ``Misc_Algo.Dynamic_Programming``).
+"""
@@ -1,6 +0,0 @@
-arr = [3, 5, 12, 64, 23, 74, 12]
-
-# heapsort(arr)
-# quicksort(arr, 0, len(arr)-1)
-# mergesort(arr)
-print(arr)
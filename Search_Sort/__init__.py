@@ -0,0 +1,6 @@
+"""
+Search and Sort Algorithms
+
+Each algorithm lives in its own module (e.g. ``Search_Sort.quick_sort``). Nothing is imported here so that
+importing one module never pulls in the others; use the ``dsa`` package for lazy top-level access.
+"""
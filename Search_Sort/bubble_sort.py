@@ -10,13 +10,14 @@ Further Info : https://www.programiz.com/dsa/bubble-sort
 '''
 
 
-sort = [4, 1, 5, 3, 6]
+def bubblesort(array):
+    for i in range(len(array)-1):
+        for j in range(len(array)-i-1):
+            if (array[j] > array[j+1]):
+                array[j], array[j+1] = array[j+1], array[j]
 
 
-for i in range(len(sort)-1):
-    for j in range(len(sort)-i-1):
-        if (sort[j] > sort[j+1]):
-            sort[j], sort[j+1] = sort[j+1], sort[j]
-
-
-print(sort)
+if __name__ == "__main__":
+    sort = [4, 1, 5, 3, 6]
+    bubblesort(sort)
+    print(sort)
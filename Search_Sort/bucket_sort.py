@@ -15,9 +15,6 @@ Further Info : https://www.programiz.com/dsa/bucket-sort
 from math import floor
 
 
-sort = [2.42, 5.32, 3.33, 2.52, 3.37, 1.47, 2.51]
-
-
 def bucketSort(array, bsize):
     bucket = []
     for i in range(bsize):
@@ -35,8 +32,10 @@ def bucketSort(array, bsize):
             k += 1
 
 
-bucketSort(sort, floor((max(sort)*10))+1)
-print(sort)
+if __name__ == "__main__":
+    sort = [2.42, 5.32, 3.33, 2.52, 3.37, 1.47, 2.51]
+    bucketSort(sort, floor((max(sort)*10))+1)
+    print(sort)
 
 '''
 Time Complexities:-             [k = time complexity of inner sorting used in its best case]
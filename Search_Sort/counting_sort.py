@@ -12,9 +12,6 @@ Further Info : https://www.programiz.com/dsa/counting-sort
 '''
 
 
-sort = [4, 1, 5, 3, 6]
-
-
 def countingsort(array, Max):
     size = len(array)
     output = [0]*size
@@ -32,5 +29,7 @@ def countingsort(array, Max):
         array[i] = output[i]
 
 
-countingsort(sort, max(sort))
-print(sort)
+if __name__ == "__main__":
+    sort = [4, 1, 5, 3, 6]
+    countingsort(sort, max(sort))
+    print(sort)
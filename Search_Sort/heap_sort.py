@@ -32,9 +32,6 @@ Further Info : https://www.programiz.com/dsa/heap-sort
 '''
 
 
-sort = [4, 1, 5, 3, 6]
-
-
 def heapify(arr, n, i):
     largest = i
     l = 2*i+1
@@ -57,5 +54,7 @@ def heapsort(arr):
         heapify(arr, i, 0)
 
 
-heapsort(sort)
-print(sort)
+if __name__ == "__main__":
+    sort = [4, 1, 5, 3, 6]
+    heapsort(sort)
+    print(sort)
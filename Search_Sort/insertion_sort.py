@@ -9,15 +9,18 @@ Stability : Yes     (Stability means that two elements with equal value will ret
 Further Info : https://www.programiz.com/dsa/insertion-sort
 '''
 
-sort = [4, 1, 5, 3, 6]
 
-for i in range(1, len(sort)):
-    key = sort[i]
-    j = i-1
-    while j >= 0 and key < sort[j]:
-        sort[j+1] = sort[j]
-        j = j-1
-    sort[j+1] = key
+def insertionsort(array):
+    for i in range(1, len(array)):
+        key = array[i]
+        j = i-1
+        while j >= 0 and key < array[j]:
+            array[j+1] = array[j]
+            j = j-1
+        array[j+1] = key
 
 
-print(sort)
+if __name__ == "__main__":
+    sort = [4, 1, 5, 3, 6]
+    insertionsort(sort)
+    print(sort)
@@ -0,0 +1,77 @@
+'''
+divide the list/array into 2 lists/arrays.
+the 2 lists/arrays are recursed into the same function.
+reapeat it until u create a list/array of length 1 of each element in original array.
+now merge the originally adjacant values into an array/list of length 2 and sort it.
+keep merging the lists until all the lists are merged into a single sorted list/array.
+Time Complexity : O(nlogn)    Space Complexity : O(n)
+Stability : Yes     (Stability means that two elements with equal value will retain their relative postion even after sorting)
+Further Info : https://www.programiz.com/dsa/merge-sort
+'''
+
+
+def mergesort(array):
+    if len(array) > 1:
+        r = len(array)//2
+        L = array[:r]
+        M = array[r:]
+        mergesort(L)
+        mergesort(M)
+        merge(L, M, array)
+
+
+def merge(L, M, array):
+    i = j = k = 0
+    while i < len(L) and j < len(M):
+        if L[i] < M[j]:
+            array[k] = L[i]
+            i += 1
+        else:
+            array[k] = M[j]
+            j += 1
+        k += 1
+    while i < len(L):
+        array[k] = L[i]
+        i += 1
+        k += 1
+    while j < len(M):
+        array[k] = M[j]
+        j += 1
+        k += 1
+
+
+'''
+parallel merge sort on a WorkStealingScheduler (Data_Structures.work_stealing).
+split the list/array in halves as above, but spawn the left half as a task so an idle worker can steal it,
+while the current worker sorts the right half itself.
+below `cutoff` elements the piece is a leaf and is sorted with the normal mergesort via scheduler.run_leaf,
+which runs it in the scheduler's leaf executor (eg. a process pool) if it has one.
+the two sorted halves are then merged as above.
+'''
+
+
+def sorted_run(array):
+    mergesort(array)
+    return array
+
+
+def _parallel_mergesort(scheduler, array, cutoff):
+    if len(array) <= cutoff:
+        return scheduler.run_leaf(sorted_run, array)
+    r = len(array)//2
+    left = scheduler.spawn(_parallel_mergesort, scheduler, array[:r], cutoff)
+    M = _parallel_mergesort(scheduler, array[r:], cutoff)
+    L = scheduler.wait(left)
+    output = [None]*len(array)
+    merge(L, M, output)
+    return output
+
+
+def parallel_mergesort(array, scheduler, cutoff=4096):
+    array[:] = scheduler.run(_parallel_mergesort, scheduler, array, cutoff)
+
+
+if __name__ == "__main__":
+    sort = [4, 1, 5, 3, 6]
+    mergesort(sort)
+    print(sort)
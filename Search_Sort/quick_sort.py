@@ -20,9 +20,6 @@ Further Info : https://www.programiz.com/dsa/quick-sort
 '''
 
 
-sort = [4, 1, 5, 3, 6]
-
-
 def partition(array, low, high):
     pivot = array[high]
     i = low-1
@@ -41,5 +38,54 @@ def quicksort(array, low, high):
         quicksort(array, p+1, high)
 
 
-quicksort(sort, 0, len(sort)-1)
-print(sort)
+'''
+parallel quick sort on a WorkStealingScheduler (Data_Structures.work_stealing).
+partition as above, then spawn the smaller part as a task so an idle worker can steal it,
+while the current worker loops on the larger part instead of recursing into it.
+so every spawned task is at most half of its parent and tasks nest at most log2(n) deep, even when
+many equal values make the partitions lopsided (which would recurse about n deep otherwise).
+the parts never overlap so workers can sort them in the same list/array at the same time.
+below `cutoff` elements the part is a leaf and is sorted with the normal quicksort via scheduler.run_leaf,
+which runs it in the scheduler's leaf executor (eg. a process pool) if it has one.
+'''
+
+
+def sorted_run(array):
+    quicksort(array, 0, len(array)-1)
+    return array
+
+
+def _parallel_quicksort(scheduler, array, low, high, cutoff):
+    spawned = []
+    while high-low+1 > cutoff:
+        p = partition(array, low, high)
+        if p-low < high-p:
+            if p-1 > low:
+                spawned.append(scheduler.spawn(_parallel_quicksort, scheduler, array, low, p-1, cutoff))
+            low = p+1
+        else:
+            if high > p+1:
+                spawned.append(scheduler.spawn(_parallel_quicksort, scheduler, array, p+1, high, cutoff))
+            high = p-1
+    if low < high:
+        array[low:high+1] = scheduler.run_leaf(sorted_run, array[low:high+1])
+    for task in spawned:
+        scheduler.wait(task)
+
+
+def parallel_quicksort(array, scheduler, cutoff=4096):
+    scheduler.run(_parallel_quicksort, scheduler, array, 0, len(array)-1, cutoff)
+
+
+if __name__ == "__main__":
+    sort = [4, 1, 5, 3, 6]
+    quicksort(sort, 0, len(sort)-1)
+    print(sort)
+
+    import random
+    from Data_Structures.work_stealing import WorkStealingScheduler
+    # many duplicates make lopsided partitions, which the parallel driver must not turn into deep recursion
+    duplicates = [random.randrange(100) for _ in range(50000)]
+    with WorkStealingScheduler(4) as scheduler:
+        parallel_quicksort(duplicates, scheduler, cutoff=64)
+    print(duplicates == sorted(duplicates))  # Expected output: True
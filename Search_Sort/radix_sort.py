@@ -12,9 +12,6 @@ Further Info : https://www.programiz.com/dsa/radix-sort
 '''
 
 
-sort = [4, 1, 5, 3, 6]
-
-
 def countingsort(array, Max, place):
     size = len(array)
     output = [0]*size
@@ -42,5 +39,7 @@ def radixsort(array):
         place *= 10
 
 
-radixsort(sort)
-print(sort)
+if __name__ == "__main__":
+    sort = [4, 1, 5, 3, 6]
+    radixsort(sort)
+    print(sort)
@@ -10,15 +10,16 @@ Further Info : https://www.programiz.com/dsa/selection-sort
 '''
 
 
-sort = [4, 1, 5, 3, 6]
+def selectionsort(array):
+    for i in range(len(array)):
+        min = i
+        for j in range(i+1, len(array)):
+            if array[j] < array[min]:
+                min = j
+        array[min], array[i] = array[i], array[min]
 
 
-for i in range(len(sort)):
-    min = i
-    for j in range(i+1, len(sort)):
-        if sort[j] < sort[min]:
-            min = j
-    sort[min], sort[i] = sort[i], sort[min]
-
-
-print(sort)
+if __name__ == "__main__":
+    sort = [4, 1, 5, 3, 6]
+    selectionsort(sort)
+    print(sort)
@@ -27,9 +27,6 @@ Further Info : https://www.programiz.com/dsa/shell-sort
 '''
 
 
-sort = [4, 1, 5, 3, 6]
-
-
 def shellsort(array, n):
     interval = n//2
     while interval > 0:
@@ -43,5 +40,7 @@ def shellsort(array, n):
         interval //= 2
 
 
-shellsort(sort, len(sort))
-print(sort)
+if __name__ == "__main__":
+    sort = [4, 1, 5, 3, 6]
+    shellsort(sort, len(sort))
+    print(sort)
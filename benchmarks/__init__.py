@@ -0,0 +1,6 @@
+"""
+Benchmarks
+
+Standalone scripts that measure the repository's data structures. Run them from the repository root as modules,
+e.g. ``python -m benchmarks.queue_bench``, so the packages import without path changes.
+"""
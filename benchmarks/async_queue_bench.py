@@ -0,0 +1,78 @@
+"""
+AsyncQueue Benchmark
+
+Runs 1000 producer coroutines feeding a bounded queue and a few consumer coroutines draining it, and reports items/sec for:
+1. `asyncio.Queue` with `get()` per item (the baseline).
+2. `AsyncQueue` with `get()` per item.
+3. `AsyncQueue` with `get_batch()`.
+
+Usage:
+    python -m benchmarks.async_queue_bench [items_per_producer]   # default 200
+"""
+
+import asyncio
+import sys
+import time
+
+from Data_Structures.async_queues import AsyncQueue
+
+PRODUCERS = 1000
+CONSUMERS = 4
+MAXSIZE = 1024
+BATCH = 256
+
+
+async def run(make_queue, items_per_producer: int, batched: bool) -> float:
+    """
+    Moves PRODUCERS * items_per_producer items through one queue.
+
+    Args:
+        make_queue (callable): Builds the queue under test.
+        items_per_producer (int): Items each producer coroutine puts.
+        batched (bool): Whether consumers use get_batch instead of get.
+
+    Returns:
+        float: Items per second.
+    """
+    q = make_queue()
+    total = PRODUCERS * items_per_producer
+    consumed = 0
+    done = asyncio.Event()
+
+    async def produce():
+        for i in range(items_per_producer):
+            await q.put(i)
+
+    async def consume():
+        nonlocal consumed
+        while consumed < total:
+            if batched:
+                consumed += len(await q.get_batch(BATCH))
+            else:
+                await q.get()
+                consumed += 1
+        done.set()
+
+    start = time.perf_counter()
+    consumers = [asyncio.create_task(consume()) for _ in range(CONSUMERS)]
+    await asyncio.gather(*(produce() for _ in range(PRODUCERS)))
+    await done.wait()
+    elapsed = time.perf_counter() - start
+    for task in consumers:
+        task.cancel()
+    await asyncio.gather(*consumers, return_exceptions=True)
+    return total / elapsed
+
+
+async def main(items_per_producer: int) -> None:
+    print(f"{PRODUCERS} producers x {items_per_producer} items, {CONSUMERS} consumers, maxsize {MAXSIZE}")
+    rate = await run(lambda: asyncio.Queue(MAXSIZE), items_per_producer, False)
+    print(f"asyncio.Queue (get):         {rate:12,.0f} items/s")
+    rate = await run(lambda: AsyncQueue(MAXSIZE), items_per_producer, False)
+    print(f"AsyncQueue (get):            {rate:12,.0f} items/s")
+    rate = await run(lambda: AsyncQueue(MAXSIZE), items_per_producer, True)
+    print(f"AsyncQueue (get_batch):      {rate:12,.0f} items/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
@@ -0,0 +1,154 @@
+"""
+AVL Order Statistics Benchmark
+
+Runs a mixed leaderboard workload against a tree of n keys (default sizes 1e4, 1e5 and 1e6): `ops` operations
+(default 2e4), each an insert, a delete, a `rank`, a `select` or a `count_range`, in proportions set by the update
+share (25%, 50% and 90%). Compared implementations:
+- `AVLTree` with subtree sizes: every operation is O(log n).
+- sorted list + bisect: `bisect.insort` / `del` for updates (O(n) memmove), bisect for queries.
+- re-sort + bisect: updates append or remove and mark the list unsorted; the next query sorts it again.
+- inorder_traversal: the previous approach, one `inorder_traversal()` list per query. Timed on at most
+  TRAVERSAL_MAX queries and extrapolated.
+
+Usage:
+    python -m benchmarks.avl_order_statistics_bench [n ...]
+"""
+
+import bisect
+import random
+import sys
+import time
+
+from Data_Structures.avl_tree import AVLTree
+
+OPS = 20_000
+TRAVERSAL_MAX = 20
+
+
+def workload(keys: list, update_share: float, ops: int, rng: random.Random) -> list:
+    present = set(keys)
+    plan = []
+    for _ in range(ops):
+        if rng.random() < update_share:
+            if rng.random() < 0.5 or not present:
+                key = rng.randrange(10 * len(keys))
+                while key in present:
+                    key = rng.randrange(10 * len(keys))
+                present.add(key)
+                plan.append(("insert", key))
+            else:
+                key = present.pop()
+                plan.append(("delete", key))
+        else:
+            kind = rng.choice(("rank", "select", "count_range"))
+            lo = rng.randrange(10 * len(keys))
+            plan.append((kind, lo, lo + rng.randrange(len(keys)), rng.randrange(max(1, len(present)))))
+    return plan
+
+
+def run_tree(tree: AVLTree, plan: list) -> None:
+    for step in plan:
+        kind = step[0]
+        if kind == "insert":
+            tree.insert(step[1])
+        elif kind == "delete":
+            tree.delete(step[1])
+        elif kind == "rank":
+            tree.rank(step[1])
+        elif kind == "select":
+            if step[3] < len(tree):
+                tree.select(step[3])
+        else:
+            tree.count_range(step[1], step[2])
+
+
+def run_sorted(values: list, plan: list) -> None:
+    for step in plan:
+        kind = step[0]
+        if kind == "insert":
+            bisect.insort(values, step[1])
+        elif kind == "delete":
+            del values[bisect.bisect_left(values, step[1])]
+        elif kind == "rank":
+            bisect.bisect_left(values, step[1])
+        elif kind == "select":
+            if step[3] < len(values):
+                values[step[3]]
+        else:
+            bisect.bisect_right(values, step[2]) - bisect.bisect_left(values, step[1])
+
+
+def run_resort(values: list, plan: list) -> None:
+    dirty = False
+    for step in plan:
+        kind = step[0]
+        if kind == "insert":
+            values.append(step[1])
+            dirty = True
+        elif kind == "delete":
+            values.remove(step[1])
+            dirty = True
+        else:
+            if dirty:
+                values.sort()
+                dirty = False
+            if kind == "rank":
+                bisect.bisect_left(values, step[1])
+            elif kind == "select":
+                if step[3] < len(values):
+                    values[step[3]]
+            else:
+                bisect.bisect_right(values, step[2]) - bisect.bisect_left(values, step[1])
+
+
+def run_traversal(tree: AVLTree, plan: list) -> int:
+    queries = 0
+    for step in plan:
+        if step[0] in ("insert", "delete"):
+            getattr(tree, step[0])(step[1])
+        elif queries < TRAVERSAL_MAX:
+            values = tree.inorder_traversal()
+            bisect.bisect_left(values, step[1])
+            queries += 1
+    return queries
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main(sizes: list) -> None:
+    rng = random.Random(1)
+    for n in sizes:
+        keys = rng.sample(range(10 * n), n)
+        tree = AVLTree()
+        for key in keys:
+            tree.insert(key)
+        print(f"n={n:,}, {OPS:,} operations (seconds)")
+        for share in (0.25, 0.5, 0.9):
+            plan = workload(keys, share, OPS, rng)
+            queries = sum(step[0] not in ("insert", "delete") for step in plan)
+            tree_seconds, _ = timed(run_tree, tree, plan)
+            sorted_seconds, _ = timed(run_sorted, sorted(keys), plan)
+            resort_seconds, _ = timed(run_resort, sorted(keys), plan)
+            # undo the plan on the tree so every share starts from the same keys
+            for step in reversed(plan):
+                if step[0] == "insert":
+                    tree.delete(step[1])
+                elif step[0] == "delete":
+                    tree.insert(step[1])
+            traversal_seconds, timed_queries = timed(run_traversal, tree, plan)
+            traversal_seconds *= queries / max(1, timed_queries)
+            for step in reversed(plan):
+                if step[0] == "insert":
+                    tree.delete(step[1])
+                elif step[0] == "delete":
+                    tree.insert(step[1])
+            print(f"  updates {share:4.0%}  AVLTree {tree_seconds:8.3f}  sorted+bisect {sorted_seconds:8.3f}  "
+                  f"re-sort+bisect {resort_seconds:8.3f}  inorder_traversal ~{traversal_seconds:10.1f}")
+
+
+if __name__ == "__main__":
+    main([int(float(arg)) for arg in sys.argv[1:]] or [10 ** 4, 10 ** 5, 10 ** 6])
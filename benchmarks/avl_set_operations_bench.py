@@ -0,0 +1,97 @@
+"""
+AVL Set Operations Benchmark
+
+Compares the join-based `AVLTree` operations with the naive per-key approach on a tree of n random keys (default 1e6)
+and a second tree of m random keys (default sizes 1e3 and 1e6), drawn from a range of 4n so the trees partly overlap:
+- bulk load: `AVLTree.from_sorted` versus n `insert` calls in random order.
+- union: `union` versus inserting every key of the second tree.
+- intersection: `intersection` versus searching every key of the second tree in the first and inserting the hits
+  into a new tree.
+- difference: `difference` versus deleting every key of the second tree.
+
+The m = n case is also run with the two trees cut into one range per worker and combined on a process pool.
+
+Usage:
+    python -m benchmarks.avl_set_operations_bench [n] [m ...]
+"""
+
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from Data_Structures.avl_tree import AVLTree
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def insert_all(keys) -> AVLTree:
+    tree = AVLTree()
+    insert = tree.insert
+    for key in keys:
+        insert(key)
+    return tree
+
+
+def naive_union(tree: AVLTree, keys: list) -> None:
+    insert = tree.insert
+    for key in keys:
+        insert(key)
+
+
+def naive_intersection(tree: AVLTree, keys: list) -> AVLTree:
+    result = AVLTree()
+    for key in keys:
+        if key in tree:
+            result.insert(key, tree[key])
+    return result
+
+
+def naive_difference(tree: AVLTree, keys: list) -> None:
+    delete = tree.delete
+    for key in keys:
+        delete(key)
+
+
+def main(n: int, sizes: list) -> None:
+    rng = random.Random(1)
+    keys = rng.sample(range(4 * n), n)
+    ordered = sorted(keys)
+    bulk, _ = timed(AVLTree.from_sorted, ordered)
+    naive, _ = timed(insert_all, keys)
+    print(f"bulk load of {n:,} keys: from_sorted {bulk:8.3f} s   insert one by one {naive:8.3f} s")
+
+    workers = os.cpu_count() or 1
+    for m in sizes:
+        other = sorted(rng.sample(range(4 * n), m))
+        print(f"\nn={n:,} m={m:,} (seconds)")
+        for operation in ("union", "intersection", "difference"):
+            tree, second = AVLTree.from_sorted(ordered), AVLTree.from_sorted(other)
+            joined, _ = timed(getattr(tree, operation), second)
+            expected = list(tree)
+            tree, second = AVLTree.from_sorted(ordered), AVLTree.from_sorted(other)
+            if operation == "union":
+                per_key, _ = timed(naive_union, tree, other)
+            elif operation == "intersection":
+                per_key, tree = timed(naive_intersection, tree, other)
+            else:
+                per_key, _ = timed(naive_difference, tree, other)
+            assert list(tree) == expected
+            line = f"  {operation:13} join-based {joined:8.3f}   per key {per_key:8.3f}"
+            if m == n:
+                with ProcessPoolExecutor(workers) as executor:
+                    tree, second = AVLTree.from_sorted(ordered), AVLTree.from_sorted(other)
+                    pooled, _ = timed(getattr(tree, operation), second, executor, workers)
+                assert list(tree) == expected
+                line += f"   process pool ({workers} workers) {pooled:8.3f}"
+            print(line)
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 6,
+         [int(float(arg)) for arg in sys.argv[2:]] or [10 ** 3, 10 ** 6])
@@ -0,0 +1,89 @@
+"""
+Binary Heap Benchmark
+
+Times n (default 1e6) random inserts followed by n pops for `MaxHeap` and `MinHeap`, with and without a key function,
+next to `heapq` on a plain list. Also compares `build` with `heapq.heapify`, and `pushpop` with `heapq.heappushpop`.
+
+The old `insert` re-heapified the whole array after every append, O(n) per insert. It is re-created below, timed up
+to LEGACY_MAX inserts, and extrapolated quadratically beyond that.
+
+Usage:
+    python -m benchmarks.binary_heap_bench [n]
+"""
+
+import heapq
+import random
+import sys
+import time
+
+from Data_Structures.binary_heap import MaxHeap, MinHeap
+
+LEGACY_MAX = 2000
+
+
+def legacy_insert(arr: list, value) -> None:
+    arr.append(value)
+    size = len(arr)
+    for start in range(size // 2 - 1, -1, -1):
+        i = start
+        while True:
+            largest, left, right = i, 2 * i + 1, 2 * i + 2
+            if left < size and arr[largest] < arr[left]:
+                largest = left
+            if right < size and arr[largest] < arr[right]:
+                largest = right
+            if largest == i:
+                break
+            arr[i], arr[largest] = arr[largest], arr[i]
+            i = largest
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def push_pop(heap, values) -> None:
+    insert, pop = heap.insert, heap.pop
+    for value in values:
+        insert(value)
+    for _ in values:
+        pop()
+
+
+def heapq_push_pop(values) -> None:
+    heap = []
+    for value in values:
+        heapq.heappush(heap, value)
+    for _ in values:
+        heapq.heappop(heap)
+
+
+def row(label: str, seconds: float, note: str = "") -> None:
+    print(f"{label:44} {seconds:10.3f} s{note}")
+
+
+def main(n: int) -> None:
+    rng = random.Random(1)
+    values = [rng.random() for _ in range(n)]
+    print(f"{n:,} values")
+    small = min(n, LEGACY_MAX)
+    legacy = [[]]
+    seconds = timed(lambda: [legacy_insert(legacy[0], value) for value in values[:small]])
+    note = "" if small == n else f" (extrapolated from {small:,})"
+    row("old MaxHeap.insert x n", seconds * (n / small) ** 2, note)
+    row("MaxHeap insert + pop x n", timed(push_pop, MaxHeap(), values))
+    row("MinHeap insert + pop x n", timed(push_pop, MinHeap(), values))
+    row("MinHeap(key=abs) insert + pop x n", timed(push_pop, MinHeap(key=abs), values))
+    row("heapq heappush + heappop x n", timed(heapq_push_pop, values))
+    row("MinHeap.build", timed(MinHeap().build, values))
+    row("heapq.heapify", timed(heapq.heapify, list(values)))
+    heap, plain = MinHeap(values), list(values)
+    heapq.heapify(plain)
+    row("MinHeap.pushpop x n", timed(lambda: [heap.pushpop(value) for value in values]))
+    row("heapq.heappushpop x n", timed(lambda: [heapq.heappushpop(plain, value) for value in values]))
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 6)
@@ -0,0 +1,86 @@
+"""
+Binary Search Tree Benchmark
+
+Builds a `BinarySearchTree` of n keys (default 1e6) from three insertion orders and reports the build time, the tree
+height, and the time to search every key and to iterate the tree in order:
+- random: a shuffled range (expected height about 2.99 log2 n)
+- sorted: ascending keys, which make every node a right child (height n)
+- adversarial: alternating smallest and largest remaining keys (0, n-1, 1, n-2, ...), a zig-zag chain of height n
+
+Degenerate orders cost O(n^2) to insert, so they are timed up to DEGENERATE_MAX keys and extrapolated beyond that.
+`from_sorted` is timed on the full sorted input for comparison. Every operation is iterative, so the deep trees do
+not raise `RecursionError`.
+
+Usage:
+    python -m benchmarks.binary_search_tree_bench [n]
+"""
+
+import random
+import sys
+import time
+
+from Data_Structures.binary_search_tree import BinarySearchTree
+
+DEGENERATE_MAX = 5000
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def build(keys) -> BinarySearchTree:
+    tree = BinarySearchTree()
+    insert = tree.insert
+    for key in keys:
+        insert(key)
+    return tree
+
+
+def search_all(tree: BinarySearchTree, keys) -> None:
+    search = tree.search
+    for key in keys:
+        search(key)
+
+
+def drain(iterator) -> None:
+    for _ in iterator:
+        pass
+
+
+def adversarial(n: int) -> list:
+    keys, lo, hi = [], 0, n - 1
+    while lo <= hi:
+        keys.append(lo)
+        if lo != hi:
+            keys.append(hi)
+        lo, hi = lo + 1, hi - 1
+    return keys
+
+
+def report(label: str, tree: BinarySearchTree, keys: list, build_seconds: float, scale: float = 1.0) -> None:
+    search, _ = timed(search_all, tree, keys)
+    walk, _ = timed(drain, tree.inorder())
+    note = f" (extrapolated from {len(keys):,} keys)" if scale != 1.0 else ""
+    print(f"{label:14} build {build_seconds * scale ** 2:10.2f} s  search all {search * scale ** 2:10.2f} s  "
+          f"inorder {walk * scale:6.2f} s  height {tree.height():>7,}{note}")
+
+
+def main(n: int) -> None:
+    rng = random.Random(1)
+    print(f"{n:,} keys")
+    shuffled = list(range(n))
+    rng.shuffle(shuffled)
+    seconds, tree = timed(build, shuffled)
+    report("random", tree, shuffled, seconds)
+    small = min(n, DEGENERATE_MAX)
+    for label, keys in (("sorted", list(range(small))), ("adversarial", adversarial(small))):
+        seconds, tree = timed(build, keys)
+        report(label, tree, keys, seconds, n / small)
+    seconds, tree = timed(BinarySearchTree.from_sorted, range(n))
+    report("from_sorted", tree, shuffled, seconds)
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 6)
@@ -0,0 +1,82 @@
+"""
+Cache Benchmark
+
+Measures operations per second for LRUCache, LFUCache and TTLCache against the 1e6 ops/s target, next to an
+OrderedDict-based LRU and `functools.lru_cache` as references. Each run replays the same stream of n keys drawn
+from a skewed (Zipf-like) distribution, doing `get` and a `put` on every miss. It reports the hit rate and the eviction count.
+
+Usage:
+    python -m benchmarks.cache_bench [n] [maxsize]
+"""
+
+import functools
+import random
+import sys
+import time
+from collections import OrderedDict
+
+from Data_Structures.cache import LFUCache, LRUCache, TTLCache, memoize
+
+TARGET = 10 ** 6
+
+
+def zipf_keys(n: int, universe: int, seed: int = 1) -> list:
+    rng = random.Random(seed)
+    return [int(universe ** rng.random()) for _ in range(n)]
+
+
+def replay(cache, keys: list) -> float:
+    get, put = cache.get, cache.put
+    start = time.perf_counter()
+    for key in keys:
+        if get(key) is None:
+            put(key, key)
+    return time.perf_counter() - start
+
+
+class OrderedDictLRU:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+
+    def get(self, key):
+        value = self.data.get(key)
+        if value is not None:
+            self.data.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self.data[key] = value
+        if len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+
+def replay_function(fn, keys: list) -> float:
+    start = time.perf_counter()
+    for key in keys:
+        fn(key)
+    return time.perf_counter() - start
+
+
+def report(name: str, n: int, seconds: float, extra: str = "") -> None:
+    rate = n / seconds
+    print(f"{name:28} {rate / 1e6:8.2f} M ops/s  {'meets' if rate >= TARGET else 'below'} target  {extra}")
+
+
+def main(n: int, maxsize: int) -> None:
+    keys = zipf_keys(n, universe=maxsize * 20)
+    print(f"{n} lookups, maxsize {maxsize}")
+    for name, cache in (("LRUCache", LRUCache(maxsize)), ("LFUCache", LFUCache(maxsize)),
+                        ("TTLCache (ttl=60s)", TTLCache(60, maxsize)),
+                        ("LRUCache (max_bytes)", LRUCache(10 ** 9, max_bytes=maxsize * 28))):
+        seconds = replay(cache, keys)
+        stats = cache.stats()
+        report(name, n, seconds, f"hit rate {stats['hit_rate']:.3f}, evictions {stats['evictions']}")
+    report("OrderedDict LRU", n, replay(OrderedDictLRU(maxsize), keys))
+    report("memoize (lru)", n, replay_function(memoize(maxsize=maxsize)(lambda key: key), keys))
+    report("functools.lru_cache (C)", n, replay_function(functools.lru_cache(maxsize)(lambda key: key), keys))
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 6,
+         int(float(sys.argv[2])) if len(sys.argv) > 2 else 10 ** 4)
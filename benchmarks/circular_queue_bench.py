@@ -0,0 +1,82 @@
+"""
+BlockingCircularQueue Benchmark
+
+Runs P producer and C consumer threads from a thread pool over one BlockingCircularQueue and reports items/sec plus the
+contention and wait counters, for each (P, C) pair. Consumers drain with `get_many` so lock acquisitions are amortized;
+pass `--single` to make them use `get` instead and see the difference.
+
+Usage:
+    python -m benchmarks.circular_queue_bench [--single] [items]   # default 200000 items per run
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from Data_Structures.queues import BlockingCircularQueue
+
+SIZE = 1024
+BATCH = 256
+THREAD_COUNTS = (1, 2, 4, 8)
+
+
+def run(producers: int, consumers: int, items: int, batched: bool) -> tuple:
+    """
+    Moves `items` items through the queue with the given number of producer and consumer threads.
+
+    Args:
+        producers (int): Number of producer threads.
+        consumers (int): Number of consumer threads.
+        items (int): Total number of items to move.
+        batched (bool): Whether consumers use get_many instead of get.
+
+    Returns:
+        tuple: (items per second, queue statistics)
+    """
+    q = BlockingCircularQueue(SIZE)
+    stop = object()
+    per_producer = items // producers
+
+    def produce():
+        put = q.put
+        for i in range(per_producer):
+            put(i)
+
+    def consume():
+        count = 0
+        while True:
+            batch = q.get_many(BATCH) if batched else [q.get()]
+            for i, item in enumerate(batch):
+                if item is stop:
+                    # stops are queued after every item, so the rest of the batch is stops for other consumers
+                    for other in batch[i + 1:]:
+                        q.put(other)
+                    return count
+                count += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(producers + consumers) as pool:
+        consumer_futures = [pool.submit(consume) for _ in range(consumers)]
+        for future in [pool.submit(produce) for _ in range(producers)]:
+            future.result()
+        for _ in range(consumers):
+            q.put(stop)
+        moved = sum(f.result() for f in consumer_futures)
+    elapsed = time.perf_counter() - start
+    assert moved == per_producer * producers
+    return moved / elapsed, q.stats()
+
+
+def main(items: int, batched: bool) -> None:
+    print(f"consumers use {'get_many' if batched else 'get'}; {items} items per run")
+    print(f"{'P':>3} {'C':>3} {'items/s':>12} {'contended':>10} {'put_waits':>10} {'get_waits':>10}")
+    for producers in THREAD_COUNTS:
+        for consumers in THREAD_COUNTS:
+            rate, stats = run(producers, consumers, items, batched)
+            print(f"{producers:>3} {consumers:>3} {rate:12,.0f} {stats['contended']:>10} "
+                  f"{stats['put_waits']:>10} {stats['get_waits']:>10}")
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if a != "--single"]
+    main(int(args[0]) if args else 200000, "--single" not in sys.argv)
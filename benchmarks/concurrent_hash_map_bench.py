@@ -0,0 +1,101 @@
+"""
+Concurrent Hash Map Benchmark
+
+Runs the same mixed workload (80% get, 15% update, 5% put) from a thread pool at 1, 2, 4 and 8 threads against:
+1. `ConcurrentHashMap` with 16 segments
+2. one `dict` behind a single global lock
+3. one `SimpleHashMap` behind a single global lock (what callers had to do before)
+
+Each thread performs OPS operations on keys drawn from a shared key space, so threads contend for the same keys.
+Under the GIL the Python-level work of all threads is still serialized; striping removes lock waits and convoying
+between threads, which shows up as flatter throughput as threads are added rather than as linear speedup.
+
+Usage:
+    python -m benchmarks.concurrent_hash_map_bench [ops_per_thread]
+"""
+
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from Data_Structures.concurrent_hash_map import ConcurrentHashMap
+from Data_Structures.hash_tables import SimpleHashMap
+
+THREADS = (1, 2, 4, 8)
+KEYS = 100_000
+
+
+class LockedDict:
+    def __init__(self, table=None):
+        self.table = {} if table is None else table
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            return self.table.get(key, default)
+
+    def put(self, key, value):
+        with self.lock:
+            self.table[key] = value
+
+    def update(self, key, fn, default=None):
+        with self.lock:
+            value = fn(self.table.get(key, default))
+            self.table[key] = value
+            return value
+
+
+class LockedSimpleHashMap(LockedDict):
+    def __init__(self):
+        super().__init__(SimpleHashMap())
+
+    def put(self, key, value):
+        with self.lock:
+            self.table.put(key, value)
+
+    def update(self, key, fn, default=None):
+        with self.lock:
+            value = fn(self.table.get(key, default))
+            self.table.put(key, value)
+            return value
+
+
+def workload(table, seed: int, ops: int) -> None:
+    rng = random.Random(seed)
+    keys = [rng.randrange(KEYS) for _ in range(ops)]
+    kinds = [rng.random() for _ in range(ops)]
+    get, put, update = table.get, table.put, table.update
+    increment = (lambda value: value + 1)
+    for key, kind in zip(keys, kinds):
+        if kind < 0.80:
+            get(key)
+        elif kind < 0.95:
+            update(key, increment, 0)
+        else:
+            put(key, kind)
+
+
+def throughput(make, threads: int, ops: int) -> float:
+    table = make()
+    for key in range(KEYS):
+        table.put(key, 0)
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        start = time.perf_counter()
+        list(pool.map(workload, [table] * threads, range(threads), [ops] * threads))
+        elapsed = time.perf_counter() - start
+    return threads * ops / elapsed
+
+
+def main(ops: int) -> None:
+    print(f"{ops} ops per thread, {KEYS} keys")
+    print(f"{'map':28}" + "".join(f"{f'{t} thr':>10}" for t in THREADS) + "   (M ops/s)")
+    for name, make in (("ConcurrentHashMap (16 seg)", lambda: ConcurrentHashMap(segments=16, capacity=KEYS)),
+                       ("dict + global lock", LockedDict),
+                       ("SimpleHashMap + global lock", LockedSimpleHashMap)):
+        print(f"{name:28}" + "".join(f"{throughput(make, t, ops) / 1e6:10.3f}" for t in THREADS))
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,60 @@
+"""
+Consistent Hashing Benchmark
+
+For n keys (default 1e6) over 16 nodes, compares `HashRing` with `hash(key) % N` placement:
+- keys moved when a 17th node joins (ideal: n / 17)
+- load balance (largest shard / mean shard) for several `vnodes` settings
+- bounded-load placement of a skewed batch (10% of the keys are one hot key)
+- lookup throughput of `locate` per key, `locate_many`, and the modulo baseline
+
+Usage:
+    python -m benchmarks.consistent_hash_bench [n]
+"""
+
+import sys
+import time
+from collections import Counter
+
+from Data_Structures.consistent_hash import HashRing, _hash
+
+NODES = [f"node-{i}" for i in range(16)]
+
+
+def imbalance(placement: list) -> float:
+    counts = Counter(placement)
+    return max(counts.values()) / (len(placement) / len(counts))
+
+
+def main(n: int) -> None:
+    keys = [f"key:{i}" for i in range(n)]
+    print(f"{n:,} keys, {len(NODES)} nodes")
+
+    modulo_before = [_hash(key) % len(NODES) for key in keys]
+    modulo_after = [_hash(key) % (len(NODES) + 1) for key in keys]
+    moved = sum(a != b for a, b in zip(modulo_before, modulo_after))
+    print(f"join, hash % N moved           {moved / n:8.1%}")
+    ring = HashRing(NODES)
+    moved = sum(len(group) for group in ring.plan_join("node-16", keys).values())
+    print(f"join, HashRing moved           {moved / n:8.1%}  (ideal {1 / (len(NODES) + 1):.1%})")
+
+    for vnodes in (1, 10, 160, 500):
+        placement = HashRing(NODES, vnodes).locate_many(keys)
+        print(f"max / mean shard, vnodes={vnodes:<4}   {imbalance(placement):8.2f}")
+    skewed = ["hot"] * (n // 10) + keys[n // 10:]
+    print(f"skewed batch, unbounded        {imbalance(ring.locate_many(skewed)):8.2f}")
+    print(f"skewed batch, load_factor=1.25 {imbalance(ring.locate_many(skewed, load_factor=1.25)):8.2f}")
+
+    start = time.perf_counter()
+    for key in keys:
+        ring.locate(key)
+    print(f"locate per key                 {n / (time.perf_counter() - start) / 1e6:8.2f} M keys/s")
+    start = time.perf_counter()
+    ring.locate_many(keys)
+    print(f"locate_many                    {n / (time.perf_counter() - start) / 1e6:8.2f} M keys/s")
+    start = time.perf_counter()
+    [NODES[_hash(key) % len(NODES)] for key in keys]
+    print(f"hash % N                       {n / (time.perf_counter() - start) / 1e6:8.2f} M keys/s")
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 6)
@@ -0,0 +1,88 @@
+"""
+Dijkstra Benchmark
+
+Runs `Graph.djikstra_algorithm` on dense random graphs (every vertex linked to a fraction `density` of the others,
+random weights) with the default lazy heap (a `heapq` list that receives a duplicate entry on every relaxation) and
+with `indexed=True` (an `IndexedHeap` whose entries are updated in place). Reports the runtime and the peak number of
+heap entries of each. The peak is measured by replaying the same relaxations with counters.
+
+Usage:
+    python -m benchmarks.dijkstra_bench [vertices ...]
+"""
+
+import heapq
+import random
+import sys
+import time
+
+from Data_Structures.binary_heap import IndexedHeap
+from Data_Structures.graph import Graph
+
+DENSITY = 0.5
+
+
+def dense_graph(n: int, rng: random.Random) -> Graph:
+    graph = Graph(n)
+    for u in range(n):
+        for v in range(u + 1, n):
+            if rng.random() < DENSITY:
+                graph.add_edge(u, v, rng.randint(1, 1000))
+    return graph
+
+
+def lazy_peak(graph: Graph, start: int) -> int:
+    dist = [float("inf")] * graph.vertices
+    dist[start] = 0
+    heap, visited, peak = [(0, start)], [False] * graph.vertices, 1
+    while heap:
+        _, u = heapq.heappop(heap)
+        if visited[u]:
+            continue
+        visited[u] = True
+        for v, weight in graph.adj_list[u]:
+            if dist[u] + weight < dist[v]:
+                dist[v] = dist[u] + weight
+                heapq.heappush(heap, (dist[v], v))
+                peak = max(peak, len(heap))
+    return peak
+
+
+def indexed_peak(graph: Graph, start: int) -> int:
+    dist = [float("inf")] * graph.vertices
+    dist[start] = 0
+    queue, done, peak = IndexedHeap(), [False] * graph.vertices, 1
+    queue.push(start, 0)
+    while queue:
+        u, d = queue.pop()
+        done[u] = True
+        for v, weight in graph.adj_list[u]:
+            if not done[v] and d + weight < dist[v]:
+                dist[v] = d + weight
+                if v in queue:
+                    queue.update(v, dist[v])
+                else:
+                    queue.push(v, dist[v])
+                    peak = max(peak, len(queue))
+    return peak
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main(sizes: list) -> None:
+    rng = random.Random(1)
+    for n in sizes:
+        graph = dense_graph(n, rng)
+        edges = sum(map(len, graph.adj_list)) // 2
+        lazy, expected = timed(graph.djikstra_algorithm, 0)
+        indexed, result = timed(graph.djikstra_algorithm, 0, True)
+        assert result == expected
+        print(f"V={n:<5} E={edges:<9,} lazy heapq    {lazy:8.3f} s  peak heap {lazy_peak(graph, 0):>8,}")
+        print(f"{'':22} IndexedHeap   {indexed:8.3f} s  peak heap {indexed_peak(graph, 0):>8,}")
+
+
+if __name__ == "__main__":
+    main([int(float(arg)) for arg in sys.argv[1:]] or [500, 1000, 2000])
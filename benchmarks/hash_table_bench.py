@@ -0,0 +1,101 @@
+"""
+Hash Table Benchmark
+
+Compares `OpenAddressingTable` (each probing scheme, several max load factors) with `dict` on n random integer keys
+(default 1e6):
+- insert and lookup throughput (lookups are half hits, half misses)
+- memory per item (tracemalloc, including the int keys)
+- the longest single insert, with incremental resizing versus a one-shot rehash (rehash_step larger than the table)
+- the mean and maximum probe length of successful lookups, from `probe_histogram()`
+
+Usage:
+    python -m benchmarks.hash_table_bench [n]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from Data_Structures.hash_tables import PROBING, OpenAddressingTable
+
+LOAD_FACTORS = (0.5, 0.7, 0.9)
+
+
+def fill(table, keys: list) -> float:
+    """Inserts every key and returns the longest single insert, in seconds."""
+    put = table.put if hasattr(table, "put") else table.__setitem__
+    clock = time.perf_counter
+    worst = 0.0
+    for key in keys:
+        start = clock()
+        put(key, key)
+        elapsed = clock() - start
+        if elapsed > worst:
+            worst = elapsed
+    return worst
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def bulk_insert(table, keys: list) -> None:
+    put = table.put if hasattr(table, "put") else table.__setitem__
+    for key in keys:
+        put(key, key)
+
+
+def lookups(table, probes: list) -> None:
+    get = table.get
+    for key in probes:
+        get(key)
+
+
+def bytes_per_item(make, keys: list) -> float:
+    tracemalloc.start()
+    table = make()
+    bulk_insert(table, keys)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del table
+    return used / len(keys)
+
+
+def probe_summary(table) -> str:
+    histogram = table.probe_histogram()
+    total = sum(histogram.values())
+    mean = sum(length * count for length, count in histogram.items()) / total
+    return f"{mean:5.2f} {max(histogram):5d}"
+
+
+def row(name: str, n: int, make, keys: list, probes: list, probe_info: bool) -> None:
+    table = make()
+    insert = timed(bulk_insert, table, keys)
+    lookup = timed(lookups, table, probes)
+    memory = bytes_per_item(make, keys)
+    pause = fill(make(), keys)
+    extra = probe_summary(table) if probe_info else ""
+    print(f"{name:34} {n / insert / 1e6:8.2f} {n / lookup / 1e6:8.2f} {memory:8.1f} {pause * 1e3:10.2f}  {extra}")
+
+
+def main(n: int) -> None:
+    rng = random.Random(1)
+    keys = rng.sample(range(n * 10), n)
+    probes = keys[: n // 2] + [rng.randrange(n * 10, n * 20) for _ in range(n - n // 2)]
+    print(f"{n} keys")
+    print(f"{'table':34} {'M ins/s':>8} {'M get/s':>8} {'B/item':>8} {'max put ms':>10}  "
+          f"{'mean':>5} {'max':>5} probes")
+    row("dict", n, dict, keys, probes, False)
+    for probing in PROBING:
+        for load in LOAD_FACTORS:
+            row(f"{probing}, load {load}", n,
+                lambda: OpenAddressingTable(max_load_factor=load, probing=probing), keys, probes, True)
+    row("linear, load 0.7, one-shot rehash", n,
+        lambda: OpenAddressingTable(probing="linear", rehash_step=1 << 62), keys, probes, True)
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 6)
@@ -0,0 +1,110 @@
+"""
+Heap Arity Benchmark
+
+Times the pure-Python d-ary `Heap` for every arity from 2 to 16 on three operation mixes of n operations (default
+2e5), and reports the fastest arity per mix:
+- push-heavy: ten pushes for every pop
+- pop-heavy: `heapify` of n items, then n pops
+- steady: a heap of n / 2 items with alternating push and pop
+
+A comparator is passed so the binary case runs the same Python code instead of the `heapq` fast path; `heapq` is
+listed for reference. A final section compares `RadixHeap`, `heapq` and `Heap` on a monotone integer workload like
+Dijkstra's (every pushed key is at least the last popped one).
+
+Usage:
+    python -m benchmarks.heap_arity_bench [n]
+"""
+
+import heapq
+import operator
+import random
+import sys
+import time
+
+from Data_Structures.binary_heap import Heap, RadixHeap
+
+ARITIES = range(2, 17)
+
+
+def push_heavy(heap, values) -> None:
+    push, pop = heap.push, heap.pop
+    for i, value in enumerate(values):
+        push(value)
+        if i % 10 == 9:
+            pop()
+
+
+def pop_heavy(heap, values) -> None:
+    heap.heapify(values)
+    pop = heap.pop
+    for _ in values:
+        pop()
+
+
+def steady(heap, values) -> None:
+    half = len(values) // 2
+    heap.heapify(values[:half])
+    push, pop = heap.push, heap.pop
+    for value in values[half:]:
+        push(value)
+        pop()
+
+
+class HeapqAdapter:
+    def __init__(self):
+        self.heap = []
+
+    def push(self, item):
+        heapq.heappush(self.heap, item)
+
+    def pop(self):
+        return heapq.heappop(self.heap)
+
+    def heapify(self, iterable):
+        self.heap = list(iterable)
+        heapq.heapify(self.heap)
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def monotone(push, pop, n: int, rng: random.Random) -> None:
+    for i in range(n // 4):
+        push(rng.randrange(1000), i)
+    for i in range(n):
+        key = pop()[0]
+        push(key + rng.randrange(1000), i)
+
+
+def main(n: int) -> None:
+    rng = random.Random(1)
+    values = [rng.random() for _ in range(n)]
+    mixes = {"push-heavy": push_heavy, "pop-heavy": pop_heavy, "steady": steady}
+    print(f"{n:,} operations per mix (seconds)")
+    print(f"{'arity':>8}" + "".join(f"{name:>12}" for name in mixes))
+    results = {name: {} for name in mixes}
+    for d in ARITIES:
+        for name, mix in mixes.items():
+            results[name][d] = timed(mix, Heap(arity=d, comparator=operator.lt), values)
+        print(f"{d:>8}" + "".join(f"{results[name][d]:12.3f}" for name in mixes))
+    print(f"{'heapq':>8}" + "".join(f"{timed(mix, HeapqAdapter(), values):12.3f}" for mix in mixes.values()))
+    print(f"{'best':>8}" + "".join(f"{min(results[name], key=results[name].get):>12}" for name in mixes))
+
+    print(f"\nmonotone integer keys, {n:,} pop + push pairs")
+    radix, plain = RadixHeap(), []
+    best = min(results["steady"], key=results["steady"].get)
+    heap = Heap(arity=best, key=operator.itemgetter(0))
+    queues = {
+        "RadixHeap": (radix.push, radix.pop),
+        "heapq": (lambda key, value: heapq.heappush(plain, (key, value)), lambda: heapq.heappop(plain)),
+        f"Heap(arity={best})": (lambda key, value: heap.push((key, value)), heap.pop),
+    }
+    for name, (push, pop) in queues.items():
+        print(f"{name:16} {timed(monotone, push, pop, n, random.Random(2)):8.3f} s")
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 2 * 10 ** 5)
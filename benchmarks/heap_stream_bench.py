@@ -0,0 +1,94 @@
+"""
+Heap Streaming Benchmark
+
+`Heap.top_k` versus `heapq.nlargest` on a generator of n random floats (default 1e7) for several k, with and
+without a key function.
+
+`Heap.merge_sorted` versus `heapq.merge` on n int64 values split over N sorted run files. Each run is read by a
+generator over an `mmap` of its file. Two layouts are measured: randomly interleaved runs, and runs of long
+consecutive blocks, where most items follow an item from the same source.
+
+Usage:
+    python -m benchmarks.heap_stream_bench [n]
+"""
+
+import heapq
+import mmap
+import os
+import random
+import sys
+import tempfile
+import time
+from array import array
+
+from Data_Structures.binary_heap import Heap
+
+
+def floats(n: int, seed: int = 1):
+    rng = random.Random(seed)
+    return (rng.random() for _ in range(n))
+
+
+def read_run(path: str):
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm).cast("q")
+        try:
+            yield from view
+        finally:
+            view.release()
+
+
+def write_runs(directory: str, runs: list) -> list:
+    paths = []
+    for i, run in enumerate(runs):
+        path = os.path.join(directory, f"run{i}.bin")
+        with open(path, "wb") as file:
+            array("q", run).tofile(file)
+        paths.append(path)
+    return paths
+
+
+def timed(fn, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def drain(iterator) -> None:
+    for _ in iterator:
+        pass
+
+
+def main(n: int) -> None:
+    print(f"top-k of {n:,} floats from a generator (seconds)")
+    for k in (10, 1000, 100_000):
+        ours = timed(Heap.top_k, floats(n), k)
+        theirs = timed(heapq.nlargest, k, floats(n))
+        print(f"k={k:<8} Heap.top_k {ours:8.3f}   heapq.nlargest {theirs:8.3f}")
+    ours = timed(Heap.top_k, floats(n), 1000, key=abs)
+    theirs = timed(heapq.nlargest, 1000, floats(n), key=abs)
+    print(f"k=1000, key=abs  Heap.top_k {ours:8.3f}   heapq.nlargest {theirs:8.3f}")
+
+    print(f"\nmerge of {n:,} int64 values from mmap-backed run files (seconds)")
+    rng = random.Random(2)
+    with tempfile.TemporaryDirectory() as directory:
+        for runs_count in (2, 16, 128):
+            for layout in ("interleaved", "blocks"):
+                if layout == "interleaved":
+                    runs = [[] for _ in range(runs_count)]
+                    for value in range(n):
+                        runs[rng.randrange(runs_count)].append(value)
+                else:
+                    block = max(1, n // (runs_count * 64))
+                    runs = [[] for _ in range(runs_count)]
+                    for start in range(0, n, block):
+                        runs[rng.randrange(runs_count)].extend(range(start, min(start + block, n)))
+                paths = write_runs(directory, runs)
+                del runs
+                ours = timed(drain, Heap.merge_sorted(*map(read_run, paths)))
+                theirs = timed(drain, heapq.merge(*map(read_run, paths)))
+                print(f"N={runs_count:<4} {layout:12} Heap.merge_sorted {ours:8.3f}   heapq.merge {theirs:8.3f}")
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 7)
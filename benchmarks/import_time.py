@@ -0,0 +1,120 @@
+"""
+Import-Time Budget for the dsa Package
+
+Starts fresh interpreters and measures:
+1. ``import dsa`` on its own (should only build the lazy name table).
+2. ``from dsa import SegmentTree`` (should import exactly one repository module).
+3. Importing every repository module, to check none of them prints or runs demo code at import time.
+
+Each measurement is the best of several runs so the numbers reflect the code rather than a cold disk cache.
+The script exits with status 1 if any budget is exceeded or any check fails, so it can gate CI.
+
+Usage:
+    python benchmarks/import_time.py
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 7
+
+# budgets in milliseconds, measured inside the child interpreter (excludes interpreter startup)
+BUDGET_IMPORT_DSA_MS = 10.0
+BUDGET_ONE_ATTRIBUTE_MS = 50.0
+
+PACKAGES = ("Data_Structures", "Search_Sort", "Misc_Algo")
+
+_TIMED_SNIPPET = """
+import sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+{stmt}
+elapsed = (time.perf_counter() - start) * 1000
+loaded = sorted(m for m in set(sys.modules) - before if m.split('.')[0] in {packages!r})
+print(elapsed)
+print(','.join(loaded))
+"""
+
+
+def run_child(code: str) -> tuple:
+    """
+    Runs `code` in a fresh interpreter rooted at the repository.
+
+    Args:
+        code (str): The Python source to execute.
+
+    Returns:
+        tuple: (stdout, stderr) of the child process.
+    """
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return result.stdout, result.stderr
+
+
+def time_statement(stmt: str) -> tuple:
+    """
+    Measures the best-of-RUNS wall time of `stmt` and the repository modules it loaded.
+
+    Args:
+        stmt (str): The import statement to time.
+
+    Returns:
+        tuple: (best time in ms, list of repository modules loaded by the statement)
+    """
+    best, loaded = float("inf"), []
+    for _ in range(RUNS):
+        out, _ = run_child(_TIMED_SNIPPET.format(stmt=stmt, packages=PACKAGES + ("dsa",)))
+        elapsed, modules = out.splitlines()
+        best = min(best, float(elapsed))
+        loaded = modules.split(",") if modules else []
+    return best, loaded
+
+
+def module_names() -> list:
+    """
+    Lists the dotted names of every module in the repository packages.
+
+    Returns:
+        list: The module names, e.g. "Data_Structures.stack".
+    """
+    names = []
+    for package in PACKAGES:
+        for dirpath, _, filenames in os.walk(os.path.join(ROOT, package)):
+            prefix = os.path.relpath(dirpath, ROOT).replace(os.sep, ".")
+            names.extend(f"{prefix}.{f[:-3]}" for f in sorted(filenames)
+                         if f.endswith(".py") and f != "__init__.py")
+    return names
+
+
+def main() -> int:
+    failures = []
+
+    ms, loaded = time_statement("import dsa")
+    print(f"import dsa:                  {ms:7.3f} ms  modules={loaded}")
+    if ms > BUDGET_IMPORT_DSA_MS:
+        failures.append(f"import dsa took {ms:.3f} ms (budget {BUDGET_IMPORT_DSA_MS} ms)")
+    if loaded != ["dsa"]:
+        failures.append(f"import dsa loaded extra modules: {loaded}")
+
+    ms, loaded = time_statement("from dsa import SegmentTree")
+    print(f"from dsa import SegmentTree: {ms:7.3f} ms  modules={loaded}")
+    if ms > BUDGET_ONE_ATTRIBUTE_MS:
+        failures.append(f"from dsa import SegmentTree took {ms:.3f} ms (budget {BUDGET_ONE_ATTRIBUTE_MS} ms)")
+    if loaded != ["Data_Structures", "Data_Structures.segment_tree", "dsa"]:
+        failures.append(f"from dsa import SegmentTree loaded unexpected modules: {loaded}")
+
+    for name in module_names():
+        out, err = run_child(f"import {name}")
+        if out or err:
+            failures.append(f"importing {name} produced output: {(out + err).strip()[:80]!r}")
+    print(f"side-effect check:           {len(module_names())} modules imported silently"
+          if not any("produced output" in f for f in failures) else "side-effect check:           FAILED")
+
+    for failure in failures:
+        print("FAIL:", failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
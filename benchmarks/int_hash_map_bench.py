@@ -0,0 +1,78 @@
+"""
+Int64 Hash Map Benchmark
+
+Compares `Int64HashMap` with a dict of Python ints at several sizes (default 1e6, 1e7 and 5e7 random int64 keys):
+- build: one `put_many` versus `dict(zip(keys, values))`
+- lookups: one `get_many` over n keys (half hits, half misses) versus a `dict.get` per key
+- memory per entry: the two NumPy arrays versus the dict table plus its int objects (tracemalloc)
+
+The dict side is skipped above DICT_MAX keys, where it would need several GB of RAM. Requires NumPy.
+
+Usage:
+    python -m benchmarks.int_hash_map_bench [n ...]
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from Data_Structures.int_hash_map import Int64HashMap
+
+DICT_MAX = 2 * 10 ** 7
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def build_map(keys, values) -> Int64HashMap:
+    table = Int64HashMap(capacity=len(keys))
+    table.put_many(keys, values)
+    return table
+
+
+def dict_bytes_per_entry(keys, values) -> float:
+    key_list, value_list = keys.tolist(), values.tolist()
+    tracemalloc.start()
+    table = dict(zip(key_list, value_list))
+    table_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del table
+    # int objects: 28-32 bytes each for 64-bit values, counted separately since tolist() made them outside the window
+    return table_bytes / len(keys) + sum(map(sys.getsizeof, key_list[:1000] + value_list[:1000])) / 1000
+
+
+def run(n: int) -> None:
+    rng = np.random.default_rng(1)
+    keys = rng.integers(-2 ** 62, 2 ** 62, size=n, dtype=np.int64)
+    values = np.arange(n, dtype=np.int64)
+    probes = np.concatenate([keys[: n // 2], rng.integers(-2 ** 62, 2 ** 62, size=n - n // 2, dtype=np.int64)])
+    build, table = timed(build_map, keys, values)
+    lookup, _ = timed(table.get_many, probes, -1)
+    per_entry = table.stats()["nbytes"] / len(table)
+    print(f"{n:>11,}  Int64HashMap  build {n / build / 1e6:7.2f} M/s  get_many {n / lookup / 1e6:7.2f} M/s  "
+          f"{per_entry:6.1f} B/entry")
+    del table
+    if n > DICT_MAX:
+        print(f"{'':11}  dict          skipped (n > {DICT_MAX:,})")
+        return
+    key_list, value_list, probe_list = keys.tolist(), values.tolist(), probes.tolist()
+    build, table = timed(lambda: dict(zip(key_list, value_list)))
+    get = table.get
+    lookup, _ = timed(lambda: [get(key, -1) for key in probe_list])
+    del table
+    print(f"{'':11}  dict          build {n / build / 1e6:7.2f} M/s  get       {n / lookup / 1e6:7.2f} M/s  "
+          f"{dict_bytes_per_entry(keys, values):6.1f} B/entry")
+
+
+def main(sizes: list) -> None:
+    for n in sizes:
+        run(n)
+
+
+if __name__ == "__main__":
+    main([int(float(arg)) for arg in sys.argv[1:]] or [10 ** 6, 10 ** 7, 5 * 10 ** 7])
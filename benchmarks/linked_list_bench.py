@@ -0,0 +1,101 @@
+"""
+Linked List Build Benchmark
+
+Compares building an n-node list (default 1e6) three ways:
+1. The original layout: nodes with a per-instance __dict__ and an append that walks from the head (O(n^2) build).
+   It is only timed up to LEGACY_MAX nodes and extrapolated beyond that, since it is quadratic.
+2. `insertAtEnd` per element on the current list (tail pointer, O(1) per append).
+3. `from_iterable` (one pass, no per-append method call).
+
+Per-node memory is measured with tracemalloc for a __dict__ node versus the current __slots__ node.
+
+Usage:
+    python -m benchmarks.linked_list_bench [n]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from Data_Structures.linked_list import DoublyLinkedList, SinglyLinkedList
+
+LEGACY_MAX = 20000
+
+
+class LegacyNode:
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+class LegacyList:
+    def __init__(self):
+        self.head = None
+
+    def insertAtEnd(self, new_data):
+        new_node = LegacyNode(new_data)
+        if self.head is None:
+            self.head = new_node
+            return
+        last = self.head
+        while last.next:
+            last = last.next
+        last.next = new_node
+
+
+def per_node_bytes(build, n: int) -> float:
+    tracemalloc.start()
+    built = build(n)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del built
+    return used / n
+
+
+def timed(build, n: int) -> float:
+    start = time.perf_counter()
+    build(n)
+    return time.perf_counter() - start
+
+
+def legacy_build(n: int) -> LegacyList:
+    lst = LegacyList()
+    for i in range(n):
+        lst.insertAtEnd(i)
+    return lst
+
+
+def legacy_nodes(n: int) -> LegacyNode:
+    head = last = LegacyNode(0)
+    for i in range(1, n):
+        last.next = LegacyNode(i)
+        last = last.next
+    return head
+
+
+def append_build(cls):
+    def build(n):
+        lst = cls()
+        for i in range(n):
+            lst.insertAtEnd(i)
+        return lst
+    return build
+
+
+def main(n: int) -> None:
+    print(f"{n} nodes")
+    small = min(n, LEGACY_MAX)
+    legacy = timed(legacy_build, small) * (n / small) ** 2
+    note = "" if small == n else f" (extrapolated from {small} nodes)"
+    print(f"legacy insertAtEnd (walks from head):  {legacy:10.2f} s{note}")
+    for cls in (SinglyLinkedList, DoublyLinkedList):
+        print(f"{cls.__name__} insertAtEnd (tail):   {timed(append_build(cls), n):10.2f} s")
+        print(f"{cls.__name__} from_iterable:        {timed(lambda k: cls.from_iterable(range(k)), n):10.2f} s")
+    print(f"per-node memory: __dict__ node {per_node_bytes(legacy_nodes, n):6.1f} B, "
+          f"Single_Node {per_node_bytes(lambda k: SinglyLinkedList.from_iterable(range(k)), n):6.1f} B, "
+          f"Double_Node {per_node_bytes(lambda k: DoublyLinkedList.from_iterable(range(k)), n):6.1f} B "
+          f"(including the int payloads)")
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 6)
@@ -0,0 +1,62 @@
+"""
+Linked List Sort Benchmark
+
+Times `sortLinkedList` on random, already sorted and reverse sorted input for both list types, next to the old bubble
+sort (data swapping, O(n^2)) and to `sorted()` on a Python list of the same values. The bubble sort is only timed up to
+LEGACY_MAX nodes and extrapolated beyond that. `mergeSorted` is timed on two sorted halves.
+
+Usage:
+    python -m benchmarks.linked_list_sort_bench [n]
+"""
+
+import random
+import sys
+import time
+
+from Data_Structures.linked_list import DoublyLinkedList, SinglyLinkedList
+
+LEGACY_MAX = 2000
+
+
+def bubble_sort(lst) -> None:
+    current = lst.head
+    while current:
+        index = current.next
+        while index:
+            if current.data > index.data:
+                current.data, index.data = index.data, current.data
+            index = index.next
+        current = current.next
+
+
+def timed(fn, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def row(label: str, seconds: float, note: str = "") -> None:
+    print(f"{label:48} {seconds:10.3f} s{note}")
+
+
+def main(n: int) -> None:
+    rng = random.Random(1)
+    values = [rng.random() for _ in range(n)]
+    inputs = {"random": values, "sorted": sorted(values), "reversed": sorted(values, reverse=True)}
+    print(f"{n} nodes")
+    small = min(n, LEGACY_MAX)
+    legacy = timed(bubble_sort, SinglyLinkedList(values[:small])) * (n / small) ** 2
+    note = "" if small == n else f" (extrapolated from {small} nodes)"
+    row("bubble sort (old sortLinkedList), random", legacy, note)
+    for name, data in inputs.items():
+        row(f"sorted() on a Python list, {name}", timed(sorted, data))
+    for cls in (SinglyLinkedList, DoublyLinkedList):
+        for name, data in inputs.items():
+            row(f"{cls.__name__}.sortLinkedList, {name}", timed(cls(data).sortLinkedList))
+        row(f"{cls.__name__}.sortLinkedList(key=neg), random", timed(cls(values).sortLinkedList, key=lambda x: -x))
+        left, right = cls(sorted(values[: n // 2])), cls(sorted(values[n // 2:]))
+        row(f"{cls.__name__}.mergeSorted, two halves", timed(left.mergeSorted, right))
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 6)
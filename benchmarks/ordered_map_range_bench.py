@@ -0,0 +1,98 @@
+"""
+Ordered Map Range Benchmark
+
+Builds an `AVLTree` and a `RedBlackTree` mapping n keys (default 1e7) to values, then pages through them with the
+lazy `range` generator, never materializing the entries:
+- keyset paging: every page of PAGE entries starts a new `range(last_key + 1)` and takes PAGE items from it, so each
+  page costs O(log n + PAGE) no matter how deep into the map it is.
+- random pages: PAGES pages starting at random keys (ascending and descending), timed per page.
+- full scan: one `range()` over every entry.
+
+The peak memory of the full scan is measured with `tracemalloc` and compared with the list built by
+`AVLTree.inorder_traversal()`.
+
+Usage:
+    python -m benchmarks.ordered_map_range_bench [n]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from itertools import islice
+
+from Data_Structures.avl_tree import AVLTree
+from Data_Structures.red_black_tree import RedBlackTree
+
+PAGE = 1000
+PAGES = 1000
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def build(cls, n: int):
+    tree = cls()
+    insert = tree.insert
+    for key in range(0, 2 * n, 2):
+        insert(key, key)
+    return tree
+
+
+def keyset_pages(tree) -> int:
+    pages, lo = 0, None
+    while True:
+        page = list(islice(tree.range(lo), PAGE))
+        if not page:
+            return pages
+        pages += 1
+        lo = page[-1][0] + 1
+
+
+def random_pages(tree, n: int, reverse: bool) -> tuple:
+    rng = random.Random(2)
+    entries = 0
+    start = time.perf_counter()
+    for _ in range(PAGES):
+        key = rng.randrange(2 * n)
+        entries += len(list(islice(tree.range(None, key, True) if reverse else tree.range(key), PAGE)))
+    return (time.perf_counter() - start) / PAGES, entries / PAGES
+
+
+def drain(iterator) -> None:
+    for _ in iterator:
+        pass
+
+
+def peak_bytes(fn, *args) -> int:
+    tracemalloc.start()
+    fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main(n: int) -> None:
+    print(f"{n:,} entries, pages of {PAGE:,}")
+    for cls in (AVLTree, RedBlackTree):
+        seconds, tree = timed(build, cls, n)
+        print(f"{cls.__name__}: build {seconds:.1f} s")
+        seconds, pages = timed(keyset_pages, tree)
+        print(f"  keyset paging   {pages:,} pages in {seconds:.2f} s ({seconds / pages * 1e3:.3f} ms per page)")
+        for reverse in (False, True):
+            label = "random desc" if reverse else "random asc"
+            seconds, entries = random_pages(tree, n, reverse)
+            print(f"  {label:15} {seconds * 1e3:.3f} ms per page ({entries:,.0f} entries on average)")
+        seconds, _ = timed(drain, tree.range())
+        print(f"  full scan       {seconds:.2f} s ({n / seconds / 1e6:.2f} M entries/s)")
+        print(f"  full scan peak  {peak_bytes(drain, tree.range()) / 1024:,.1f} KiB")
+        if cls is AVLTree:
+            print(f"  inorder_traversal() list peak {peak_bytes(tree.inorder_traversal) / 2 ** 20:,.1f} MiB")
+        del tree
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 7)
@@ -0,0 +1,87 @@
+"""
+Persistent Hash Map Benchmark
+
+Builds a `PersistentHashMap` of about `size_gb` GB (default 10) of `value_bytes`-byte values (default 1000) with
+`PersistentHashMap.build`, then measures:
+- cold open: opening the file and the first `get_data`, after evicting the file from the page cache
+- random reads: `get_data` on random keys, first cold, then again with the touched pages cached
+- writes: `insert_data` of new keys, with and without `sync`
+
+The page cache is evicted with `posix_fadvise(POSIX_FADV_DONTNEED)`, so no root access is needed. Dirty pages of the
+file are flushed first. The table is written to `directory` (default: the system temp directory) and removed
+afterwards.
+
+Usage:
+    python -m benchmarks.persistent_hash_map_bench [size_gb] [value_bytes] [directory]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from Data_Structures.persistent_hash_map import PersistentHashMap
+
+READS = 100_000
+WRITES = 2000
+
+
+def evict(path: str) -> None:
+    with open(path, "rb") as file:
+        os.fsync(file.fileno())
+        os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def read_rate(table: PersistentHashMap, keys: list) -> float:
+    start = time.perf_counter()
+    for key in keys:
+        table.get_data(key)
+    return len(keys) / (time.perf_counter() - start)
+
+
+def write_rate(table: PersistentHashMap, keys: range, value: bytes) -> float:
+    start = time.perf_counter()
+    for key in keys:
+        table.insert_data(key, value)
+    return len(keys) / (time.perf_counter() - start)
+
+
+def main(size_gb: float, value_bytes: int, directory: str) -> None:
+    n = max(1, int(size_gb * 2 ** 30) // (value_bytes + 64))
+    path = os.path.join(directory, "persistent_hash_map_bench.phm")
+    value = bytes(value_bytes)
+    try:
+        start = time.perf_counter()
+        PersistentHashMap.build(path, ((key, value) for key in range(n))).close()
+        build = time.perf_counter() - start
+        print(f"{n:,} entries, {os.path.getsize(path) / 2 ** 30:.2f} GB file, "
+              f"build {build:.1f} s ({n / build / 1e3:.0f} K entries/s)")
+
+        evict(path)
+        start = time.perf_counter()
+        table = PersistentHashMap(path)
+        table.get_data(n // 2)
+        print(f"cold open + first get_data   {(time.perf_counter() - start) * 1e3:10.2f} ms")
+
+        keys = [random.randrange(n) for _ in range(READS)]
+        table.close()
+        evict(path)
+        table = PersistentHashMap(path)
+        print(f"random get_data, cold        {read_rate(table, keys) / 1e3:10.1f} K reads/s")
+        print(f"random get_data, warm        {read_rate(table, keys) / 1e3:10.1f} K reads/s")
+
+        print(f"insert_data, sync=False      {write_rate(table, range(n, n + WRITES), value) / 1e3:10.1f} K writes/s")
+        table.sync = True
+        rate = write_rate(table, range(n + WRITES, n + 2 * WRITES), value)
+        print(f"insert_data, sync=True       {rate / 1e3:10.1f} K writes/s")
+        table.close()
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 10.0,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 1000,
+         sys.argv[3] if len(sys.argv) > 3 else tempfile.gettempdir())
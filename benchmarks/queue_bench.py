@@ -0,0 +1,91 @@
+"""
+Queue Benchmark
+
+Fills and drains ``Queue`` with n items for n = 1e3 ... 1e7 and reports the cost per operation. With the ring buffer the
+per-op cost stays flat as n grows; the old ``list.pop(0)`` queue is shown for comparison up to 1e5, where it is already
+quadratic.
+
+Usage:
+    python -m benchmarks.queue_bench [max_exponent]   # default 7, i.e. up to 1e7 items
+"""
+
+import sys
+import time
+
+from Data_Structures.queues import Queue
+
+BATCH = 1000
+
+
+def per_op_ns(fill, drain, n: int) -> float:
+    """
+    Times `fill(n)` followed by `drain(n)`.
+
+    Args:
+        fill (callable): Adds n items.
+        drain (callable): Removes n items.
+        n (int): The number of items.
+
+    Returns:
+        float: Nanoseconds per item, counting one enqueue and one dequeue as a single item.
+    """
+    start = time.perf_counter()
+    fill(n)
+    drain(n)
+    return (time.perf_counter() - start) * 1e9 / n
+
+
+def ring_single(n: int) -> float:
+    q = Queue()
+
+    def fill(n):
+        enqueue = q.enqueue
+        for i in range(n):
+            enqueue(i)
+
+    def drain(n):
+        dequeue = q.dequeue
+        for _ in range(n):
+            dequeue()
+
+    return per_op_ns(fill, drain, n)
+
+
+def ring_bulk(n: int) -> float:
+    q = Queue()
+
+    def fill(n):
+        for i in range(0, n, BATCH):
+            q.enqueue_many(range(i, min(i + BATCH, n)))
+
+    def drain(n):
+        while q.dequeue_many(BATCH):
+            pass
+
+    return per_op_ns(fill, drain, n)
+
+
+def list_pop0(n: int) -> float:
+    items = []
+
+    def fill(n):
+        for i in range(n):
+            items.append(i)
+
+    def drain(n):
+        for _ in range(n):
+            items.pop(0)
+
+    return per_op_ns(fill, drain, n)
+
+
+def main(max_exponent: int = 7) -> None:
+    print(f"{'n':>10} {'ring ns/op':>12} {'bulk ns/op':>12} {'list.pop(0) ns/op':>18}")
+    for exponent in range(3, max_exponent + 1):
+        n = 10 ** exponent
+        baseline = f"{list_pop0(n):18.1f}" if exponent <= 5 else f"{'-':>18}"
+        print(f"{n:>10} {ring_single(n):12.1f} {ring_bulk(n):12.1f} {baseline}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 7)
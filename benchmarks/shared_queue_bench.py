@@ -0,0 +1,97 @@
+"""
+SharedCircularQueue Benchmark
+
+Sends n small records ("qd": an int64 id and a float64 value) from the main process to a consumer process and reports
+records/sec for:
+1. `multiprocessing.Queue`, one pickled tuple per put (the baseline).
+2. `SharedCircularQueue`, one `put` per record.
+3. `SharedCircularQueue`, `put_many` in batches, with the consumer reading whole contiguous batches via `peek_batch`.
+
+The consumer sums the ids so every record is really read, and the sum is checked against the expected value.
+
+Usage:
+    python -m benchmarks.shared_queue_bench [n]   # default 1000000 records
+"""
+
+import multiprocessing as mp
+import struct
+import sys
+import time
+
+from Data_Structures.queues import SharedCircularQueue
+
+FMT = "qd"
+SLOTS = 1 << 16
+BATCH = 4096
+
+
+def mp_queue_consumer(q, result):
+    total = 0
+    for record in iter(q.get, None):
+        total += record[0]
+    result.put(total)
+
+
+def shared_consumer(q, n, result):
+    records = struct.Struct(FMT)
+    total = count = 0
+    while count < n:
+        view = q.peek_batch(BATCH)
+        k = len(view) // q.record_size
+        if k == 0:
+            time.sleep(0)
+            continue
+        for record in records.iter_unpack(view):
+            total += record[0]
+        view.release()
+        q.release(k)
+        count += k
+    q.close()
+    result.put(total)
+
+
+def bench_mp_queue(n: int) -> float:
+    q, result = mp.Queue(), mp.Queue()
+    consumer = mp.Process(target=mp_queue_consumer, args=(q, result))
+    consumer.start()
+    start = time.perf_counter()
+    for i in range(n):
+        q.put((i, 0.5))
+    q.put(None)
+    total = result.get()
+    elapsed = time.perf_counter() - start
+    consumer.join()
+    assert total == n * (n - 1) // 2
+    return n / elapsed
+
+
+def bench_shared(n: int, batched: bool) -> float:
+    q, result = SharedCircularQueue(SLOTS, FMT), mp.Queue()
+    consumer = mp.Process(target=shared_consumer, args=(q, n, result))
+    consumer.start()
+    start = time.perf_counter()
+    if batched:
+        for i in range(0, n, BATCH):
+            q.put_many((j, 0.5) for j in range(i, min(i + BATCH, n)))
+    else:
+        put = q.put
+        for i in range(n):
+            put(i, 0.5)
+    total = result.get()
+    elapsed = time.perf_counter() - start
+    consumer.join()
+    q.close()
+    q.unlink()
+    assert total == n * (n - 1) // 2
+    return n / elapsed
+
+
+def main(n: int) -> None:
+    print(f"{n} records of format {FMT!r}")
+    print(f"multiprocessing.Queue (put per record): {bench_mp_queue(n):12,.0f} records/s")
+    print(f"SharedCircularQueue (put per record):   {bench_shared(n, False):12,.0f} records/s")
+    print(f"SharedCircularQueue (put_many batches): {bench_shared(n, True):12,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,52 @@
+"""
+Spill-to-Disk Benchmark
+
+Pushes n payloads of `payload` bytes through SpillQueue and SpillStack (fill completely, then drain completely) and reports
+throughput for every tenth of the run, so stalls from spilling or reloading show up as dips. Peak RSS is reported at the
+end. To reproduce a 10x-RAM workload, pick n * payload to be about ten times the machine's memory, e.g.
+`python -m benchmarks.spill_bench 40000000 4096` on a 16 GB machine.
+
+Usage:
+    python -m benchmarks.spill_bench [n] [payload] [segment_size]   # default 200000 x 1024 B, 16384 items per segment
+"""
+
+import resource
+import sys
+import time
+
+from Data_Structures.spill import SpillQueue, SpillStack
+
+
+def report(label: str, add, remove, n: int, payload: bytes) -> None:
+    """
+    Fills with `add` and drains with `remove`, printing items/sec for each tenth of each phase.
+    """
+    for phase, op in (("fill", lambda: add(bytearray(payload))), ("drain", remove)):  # a distinct object per item
+        rates = []
+        step = max(1, n // 10)
+        for start in range(0, n, step):
+            count = min(step, n - start)
+            begin = time.perf_counter()
+            for _ in range(count):
+                op()
+            rates.append(count / (time.perf_counter() - begin))
+        print(f"{label} {phase:>5}: " + " ".join(f"{rate / 1000:7.0f}k" for rate in rates) + "  items/s per tenth")
+
+
+def main(n: int, size: int, segment_size: int) -> None:
+    payload = b"x" * size
+    print(f"{n} items x {size} B = {n * size / 2 ** 20:.0f} MiB, segment_size {segment_size}")
+    with SpillQueue(segment_size) as queue:
+        report("SpillQueue", queue.enqueue, queue.dequeue, n, payload)
+        print(f"SpillQueue stats: {queue.stats()}")
+    with SpillStack(segment_size) as stack:
+        report("SpillStack", stack.push, stack.pop, n, payload)
+        print(f"SpillStack stats: {stack.stats()}")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+    print(f"peak RSS: {peak:.0f} MiB (hot segments bound memory to about "
+          f"{2 * segment_size * size / 2 ** 20:.0f} MiB of payload)")
+
+
+if __name__ == "__main__":
+    args = [int(float(a)) for a in sys.argv[1:]]
+    main(*(args + [200000, 1024, 16384][len(args):]))
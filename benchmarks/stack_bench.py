@@ -0,0 +1,86 @@
+"""
+Stack Benchmark
+
+Compares the list-backed `Stack` with the array-backed `TypedStack` at n items (default 1e7):
+1. Memory held by the stack after pushing n distinct int64 values, measured with tracemalloc.
+2. Push and pop throughput, one item at a time.
+3. Bulk `push_many`/`pop_many` throughput for TypedStack, in slices of BATCH items.
+
+Usage:
+    python -m benchmarks.stack_bench [n]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from Data_Structures.stack import Stack, TypedStack
+
+BATCH = 10000
+OFFSET = 1 << 20  # keep values outside CPython's small-int cache so the list really boxes each one
+
+
+def memory_bytes(make, n: int) -> int:
+    """
+    Returns the bytes still allocated after building a stack of n items with `make`.
+    """
+    tracemalloc.start()
+    stack = make(n)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del stack
+    return used
+
+
+def fill_list(n: int) -> Stack:
+    stack = Stack()
+    for i in range(OFFSET, OFFSET + n):
+        stack.push(i)
+    return stack
+
+
+def fill_typed(n: int) -> TypedStack:
+    stack = TypedStack("q")
+    stack.push_many(range(OFFSET, OFFSET + n))
+    return stack
+
+
+def rate(fn, n: int) -> float:
+    start = time.perf_counter()
+    fn(n)
+    return n / (time.perf_counter() - start)
+
+
+def push_pop(make_stack):
+    def run(n):
+        stack = make_stack()
+        push, pop = stack.push, stack.pop
+        for i in range(n):
+            push(i)
+        for _ in range(n):
+            pop()
+    return run
+
+
+def bulk_typed(n: int) -> None:
+    stack = TypedStack("q")
+    for start in range(0, n, BATCH):
+        stack.push_many(range(start, min(start + BATCH, n)))
+    while stack.size():
+        stack.pop_many(min(BATCH, stack.size()))
+
+
+def main(n: int) -> None:
+    print(f"{n} int64 items")
+    list_mem, typed_mem = memory_bytes(fill_list, n), memory_bytes(fill_typed, n)
+    print(f"memory    Stack: {list_mem / n:6.1f} B/item   TypedStack: {typed_mem / n:6.1f} B/item   "
+          f"ratio {list_mem / typed_mem:.1f}x")
+    print(f"push+pop  Stack: {rate(push_pop(Stack), n):12,.0f} items/s")
+    print(f"push+pop  TypedStack: {rate(push_pop(TypedStack), n):12,.0f} items/s")
+    print(f"push+pop  TypedStack(min/max): "
+          f"{rate(push_pop(lambda: TypedStack('q', True, True)), n):12,.0f} items/s")
+    print(f"bulk      TypedStack push_many/pop_many: {rate(bulk_typed, n):12,.0f} items/s")
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 7)
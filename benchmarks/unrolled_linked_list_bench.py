@@ -0,0 +1,71 @@
+"""
+Unrolled Linked List Benchmark
+
+Compares `UnrolledLinkedList` (several chunk sizes) with the node-per-element `SinglyLinkedList` on an n-element list
+(default 1e6):
+1. Full iteration (the SLL walks its nodes, the unrolled list uses `__iter__`).
+2. `search` for a missing value (a full scan).
+3. Positional inserts at random positions. The SLL walks to the node before the position and calls `insertAfter`;
+   the unrolled list calls `insert`. Only INSERTS inserts are timed because both are O(n) per call for the SLL.
+
+Usage:
+    python -m benchmarks.unrolled_linked_list_bench [n]
+"""
+
+import random
+import sys
+import time
+
+from Data_Structures.linked_list import SinglyLinkedList, UnrolledLinkedList
+
+CHUNK_SIZES = (16, 64, 256)
+INSERTS = 200
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def walk_nodes(lst: SinglyLinkedList) -> None:
+    node = lst.head
+    while node is not None:
+        node = node.next
+
+
+def consume(lst: UnrolledLinkedList) -> None:
+    for _ in lst:
+        pass
+
+
+def sll_inserts(lst: SinglyLinkedList, positions: list) -> None:
+    for position in positions:
+        node = lst.head
+        for _ in range(position):
+            node = node.next
+        lst.insertAfter(node, -1)
+
+
+def ull_inserts(lst: UnrolledLinkedList, positions: list) -> None:
+    for position in positions:
+        lst.insert(position + 1, -1)
+
+
+def main(n: int) -> None:
+    rng = random.Random(1)
+    positions = [rng.randrange(n) for _ in range(INSERTS)]
+    print(f"{n} elements, {INSERTS} positional inserts")
+    print(f"{'list':24} {'iterate':>10} {'search':>10} {'inserts':>10}")
+    sll = SinglyLinkedList.from_iterable(range(n))
+    print(f"{'SinglyLinkedList':24} {timed(walk_nodes, sll):10.3f} {timed(sll.search, -2):10.3f} "
+          f"{timed(sll_inserts, sll, positions):10.3f} s")
+    del sll
+    for chunk_size in CHUNK_SIZES:
+        ull = UnrolledLinkedList.from_iterable(range(n), chunk_size)
+        print(f"{f'Unrolled (B={chunk_size})':24} {timed(consume, ull):10.3f} {timed(ull.search, -2):10.3f} "
+              f"{timed(ull_inserts, ull, positions):10.3f} s")
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 6)
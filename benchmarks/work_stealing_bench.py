@@ -0,0 +1,65 @@
+"""
+Work-Stealing Scheduler Benchmark
+
+Sorts n random floats with `parallel_mergesort` and `parallel_quicksort` on a WorkStealingScheduler, once with leaves run
+on the worker threads and once with leaves sent to a process pool, and compares against the sequential sorts. Per-worker
+steal and idle counters are printed for every parallel run.
+
+With threads only, the GIL keeps the sorts from running faster than sequentially; the counters still show how work spreads
+across workers. With a process pool the leaves really run in parallel.
+
+Usage:
+    python -m benchmarks.work_stealing_bench [n] [workers]   # default 1000000 elements, one worker per CPU
+"""
+
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from Data_Structures.work_stealing import WorkStealingScheduler
+from Search_Sort.merge_sort import mergesort, parallel_mergesort
+from Search_Sort.quick_sort import parallel_quicksort, quicksort
+
+CUTOFF = 1 << 14
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def print_stats(scheduler: WorkStealingScheduler) -> None:
+    for index, stats in enumerate(scheduler.stats()):
+        print(f"    worker {index}: executed={stats['executed']:<5} steals={stats['steals']:<4} "
+              f"stolen={stats['stolen']:<5} failed_steals={stats['failed_steals']:<6} "
+              f"parks={stats['parks']:<4} idle={stats['idle_time']:.3f}s")
+
+
+def main(n: int, workers: int) -> None:
+    data = [random.random() for _ in range(n)]
+    expected = sorted(data)
+    print(f"{n} random floats, {workers} workers, leaf cutoff {CUTOFF}")
+
+    array = data[:]
+    print(f"mergesort (sequential):               {timed(mergesort, array):7.3f} s")
+    array = data[:]
+    print(f"quicksort (sequential):               {timed(quicksort, array, 0, n - 1):7.3f} s")
+
+    for label, executor in (("threads", None), ("process pool", ProcessPoolExecutor(workers))):
+        for name, sort in (("parallel_mergesort", parallel_mergesort), ("parallel_quicksort", parallel_quicksort)):
+            with WorkStealingScheduler(workers, executor) as scheduler:
+                array = data[:]
+                elapsed = timed(sort, array, scheduler, CUTOFF)
+                assert array == expected
+                print(f"{name} ({label}):{' ' * (17 - len(label))}{elapsed:7.3f} s")
+                print_stats(scheduler)
+        if executor is not None:
+            executor.shutdown()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1)
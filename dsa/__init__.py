@@ -0,0 +1,124 @@
+"""
+DSA Package
+
+Single import point for every data structure and algorithm in this repository.
+
+Attributes are resolved lazily (PEP 562): ``from dsa import SegmentTree`` imports only
+``Data_Structures.segment_tree`` and nothing else. Importing ``dsa`` itself only builds the name table below,
+so worker processes pay for exactly the modules they use.
+
+Usage:
+    from dsa import SegmentTree, quicksort
+
+    tree = SegmentTree([1, 3, 5, 7])
+
+Import-time budget:
+    ``python benchmarks/import_time.py`` measures ``import dsa`` and one lazy attribute in a fresh interpreter
+    and fails if either exceeds its budget.
+"""
+
+from importlib import import_module
+
+# public name -> (module path, attribute name in that module)
+_EXPORTS = {
+    # Data_Structures
+    "Stack": ("Data_Structures.stack", "Stack"),
+    "TypedStack": ("Data_Structures.stack", "TypedStack"),
+    "Queue": ("Data_Structures.queues", "Queue"),
+    "Deque": ("Data_Structures.queues", "Deque"),
+    "CircularQueue": ("Data_Structures.queues", "CircularQueue"),
+    "BlockingCircularQueue": ("Data_Structures.queues", "BlockingCircularQueue"),
+    "SharedCircularQueue": ("Data_Structures.queues", "SharedCircularQueue"),
+    "AsyncQueue": ("Data_Structures.async_queues", "AsyncQueue"),
+    "AsyncDeque": ("Data_Structures.async_queues", "AsyncDeque"),
+    "SpillStack": ("Data_Structures.spill", "SpillStack"),
+    "SpillQueue": ("Data_Structures.spill", "SpillQueue"),
+    "WorkStealingScheduler": ("Data_Structures.work_stealing", "WorkStealingScheduler"),
+    "SinglyLinkedList": ("Data_Structures.linked_list", "SinglyLinkedList"),
+    "DoublyLinkedList": ("Data_Structures.linked_list", "DoublyLinkedList"),
+    "UnrolledLinkedList": ("Data_Structures.linked_list", "UnrolledLinkedList"),
+    "LRUCache": ("Data_Structures.cache", "LRUCache"),
+    "LFUCache": ("Data_Structures.cache", "LFUCache"),
+    "TTLCache": ("Data_Structures.cache", "TTLCache"),
+    "memoize": ("Data_Structures.cache", "memoize"),
+    "SimpleHashMap": ("Data_Structures.hash_tables", "SimpleHashMap"),
+    "OpenAddressingTable": ("Data_Structures.hash_tables", "OpenAddressingTable"),
+    "Int64HashMap": ("Data_Structures.int_hash_map", "Int64HashMap"),
+    "ConcurrentHashMap": ("Data_Structures.concurrent_hash_map", "ConcurrentHashMap"),
+    "PersistentHashMap": ("Data_Structures.persistent_hash_map", "PersistentHashMap"),
+    "HashRing": ("Data_Structures.consistent_hash", "HashRing"),
+    "ShardedHashMap": ("Data_Structures.consistent_hash", "ShardedHashMap"),
+    "Heap": ("Data_Structures.binary_heap", "Heap"),
+    "MaxHeap": ("Data_Structures.binary_heap", "MaxHeap"),
+    "MinHeap": ("Data_Structures.binary_heap", "MinHeap"),
+    "IndexedHeap": ("Data_Structures.binary_heap", "IndexedHeap"),
+    "RadixHeap": ("Data_Structures.binary_heap", "RadixHeap"),
+    "BinarySearchTree": ("Data_Structures.binary_search_tree", "BinarySearchTree"),
+    "AVLTree": ("Data_Structures.avl_tree", "AVLTree"),
+    "Graph": ("Data_Structures.graph", "Graph"),
+    "Trie": ("Data_Structures.tries", "Trie"),
+    "SegmentTree": ("Data_Structures.segment_tree", "SegmentTree"),
+    "Fenwick_Tree": ("Data_Structures.fenwick_tree", "Fenwick_Tree"),
+    "SuffixArray": ("Data_Structures.suffix_array", "SuffixArray"),
+    "RedBlackTree": ("Data_Structures.red_black_tree", "RedBlackTree"),
+    "FibonacciHeap": ("Data_Structures.fibonacci_heap", "FibonacciHeap"),
+    "SkipList": ("Data_Structures.skip_list", "SkipList"),
+    "BTree": ("Data_Structures.b_tree", "BTree"),
+    "BPlusTree": ("Data_Structures.b_plus_tree", "BPlusTree"),
+    "BloomFilter": ("Data_Structures.bloom_filters", "BloomFilter"),
+    # Search_Sort
+    "bubblesort": ("Search_Sort.bubble_sort", "bubblesort"),
+    "selectionsort": ("Search_Sort.selection_sort", "selectionsort"),
+    "insertionsort": ("Search_Sort.insertion_sort", "insertionsort"),
+    "quicksort": ("Search_Sort.quick_sort", "quicksort"),
+    "parallel_quicksort": ("Search_Sort.quick_sort", "parallel_quicksort"),
+    "mergesort": ("Search_Sort.merge_sort", "mergesort"),
+    "parallel_mergesort": ("Search_Sort.merge_sort", "parallel_mergesort"),
+    "heapsort": ("Search_Sort.heap_sort", "heapsort"),
+    "shellsort": ("Search_Sort.shell_sort", "shellsort"),
+    "countingsort": ("Search_Sort.counting_sort", "countingsort"),
+    "radixsort": ("Search_Sort.radix_sort", "radixsort"),
+    "bucketSort": ("Search_Sort.bucket_sort", "bucketSort"),
+    "linear_search": ("Search_Sort.linear_search", "linear_search"),
+    "binary_search": ("Search_Sort.binary_search", "binary_search"),
+    "left_binary_search": ("Search_Sort.binary_search", "left_binary_search"),
+    # Misc_Algo
+    "knapsack01": ("Misc_Algo.Dynamic_Programming.knapsack_01", "knapsack01"),
+    "matrix_multiplication_chain": ("Misc_Algo.Dynamic_Programming.matrix_chain_multiplication",
+                                    "matrix_multiplication_chain"),
+    "MultiStageGraph": ("Misc_Algo.Dynamic_Programming.multistage_graph", "Graph"),
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """
+    Imports the module that defines `name` on first access and caches the attribute on this package.
+
+    Args:
+        name (str): The public name being looked up.
+
+    Returns:
+        The class or function exported under `name`.
+
+    Raises:
+        AttributeError: If `name` is not exported by the package.
+    """
+    try:
+        module_path, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_path), attr)
+    globals()[name] = value  # later lookups skip __getattr__ entirely
+    return value
+
+
+def __dir__() -> list:
+    """
+    Lists the public names, including those not imported yet.
+
+    Returns:
+        list: The sorted public names of the package.
+    """
+    return sorted(set(globals()) | set(__all__))